@@ -0,0 +1,27 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+from benchmarks.cases import BenchmarkCase, READERS, WAYPOINTS
+from benchmarks.fixtures import FixtureCache
+from benchmarks.harness import BenchmarkRunner, PROFILES, build_matrix
+from benchmarks.baseline import save_baseline, load_baseline, compare
+
+# ---------------------------------------------------------------
+# PACKAGE MANAGEMENT
+# ---------------------------------------------------------------
+
+__all__ = [
+    "BenchmarkCase",
+    "READERS",
+    "WAYPOINTS",
+    "FixtureCache",
+    "BenchmarkRunner",
+    "PROFILES",
+    "build_matrix",
+    "save_baseline",
+    "load_baseline",
+    "compare",
+]
+__version__ = "0.0.1"
+__author__ = "HysingerDev"
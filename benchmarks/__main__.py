@@ -0,0 +1,87 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import sys
+
+from benchmarks.harness import BenchmarkRunner, PROFILES, build_matrix
+from benchmarks.fixtures import FixtureCache
+from benchmarks.baseline import save_baseline, load_baseline, compare
+
+from typing import List, Dict, Any, Optional
+from argparse import ArgumentParser
+from pathlib import Path
+
+# ---------------------------------------------------------------
+# COMMAND LINE -> python -m benchmarks
+# ---------------------------------------------------------------
+
+def _integers(value: str) -> List[int]:
+    return [int(float(item)) for item in value.split(",") if item]     # Accepts '1e6' style scales.
+
+def _names(value: str) -> List[str]:
+    return [item for item in value.split(",") if item]
+
+def _parser() -> ArgumentParser:
+    parser = ArgumentParser(prog="python -m benchmarks", description="Windjam reader and waypoint benchmarks.")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="quick")
+    parser.add_argument("--rows", type=_integers, help="Comma-separated row counts (Overrides the profile).")
+    parser.add_argument("--columns", type=_integers, help="Comma-separated column counts (Overrides the profile).")
+    parser.add_argument("--readers", type=_names, help="Comma-separated Reader names (Default: all).")
+    parser.add_argument("--waypoints", type=_names, help="Comma-separated Waypoint names (Default: all).")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fixtures", type=Path, default=Path(__file__).parent / ".fixtures")
+    parser.add_argument("--max-fixture-gib", type=float, default=20.0)
+    parser.add_argument("--output", type=Path, help="Write the results as a JSON baseline.")
+    parser.add_argument("--compare", type=Path, help="Baseline to compare against -> Exit code 1 on regressions.")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    return parser
+
+def _format(result: Dict[str, Any]) -> str:
+    if result["status"] != "ok":
+        return f"{result['id']:<48} {result['status'].upper()}: {result['reason']}"
+
+    rss = f"{result['peak_rss'] / 1024**2:>9.1f} MiB" if result["peak_rss"] is not None else "      n/a    "
+    return (
+        f"{result['id']:<48} {result['rows_per_s']:>14,.0f} rows/s "
+        f"{result['bytes_per_s'] / 1024**2:>10.1f} MiB/s {rss}"
+    )
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arguments = _parser().parse_args(argv)
+    rows, columns = PROFILES[arguments.profile]
+
+    cases = build_matrix(
+        rows=arguments.rows or rows,
+        columns=arguments.columns or columns,
+        readers=arguments.readers,
+        waypoints=arguments.waypoints,
+    )
+    runner = BenchmarkRunner(
+        FixtureCache(arguments.fixtures, seed=arguments.seed),
+        repeat=arguments.repeat,
+        max_fixture_bytes=int(arguments.max_fixture_gib * 1024**3),
+    )
+
+    results = runner.run_all(cases, callback=lambda result: print(_format(result), flush=True))
+
+    if arguments.output is not None:
+        print(f"Baseline written to: {save_baseline(arguments.output, results, arguments.profile)}")
+
+    if arguments.compare is not None:
+        regressions = compare(results, load_baseline(arguments.compare), tolerance=arguments.tolerance)
+
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression['id']} {regression['metric']}: "
+                f"{regression['baseline']:,.0f} -> {regression['current']:,.0f}"
+            )
+
+        if regressions:
+            return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
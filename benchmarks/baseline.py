@@ -0,0 +1,96 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import json
+import platform
+import polars as pl
+import numpy as np
+
+from typing import List, Dict, Any, Union
+from datetime import datetime, timezone
+from subprocess import run, DEVNULL
+from pathlib import Path
+from os import PathLike, cpu_count, replace
+
+# ---------------------------------------------------------------
+# BASELINE FILES
+# ---------------------------------------------------------------
+
+BASELINE_VERSION = 1
+
+def environment() -> Dict[str, Any]:
+    # Baselines are only comparable on like-for-like machines -> Recorded so a reviewer can tell.
+    try:
+        commit = run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, stdin=DEVNULL).stdout.strip() or None
+    except OSError:
+        commit = None
+
+    return {
+        "python": platform.python_version(),
+        "polars": pl.__version__,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": cpu_count(),
+        "commit": commit,
+    }
+
+def save_baseline(path: Union[str, PathLike], results: List[Dict[str, Any]], profile: str) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "version": BASELINE_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "profile": profile,
+        "environment": environment(),
+        "results": results,
+    }
+
+    partial = path.with_name(f"{path.name}.partial")
+    partial.write_text(json.dumps(document, indent=2))
+    replace(partial, path)
+
+    return path
+
+def load_baseline(path: Union[str, PathLike]) -> Dict[str, Any]:
+    document = json.loads(Path(path).read_text())
+
+    if document.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Baseline: {path} has version {document.get('version')} - Expected {BASELINE_VERSION}")
+
+    return document
+
+def compare(
+    results: List[Dict[str, Any]],
+    baseline: Dict[str, Any],
+    tolerance: float = 0.25,
+) -> List[Dict[str, Any]]:
+    previous = {result["id"]: result for result in baseline["results"] if result.get("status") == "ok"}
+    regressions = []
+
+    for result in results:
+        reference = previous.get(result["id"])
+
+        if result.get("status") != "ok" or reference is None:
+            continue    # Nothing comparable -> New, skipped or failed cases are reported by the run itself.
+
+        if result["rows_per_s"] and reference["rows_per_s"] \
+                and result["rows_per_s"] < reference["rows_per_s"] * (1.0 - tolerance):
+            regressions.append({
+                "id": result["id"],
+                "metric": "rows_per_s",
+                "baseline": reference["rows_per_s"],
+                "current": result["rows_per_s"],
+            })
+
+        if result["peak_rss"] and reference["peak_rss"] \
+                and result["peak_rss"] > reference["peak_rss"] * (1.0 + tolerance):
+            regressions.append({
+                "id": result["id"],
+                "metric": "peak_rss",
+                "baseline": reference["peak_rss"],
+                "current": result["peak_rss"],
+            })
+
+    return regressions
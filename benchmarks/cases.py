@@ -0,0 +1,161 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import polars as pl
+
+from src.reader import CSVReader, JSONReader, ParquetReader, FeatherReader, ExcelReader
+from src.waypoints import (
+    NullPoint,
+    MetricsPoint,
+    TypingPoint,
+    IntervalPoint,
+    OutlierPoint,
+    CardinalPoint,
+    DuplicatePoint,
+    SchemaPoint,
+)
+from src.pipeline import Conduit
+from benchmarks.fixtures import fixture_schema
+
+from typing import Dict, Any, Callable, Optional
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from sys import platform
+
+try:
+    from resource import getrusage, RUSAGE_SELF
+except ImportError:     # Windows -> Peak RSS is reported as unavailable.
+    getrusage = None
+
+# ---------------------------------------------------------------
+# CASE REGISTRIES
+# ---------------------------------------------------------------
+
+# Reader -> Fixture format it is measured against.
+READERS: Dict[str, tuple] = {
+    "CSVReader": (CSVReader, "csv"),
+    "JSONReader": (JSONReader, "ndjson"),
+    "ParquetReader": (ParquetReader, "parquet"),
+    "FeatherReader": (FeatherReader, "ipc"),
+    "ExcelReader": (ExcelReader, "xlsx"),
+}
+
+def _numeric(schema: pl.Schema) -> list:
+    return [column for column, dtype in schema.items() if dtype.is_numeric()]
+
+def _strings(schema: pl.Schema) -> list:
+    return [column for column, dtype in schema.items() if dtype == pl.String]
+
+# Waypoint -> Factory configuring it against every applicable column of the fixture Schema.
+WAYPOINTS: Dict[str, Callable[[pl.Schema], Any]] = {
+    "NullPoint": lambda schema: NullPoint(columns=list(schema), max_ratio=0.05),
+    "MetricsPoint": lambda schema: MetricsPoint(columns=_numeric(schema)),
+    "TypingPoint": lambda schema: TypingPoint(dtypes=dict(schema)),
+    "IntervalPoint": lambda schema: IntervalPoint(bounds={column: (0, 1_000_000) for column in _numeric(schema)}),
+    "OutlierPoint": lambda schema: OutlierPoint(columns=_numeric(schema)),
+    "CardinalPoint": lambda schema: CardinalPoint(bounds={column: (None, 1_000) for column in _strings(schema)}),
+    "DuplicatePoint": lambda schema: DuplicatePoint(columns=list(schema)),
+    "SchemaPoint": lambda schema: SchemaPoint(expected=schema),
+}
+
+WAYPOINT_FORMAT = "parquet"     # Cheapest decode -> Waypoint timings are not dominated by parsing.
+
+# ---------------------------------------------------------------
+# BENCHMARKCASE CLASS
+# ---------------------------------------------------------------
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkCase:
+    kind: str           # "reader" | "waypoint"
+    target: str         # Reader or Waypoint class name.
+    rows: int
+    columns: int
+
+    @property
+    def id(self) -> str:
+        return f"{self.kind}/{self.target}/{self.rows}x{self.columns}"
+
+    @property
+    def format(self) -> str:
+        return READERS[self.target][1] if self.kind == "reader" else WAYPOINT_FORMAT
+
+# ---------------------------------------------------------------
+# CASE EXECUTION -> RUNS INSIDE A FRESH WORKER PROCESS
+# ---------------------------------------------------------------
+
+def run_case(case: BenchmarkCase, path: str) -> Dict[str, Any]:
+    schema = fixture_schema(case.columns)
+    rss_before = _peak_rss()
+
+    if case.kind == "reader":
+        timings = _reader_timings(case, schema, path)
+        elapsed = timings["scan_s"]
+    else:
+        timings = _waypoint_timings(case, schema, path)
+        elapsed = timings["execute_s"]
+
+    size = Path(path).stat().st_size
+    peak = _peak_rss()
+
+    return {
+        **timings,
+        "bytes": size,
+        "rows_per_s": case.rows / elapsed if elapsed else None,
+        "bytes_per_s": size / elapsed if elapsed else None,
+        "rss_before": rss_before,
+        "peak_rss": peak,
+    }
+
+def _reader_timings(case: BenchmarkCase, schema: pl.Schema, path: str) -> Dict[str, float]:
+    reader = READERS[case.target][0](schema=schema)
+
+    start = perf_counter()
+    reader.build()
+    build_s = perf_counter() - start
+
+    start = perf_counter()
+    result = reader.execute(path)
+    execute_s = perf_counter() - start
+
+    # Null counts touch every value of every column -> A full decode without materializing the table.
+    start = perf_counter()
+    result.frame.select(pl.all().null_count()).collect(engine="streaming")
+    scan_s = perf_counter() - start
+
+    return {"build_s": build_s, "execute_s": execute_s, "scan_s": scan_s}
+
+def _waypoint_timings(case: BenchmarkCase, schema: pl.Schema, path: str) -> Dict[str, float]:
+    conduit = Conduit(
+        reader=ParquetReader(schema=schema),
+        waypoints=[WAYPOINTS[case.target](schema)],
+        severity="error",   # No fail-fast pre-check -> Dirty fixtures would otherwise abort on the sample stage.
+        verbosity=0,
+    )
+
+    start = perf_counter()
+    conduit.build()
+    build_s = perf_counter() - start
+
+    start = perf_counter()
+    conduit.execute(path)
+    execute_s = perf_counter() - start
+
+    return {"build_s": build_s, "execute_s": execute_s}
+
+def _peak_rss() -> Optional[int]:
+    # Linux -> VmHWM is tracked per address space, whereas 'ru_maxrss' survives exec and would report the parent's peak.
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    if getrusage is None:
+        return None
+
+    peak = getrusage(RUSAGE_SELF).ru_maxrss
+    return peak if platform == "darwin" else peak * 1024    # macOS reports bytes, other platforms KiB.
@@ -0,0 +1,105 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import polars as pl
+
+from src.factory import SyntheticFactory
+from src.typings import ColumnSpec
+
+from typing import Dict, Union
+from pathlib import Path
+from os import PathLike, replace
+
+# ---------------------------------------------------------------
+# FIXTURE LAYOUT
+# ---------------------------------------------------------------
+
+DTYPES = (pl.Int64, pl.Float64, pl.String, pl.Date, pl.Boolean)    # Cycled across the generated columns.
+
+EXTENSIONS = {
+    "csv": "csv",
+    "ndjson": "ndjson",
+    "parquet": "parquet",
+    "ipc": "arrow",
+    "xlsx": "xlsx",
+}
+
+# Rough on-disk bytes per value -> Lets oversized fixtures be skipped before a single row is generated.
+BYTES_PER_VALUE = {
+    "csv": 10,
+    "ndjson": 20,
+    "parquet": 5,
+    "ipc": 9,
+    "xlsx": 12,
+}
+
+def fixture_schema(columns: int) -> pl.Schema:
+    return pl.Schema({
+        f"c{index:04d}_{str(DTYPES[index % len(DTYPES)]).lower()}": DTYPES[index % len(DTYPES)]
+        for index in range(columns)
+    })
+
+def fixture_specs(schema: pl.Schema) -> Dict[str, ColumnSpec]:
+    # Realistic dirt -> Every waypoint has something to find, so no predicate short-circuits on clean data.
+    specs = {}
+
+    for column, dtype in schema.items():
+        if dtype == pl.Float64:
+            specs[column] = ColumnSpec(null_rate=0.01, outlier_rate=0.001)
+        elif dtype == pl.String:
+            specs[column] = ColumnSpec(null_rate=0.01, cardinality=1_000)
+        elif dtype == pl.Date:
+            specs[column] = ColumnSpec(gap_rate=0.05)
+        else:
+            specs[column] = ColumnSpec(null_rate=0.01)
+
+    return specs
+
+def estimate_bytes(format: str, rows: int, columns: int) -> int:
+    return rows * columns * BYTES_PER_VALUE[format]
+
+# ---------------------------------------------------------------
+# FIXTURECACHE CLASS
+# ---------------------------------------------------------------
+
+class FixtureCache():
+
+    __slots__ = (
+        "directory",
+        "seed",
+        "duplicate_rate",
+    )
+
+    def __init__(self, directory: Union[str, PathLike], seed: int = 0, duplicate_rate: float = 0.001):
+        self.directory: Path        = Path(directory)
+        self.seed: int              = seed
+        self.duplicate_rate: float  = duplicate_rate
+
+    def path(self, format: str, rows: int, columns: int) -> Path:
+        return self.directory / f"{format}-{rows}x{columns}-s{self.seed}.{EXTENSIONS[format]}"
+
+    def ensure(self, format: str, rows: int, columns: int) -> Path:
+        path = self.path(format, rows, columns)
+
+        if path.exists():
+            return path     # Fixtures are deterministic per (format, rows, columns, seed) -> Reused across runs.
+
+        schema = fixture_schema(columns)
+        factory = SyntheticFactory(
+            schema,
+            rows=rows,
+            specs=fixture_specs(schema),
+            duplicate_rate=self.duplicate_rate,
+            seed=self.seed,
+        )
+
+        # Written under a temporary name first -> An interrupted run never leaves a truncated fixture behind.
+        partial = path.with_name(f"{path.name}.partial")
+        factory.write(partial, format=format)
+        replace(partial, path)
+
+        return path
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} - Directory={self.directory}, Seed={self.seed}>"
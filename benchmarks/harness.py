@@ -0,0 +1,139 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+from benchmarks.cases import BenchmarkCase, READERS, WAYPOINTS, run_case
+from benchmarks.fixtures import FixtureCache, estimate_bytes
+from src.factory import BaseFactory
+from src.waypoints import __all__ as exported_waypoints
+
+from typing import List, Dict, Any, Iterable, Optional
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from itertools import product
+
+# ---------------------------------------------------------------
+# BENCHMARK MATRIX
+# ---------------------------------------------------------------
+
+ROWS = (10_000, 1_000_000, 100_000_000)
+COLUMNS = (10, 100, 1_000)
+
+PROFILES = {
+    "quick": ((10_000,), (10,)),
+    "default": ((10_000, 1_000_000), (10, 100)),
+    "full": (ROWS, COLUMNS),
+}
+
+def build_matrix(
+    rows: Iterable[int],
+    columns: Iterable[int],
+    readers: Optional[Iterable[str]] = None,
+    waypoints: Optional[Iterable[str]] = None,
+) -> List[BenchmarkCase]:
+    # Every exported Waypoint must have a case -> A new Waypoint cannot silently go unbenchmarked.
+    uncovered = set(exported_waypoints) - {"BasePoint"} - set(WAYPOINTS)
+
+    if uncovered:
+        raise ValueError(f"Waypoints without a benchmark case: {sorted(uncovered)}")
+
+    readers = list(READERS) if readers is None else list(readers)
+    waypoints = list(WAYPOINTS) if waypoints is None else list(waypoints)
+    unknown = (set(readers) - set(READERS)) | (set(waypoints) - set(WAYPOINTS))
+
+    if unknown:
+        raise ValueError(f"No benchmark case registered for: {sorted(unknown)}")
+
+    return [
+        *(BenchmarkCase("reader", target, n, m) for target, n, m in product(readers, rows, columns)),
+        *(BenchmarkCase("waypoint", target, n, m) for target, n, m in product(waypoints, rows, columns)),
+    ]
+
+# ---------------------------------------------------------------
+# BENCHMARKRUNNER CLASS
+# ---------------------------------------------------------------
+
+class BenchmarkRunner():
+
+    __slots__ = (
+        "fixtures",
+        "repeat",
+        "max_fixture_bytes",
+    )
+
+    def __init__(self, fixtures: FixtureCache, repeat: int = 3, max_fixture_bytes: int = 20 * 1024**3):
+        if repeat < 1:
+            raise ValueError(f"Repeat must be a positive integer - Recieved {repeat}")
+
+        self.fixtures: FixtureCache     = fixtures
+        self.repeat: int                = repeat
+        self.max_fixture_bytes: int     = max_fixture_bytes
+
+    def run(self, case: BenchmarkCase) -> Dict[str, Any]:
+        record = {"id": case.id, "kind": case.kind, "target": case.target, "rows": case.rows, "columns": case.columns}
+        reason = self._skip_reason(case)
+
+        if reason is not None:
+            return {**record, "status": "skipped", "reason": reason}
+
+        try:
+            # Fixtures are generated in this process -> Their memory never counts towards a case's peak RSS.
+            path = str(self.fixtures.ensure(case.format, case.rows, case.columns))
+        except Exception as err:
+            return {**record, "status": "skipped", "reason": f"Fixture unavailable - {type(err).__name__}: {self._first_line(err)}"}
+
+        try:
+            samples = [self._isolated(case, path) for _ in range(self.repeat)]
+        except Exception as err:
+            return {**record, "status": "error", "reason": f"{type(err).__name__}: {self._first_line(err)}"}
+
+        return {**record, "status": "ok", **self._aggregate(samples)}
+
+    def run_all(self, cases: Iterable[BenchmarkCase], callback=None) -> List[Dict[str, Any]]:
+        results = []
+
+        for case in cases:
+            result = self.run(case)
+            results.append(result)
+
+            if callback is not None:
+                callback(result)
+
+        return results
+
+# Internal Helper-methods --------------------------------------------------
+
+    def _skip_reason(self, case: BenchmarkCase) -> Optional[str]:
+        if case.format == "xlsx" and case.rows > BaseFactory.EXCEL_MAX_ROWS:
+            return f"Excel worksheets hold at most {BaseFactory.EXCEL_MAX_ROWS} rows"
+
+        estimate = estimate_bytes(case.format, case.rows, case.columns)
+        if estimate > self.max_fixture_bytes and not self.fixtures.path(case.format, case.rows, case.columns).exists():
+            return f"Fixture estimated at {estimate / 1024**3:.1f} GiB exceeds the {self.max_fixture_bytes / 1024**3:.1f} GiB limit"
+
+        return None
+
+    @staticmethod
+    def _isolated(case: BenchmarkCase, path: str) -> Dict[str, Any]:
+        # One spawned process per sample -> Peak RSS is per case and no warm caches leak between samples.
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+            return executor.submit(run_case, case, path).result()
+
+    @staticmethod
+    def _first_line(err: Exception) -> str:
+        return next(iter(str(err).splitlines()), "")
+
+    @staticmethod
+    def _aggregate(samples: List[Dict[str, Any]]) -> Dict[str, Any]:
+        # Best-of-N timings (Least scheduler noise), worst-of-N memory (What a worker must be sized for).
+        best = min(samples, key=lambda sample: sample.get("scan_s", sample["execute_s"]))
+        peaks = [sample["peak_rss"] for sample in samples if sample["peak_rss"] is not None]
+
+        return {
+            **best,
+            "peak_rss": max(peaks) if peaks else None,
+            "samples": len(samples),
+        }
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} - Fixtures={self.fixtures.directory}, Repeat={self.repeat}>"
@@ -0,0 +1,158 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import sys
+import json
+
+from benchmarks.baseline import save_baseline, load_baseline
+
+from typing import List, Dict, Any, Optional
+from argparse import ArgumentParser
+from subprocess import run
+from pathlib import Path
+
+# ---------------------------------------------------------------
+# IMPORT TARGETS -> (Statement, may it import Polars?)
+# ---------------------------------------------------------------
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Package imports must stay light -> Only touching an export may pull in Polars and the classes behind it.
+TARGETS = (
+    ("import src", False),
+    ("import src.errors", False),
+    ("import src.utility", False),
+    ("import src.typings", False),
+    ("import src.reader", False),
+    ("import src.waypoints", False),
+    ("import src.pipeline", False),
+    ("import src.sink", False),
+    ("import src.storage", False),
+    ("import src.telemetry", False),
+    ("from src.utility import get_class_logger", False),
+    ("from src.errors import ConduitError", False),
+    ("import polars", True),
+    ("from src.reader import CSVReader", True),
+    ("from src.waypoints import NullPoint", True),
+    ("from src.pipeline import Conduit", True),
+)
+
+_PROBE = (
+    "import sys, json, time\n"
+    "before = len(sys.modules)\n"
+    "start = time.perf_counter()\n"
+    "{statement}\n"
+    "elapsed = time.perf_counter() - start\n"
+    "print(json.dumps([elapsed, len(sys.modules) - before, 'polars' in sys.modules]))\n"
+)
+
+# ---------------------------------------------------------------
+# MEASUREMENT
+# ---------------------------------------------------------------
+
+def measure_import(statement: str, repeat: int = 5) -> Dict[str, Any]:
+    # A fresh interpreter per sample -> Nothing is ever served from an earlier import.
+    samples = []
+
+    for _ in range(repeat):
+        completed = run(
+            [sys.executable, "-c", _PROBE.format(statement=statement)],
+            capture_output=True, text=True, cwd=ROOT,
+        )
+
+        if completed.returncode != 0:
+            raise RuntimeError(next(iter(completed.stderr.strip().splitlines()[-1:]), "Import failed"))
+
+        samples.append(json.loads(completed.stdout))
+
+    elapsed, modules, polars = min(samples)
+    return {"import_s": elapsed, "modules": modules, "polars": polars, "samples": repeat}
+
+def measure_imports(repeat: int = 5) -> List[Dict[str, Any]]:
+    results = []
+
+    for statement, heavy in TARGETS:
+        record = {"id": statement, "kind": "import", "allows_polars": heavy}
+
+        try:
+            record.update(status="ok", **measure_import(statement, repeat))
+        except Exception as err:
+            record.update(status="error", reason=f"{type(err).__name__}: {err}")
+
+        results.append(record)
+
+    return results
+
+def compare_imports(
+    results: List[Dict[str, Any]],
+    baseline: Optional[Dict[str, Any]] = None,
+    tolerance: float = 0.5,
+    slack: float = 0.005,
+) -> List[Dict[str, Any]]:
+    regressions = []
+    previous = {result["id"]: result for result in (baseline or {}).get("results", []) if result.get("status") == "ok"}
+
+    for result in results:
+        if result.get("status") != "ok":
+            regressions.append({"id": result["id"], "metric": "status", "baseline": None, "current": result["reason"]})
+            continue
+
+        # Deterministic check -> Holds on any machine, with or without a baseline.
+        if result["polars"] and not result["allows_polars"]:
+            regressions.append({"id": result["id"], "metric": "polars", "baseline": False, "current": True})
+
+        reference = previous.get(result["id"])
+        if reference is None:
+            continue
+
+        # Millisecond-scale timings are noisy -> A regression must exceed both the ratio and an absolute slack.
+        limit = max(reference["import_s"] * (1.0 + tolerance), reference["import_s"] + slack)
+        if result["import_s"] > limit:
+            regressions.append({
+                "id": result["id"],
+                "metric": "import_s",
+                "baseline": reference["import_s"],
+                "current": result["import_s"],
+            })
+
+    return regressions
+
+# ---------------------------------------------------------------
+# COMMAND LINE -> python -m benchmarks.imports
+# ---------------------------------------------------------------
+
+def _parser() -> ArgumentParser:
+    parser = ArgumentParser(prog="python -m benchmarks.imports", description="Windjam cold import benchmarks.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="Write the results as a JSON baseline.")
+    parser.add_argument("--compare", type=Path, help="Baseline to compare against -> Exit code 1 on regressions.")
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    parser.add_argument("--slack-ms", type=float, default=5.0)
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arguments = _parser().parse_args(argv)
+    results = measure_imports(repeat=arguments.repeat)
+
+    for result in results:
+        if result["status"] != "ok":
+            print(f"{result['id']:<48} ERROR: {result['reason']}")
+            continue
+
+        print(f"{result['id']:<48} {result['import_s'] * 1e3:>9.1f} ms {result['modules']:>6} module(s)"
+              f"{'  (polars)' if result['polars'] else ''}")
+
+    if arguments.output is not None:
+        print(f"Baseline written to: {save_baseline(arguments.output, results, 'imports')}")
+
+    baseline = load_baseline(arguments.compare) if arguments.compare is not None else None
+    regressions = compare_imports(results, baseline, arguments.tolerance, arguments.slack_ms / 1e3)
+
+    for regression in regressions:
+        print(f"REGRESSION {regression['id']} {regression['metric']}: {regression['baseline']} -> {regression['current']}")
+
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
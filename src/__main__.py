@@ -0,0 +1,14 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import sys
+
+from src.cli import main
+
+# ---------------------------------------------------------------
+# COMMAND LINE -> python -m src (Console script: windjam = "src.cli:main")
+# ---------------------------------------------------------------
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,38 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+from src.utility.lazy_loader import lazy_package
+
+from typing import TYPE_CHECKING
+
+# Type checkers see the eager imports -> At runtime each export is imported on first access.
+if TYPE_CHECKING:
+    from src.cli.main import main, run, create_conduit, expand_inputs
+    from src.cli.definition import load_definition, build_components, resolve_dtype
+
+# ---------------------------------------------------------------
+# PACKAGE MANAGEMENT
+# ---------------------------------------------------------------
+
+__all__ = [
+    "main",
+    "run",
+    "create_conduit",
+    "expand_inputs",
+    "load_definition",
+    "build_components",
+    "resolve_dtype",
+]
+
+lazy_package(__name__, {
+    "main": "src.cli.main",
+    "run": "src.cli.main",
+    "create_conduit": "src.cli.main",
+    "expand_inputs": "src.cli.main",
+    "load_definition": "src.cli.definition",
+    "build_components": "src.cli.definition",
+    "resolve_dtype": "src.cli.definition",
+})
+__version__ = "0.0.1"
+__author__ = "HysingerDev"
\ No newline at end of file
@@ -0,0 +1,83 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import json
+import tomllib
+import runpy
+import polars as pl
+
+from src.utility import retrieve_definition_format
+
+from typing import TYPE_CHECKING, List, Union, Dict, Any, Tuple
+from importlib import import_module
+from pathlib import Path
+from os import PathLike
+
+if TYPE_CHECKING:
+    from src.reader import BaseReader
+    from src.waypoints import BasePoint
+
+# ---------------------------------------------------------------
+# CONDUIT DEFINITION FILES
+# ---------------------------------------------------------------
+
+DTYPE_OPTIONS = ("schema", "dtypes", "expected", "schema_overrides")   # Options whose values map columns -> DataTypes.
+
+def load_definition(path: Union[str, PathLike]) -> Dict[str, Any]:
+    path = Path(path)
+    format = retrieve_definition_format(input=path.suffix.lstrip(".") or "json")
+
+    if format == "json":
+        definition = json.loads(path.read_text())
+    elif format == "toml":
+        definition = tomllib.loads(path.read_text())
+    else:
+        # Python definitions expose a 'definition' dict -> Components may already be instances.
+        definition = runpy.run_path(str(path)).get("definition")
+
+    if not isinstance(definition, dict) or "reader" not in definition:
+        raise ValueError(f"Definition: {path} must describe a mapping with at least a 'reader' entry.")
+
+    return definition
+
+def build_components(definition: Dict[str, Any]) -> Tuple["BaseReader", List["BasePoint"], Dict[str, Any]]:
+    # Everything besides 'reader' and 'waypoints' is handed to the Conduit constructor as-is.
+    options = {key: value for key, value in definition.items() if key not in ("reader", "waypoints")}
+    reader = _component("src.reader", definition["reader"])
+    waypoints = [_component("src.waypoints", spec) for spec in definition.get("waypoints", [])]
+
+    return reader, waypoints, options
+
+def resolve_dtype(value: Union[str, pl.DataType]) -> pl.DataType:
+    if not isinstance(value, str):
+        return value
+
+    dtype = getattr(pl, value, None)
+
+    if not (isinstance(dtype, pl.DataType) or (isinstance(dtype, type) and issubclass(dtype, pl.DataType))):
+        raise ValueError(f"DataType: {value} not supported!\n Expected a Polars DataType name such as 'Int64' or 'String'")
+
+    return dtype
+
+# ---------------------------------------------------------------
+# INTERNAL HELPERS
+# ---------------------------------------------------------------
+
+def _component(package: str, spec: Union[Dict[str, Any], Any]) -> Any:
+    if not isinstance(spec, dict):
+        return spec     # Already an instance (Python definitions).
+
+    options = dict(spec)
+    name = options.pop("type", None)
+    exports = import_module(package)
+
+    # Lazy package exports -> Only the Reader/Waypoints named in the definition are ever imported.
+    if name not in getattr(exports, "__all__", ()):
+        raise ValueError(f"Component: {name} not supported!\n List of supported components: {exports.__all__}")
+
+    for key in DTYPE_OPTIONS:
+        if isinstance(options.get(key), dict):
+            options[key] = {column: resolve_dtype(dtype) for column, dtype in options[key].items()}
+
+    return getattr(exports, name)(**options)
@@ -0,0 +1,190 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import sys
+import json
+
+from src.cli.definition import load_definition, build_components
+from src.pipeline import BaseConduit, ThreadConduit, ProcessConduit
+from src.utility import retrieve_conduit_severity
+from src.errors import ConduitError, ReaderError, WaypointError
+
+from typing import List, Optional, Dict, Any, Iterable, TextIO
+from argparse import ArgumentParser
+from glob import glob
+from os import cpu_count
+from pathlib import Path
+from time import perf_counter
+
+# ---------------------------------------------------------------
+# EXIT CODES
+# ---------------------------------------------------------------
+
+EXIT_PASSED = 0         # Every input passed (Or failures stayed below 'error' severity).
+EXIT_FAILED = 1         # At least one input failed a Conduit of 'error' severity or above.
+EXIT_ERROR = 2          # Unusable definition/arguments, or an input could not be processed at all.
+
+# ---------------------------------------------------------------
+# COMMAND LINE -> windjam (python -m src)
+# ---------------------------------------------------------------
+
+def _parser() -> ArgumentParser:
+    parser = ArgumentParser(prog="windjam", description="Validate many inputs against one Conduit definition.")
+    parser.add_argument("definition", type=Path, help="Conduit definition file (.json, .toml or .py).")
+    parser.add_argument("inputs", nargs="+", help="Input paths or globs ('**' recurses). '-' reads paths from stdin.")
+    parser.add_argument("-j", "--jobs", type=int, default=cpu_count() or 1, help="Inputs validated concurrently.")
+    parser.add_argument("--executor", choices=("thread", "process"), default="thread")
+    parser.add_argument("--chunksize", type=int, help="Inputs per worker task (Process executor only).")
+    parser.add_argument("--severity", help="Overrides the definition's severity.")
+    parser.add_argument("--metadata", action="store_true", help="Include full result metadata in every record.")
+    parser.add_argument("--keep-going", action="store_true", help="Do not stop early on 'fatal' failures.")
+    parser.add_argument("-v", "--verbose", action="count", default=0, help="Log to stderr (Repeat for more).")
+    return parser
+
+def expand_inputs(patterns: Iterable[str], stdin: Optional[TextIO] = None) -> List[str]:
+    seen: Dict[str, None] = {}   # Ordered and de-duplicated -> Overlapping globs validate a file once.
+
+    for pattern in patterns:
+        if pattern == "-":
+            matches = [line.strip() for line in (stdin or sys.stdin) if line.strip()]
+        elif any(character in pattern for character in "*?["):
+            matches = sorted(path for path in glob(pattern, recursive=True) if Path(path).is_file())
+        else:
+            matches = [pattern]     # Literal paths pass through -> A missing file is reported as an error record.
+
+        for match in matches:
+            seen.setdefault(match, None)
+
+    return list(seen)
+
+def create_conduit(definition: Dict[str, Any], executor: str, jobs: int, verbosity: int = 0, **overrides) -> BaseConduit:
+    reader, waypoints, options = build_components(definition)
+    options = {"verbosity": verbosity, **options, **{key: value for key, value in overrides.items() if value is not None}}
+
+    if executor == "process":
+        return ProcessConduit(reader=reader, waypoints=waypoints, max_workers=jobs, **options)
+
+    return ThreadConduit(reader=reader, waypoints=waypoints, max_workers=jobs, **options)
+
+def run(
+    definition: Dict[str, Any],
+    inputs: List[str],
+    executor: str = "thread",
+    jobs: int = 1,
+    chunksize: Optional[int] = None,
+    severity: Optional[str] = None,
+    metadata: bool = False,
+    keep_going: bool = False,
+    verbosity: int = 0,
+    stdout: Optional[TextIO] = None,
+    stderr: Optional[TextIO] = None,
+) -> int:
+    stdout, stderr = stdout or sys.stdout, stderr or sys.stderr
+
+    if not inputs:
+        print("windjam: No inputs matched.", file=stderr)
+        return EXIT_ERROR
+
+    overrides = {"severity": severity, **({"chunksize": chunksize} if executor == "process" else {})}
+    conduit = create_conduit(definition, executor, jobs, verbosity, **overrides)
+
+    blocking = conduit.severity >= retrieve_conduit_severity(input="error")
+    fail_fast = conduit.severity >= retrieve_conduit_severity(input="fatal") and not keep_going
+    counts = {"passed": 0, "failed": 0, "errors": 0}
+    start_time = perf_counter()
+
+    # Built once against the first readable input -> Every input reuses the same Schema and compiled plans.
+    remaining = _build(conduit, inputs, metadata, counts, stdout)
+
+    results = conduit.execute_unordered(remaining, return_exceptions=True) if remaining else iter(())
+
+    try:
+        for index, result in results:
+            if _emit(_record(remaining[index], result, metadata), counts, stdout) and fail_fast:
+                break
+    finally:
+        if remaining:
+            results.close()     # Cancels every input not yet started.
+
+        if executor == "process":
+            conduit.close()
+
+    skipped = len(inputs) - sum(counts.values())
+    print(
+        f"windjam: {len(inputs)} input(s) - {counts['passed']} passed, {counts['failed']} failed, "
+        f"{counts['errors']} error(s){f', {skipped} skipped (fatal)' if skipped else ''} "
+        f"in {perf_counter() - start_time:.2f}s",
+        file=stderr,
+    )
+
+    if counts["errors"]:
+        return EXIT_ERROR
+
+    return EXIT_FAILED if counts["failed"] and blocking else EXIT_PASSED
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arguments = _parser().parse_args(argv)
+
+    if arguments.jobs < 1:
+        print(f"windjam: Jobs must be a positive integer - Recieved {arguments.jobs}", file=sys.stderr)
+        return EXIT_ERROR
+
+    try:
+        return run(
+            definition=load_definition(arguments.definition),
+            inputs=expand_inputs(arguments.inputs),
+            executor=arguments.executor,
+            jobs=arguments.jobs,
+            chunksize=arguments.chunksize,
+            severity=arguments.severity,
+            metadata=arguments.metadata,
+            keep_going=arguments.keep_going,
+            verbosity=arguments.verbose,
+        )
+    except (OSError, ValueError, TypeError, ConduitError, ReaderError, WaypointError) as err:
+        # Definition or build failures -> Nothing was validated, so no record is written.
+        print(f"windjam: {type(err).__name__}: {err}", file=sys.stderr)
+        return EXIT_ERROR
+
+# ---------------------------------------------------------------
+# INTERNAL HELPERS
+# ---------------------------------------------------------------
+
+def _build(conduit: BaseConduit, inputs: List[str], metadata: bool, counts: Dict[str, int], stdout: TextIO) -> List[str]:
+    for position, input in enumerate(inputs):
+        try:
+            conduit.build(input=input)
+            return inputs[position:]
+        except ConduitError:
+            raise   # Definition failures -> No input can be validated.
+        except Exception as err:
+            # Unreadable input -> Reported as its error record; the Schema is resolved from the next one.
+            _emit(_record(input, err, metadata), counts, stdout)
+
+    return []
+
+def _emit(record: Dict[str, Any], counts: Dict[str, int], stdout: TextIO) -> bool:
+    counts["errors" if "error" in record else "passed" if record["passed"] else "failed"] += 1
+
+    stdout.write(json.dumps(record, default=str) + "\n")
+    stdout.flush()      # One line per input as it completes -> Consumers can act before the run ends.
+
+    return record["passed"] is False
+
+def _record(source: str, result: Any, metadata: bool) -> Dict[str, Any]:
+    if isinstance(result, Exception):
+        return {"source": source, "passed": None, "error": f"{type(result).__name__}: {result}"}
+
+    record = {
+        "source": result.source,
+        "passed": result.passed,
+        "exec_time": result.metadata.get("exec_time"),
+        "aborted": result.metadata.get("aborted"),
+        "waypoints": result.waypoints,
+    }
+
+    if metadata:
+        record["metadata"] = result.metadata
+
+    return record
@@ -3,7 +3,9 @@
 # ---------------------------------------------------------------
 
 from src.errors.exceptions import (ReaderError, ReaderConfigError, ReaderBuildError,
-    ReaderExecutionError, ReaderSchemaError, WaypointError, WaypointBuildError
+    ReaderExecutionError, ReaderSchemaError, WaypointError, WaypointBuildError, SinkError, SinkConfigError,
+    FactoryError, FactoryConfigError,
+    ConduitError, ConduitBuildError, ConduitExecutionError, ConduitTimeoutError, ConduitMemoryError
 )
 
 # ---------------------------------------------------------------
@@ -17,7 +19,16 @@ __all__ = [
     "ReaderExecutionError",
     "ReaderSchemaError",
     "WaypointError",
-    "WaypointBuildError"
+    "WaypointBuildError",
+    "SinkError",
+    "SinkConfigError",
+    "FactoryError",
+    "FactoryConfigError",
+    "ConduitError",
+    "ConduitBuildError",
+    "ConduitExecutionError",
+    "ConduitTimeoutError",
+    "ConduitMemoryError"
 ]
 __version__ = "0.0.1"
 __author__ = "HysingerDev"
\ No newline at end of file
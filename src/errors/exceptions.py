@@ -62,3 +62,63 @@ class WaypointBuildError(WaypointError):
         full_message = f"{self.GENERAL_MESSAGE}: {source_name} | {message}"
 
         super().__init__(full_message)
+
+# Sink-related Exceptions --------------------------------------------------
+
+class SinkError(Exception):
+    "Base Exception/Error (Template) for Sink-related Errors"
+    pass
+
+class SinkConfigError(SinkError):
+    GENERAL_MESSAGE = "Configuration Error"
+
+    def __init__(self, source: str, message: str):
+        source_name = source.__class__.__name__
+        full_message = f"{self.GENERAL_MESSAGE}: {source_name} | {message}"
+
+        super().__init__(full_message)
+
+# Factory-related Exceptions --------------------------------------------------
+
+class FactoryError(Exception):
+    "Base Exception/Error (Template) for Factory-related Errors"
+    pass
+
+class FactoryConfigError(FactoryError):
+    GENERAL_MESSAGE = "Configuration Error"
+
+    def __init__(self, source: str, message: str):
+        source_name = source.__class__.__name__
+        full_message = f"{self.GENERAL_MESSAGE}: {source_name} | {message}"
+
+        super().__init__(full_message)
+
+# Conduit-related Exceptions --------------------------------------------------
+
+class ConduitError(Exception):
+    "Base Exception/Error (Template) for Conduit-related Errors"
+    pass
+
+class ConduitBuildError(ConduitError):
+    GENERAL_MESSAGE = "Build/Construction Error"
+
+    def __init__(self, source: str, message: str):
+        source_name = source.__class__.__name__
+        full_message = f"{self.GENERAL_MESSAGE}: {source_name} | {message}"
+
+        super().__init__(full_message)
+
+class ConduitExecutionError(ConduitError):
+    GENERAL_MESSAGE = "Execution Error"
+
+    def __init__(self, source: str, message: str):
+        source_name = source.__class__.__name__
+        full_message = f"{self.GENERAL_MESSAGE}: {source_name} | {message}"
+
+        super().__init__(full_message)
+
+class ConduitTimeoutError(ConduitExecutionError):
+    GENERAL_MESSAGE = "Timeout Error"
+
+class ConduitMemoryError(ConduitExecutionError):
+    GENERAL_MESSAGE = "Memory Budget Error"
@@ -2,10 +2,19 @@
 # IMPORTS
 # ---------------------------------------------------------------
 
-from typing import List, Union, Optional, Tuple, Any
+import polars as pl
+
+from src.utility import retrieve_factory_format, get_class_logger, ClassLogger
+from src.errors import FactoryConfigError
+
+from typing import List, Union, Optional, Tuple, Any, Iterator
 from abc import ABC, abstractmethod
-from dataclasses import field
-from datetime import datetime, timezone
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from importlib.util import find_spec
+from os import PathLike, cpu_count
+from pathlib import Path
+from polars.io.plugins import register_io_source
 
 # ---------------------------------------------------------------
 # BASEFACTORY CLASS -> ABSTRACTION
@@ -13,14 +22,138 @@ from datetime import datetime, timezone
 
 class BaseFactory(ABC):
 
-    __slots__ = ()
+    __slots__ = (
+        "rows",
+        "chunk_rows",
+        "seed",
+        "max_workers",
+        "_logger",
+    )
+
+    EXCEL_MAX_ROWS = 1_048_575     # Worksheet limit (Minus the header row).
+
+    def __init__(
+        self,
+        rows: int,
+        chunk_rows: int = 1_000_000,
+        seed: int = 0,
+        max_workers: Optional[int] = None,
+        verbosity: int = 0,
+    ):
+        if rows < 0 or chunk_rows < 1:
+            raise FactoryConfigError(self, f"Rows must be >= 0 and chunk rows >= 1 - Recieved {rows} / {chunk_rows}")
+
+        self.rows: int                  = rows
+        self.chunk_rows: int            = chunk_rows
+        self.seed: int                  = seed
+        self.max_workers: int           = max_workers or cpu_count() or 1
+        self._logger: ClassLogger       = get_class_logger(self.__class__, verbosity)
 
-    def __init__(self):
-        super().__init__(),
+# Class Properties --------------------------------------------------
 
+    @property
+    def chunks(self) -> int:
+        return -(-self.rows // self.chunk_rows)
+
+# Abstract Class Methods --------------------------------------------------
+
+    @property
     @abstractmethod
-    def produce() -> Any:
+    def schema(self) -> pl.Schema:
         pass
-    
+
+    # Generate rows [offset, offset + rows) of chunk 'index' -> Must depend on (seed, index) only, never on call order.
+    @abstractmethod
+    def _generate(self, index: int, offset: int, rows: int) -> pl.DataFrame:
+        pass
+
+# Core Class Operations --------------------------------------------------
+
+    def produce(self) -> pl.DataFrame:
+        return pl.concat(list(self.iter_chunks()), rechunk=False) if self.rows else self.schema.to_frame()
+
+    def iter_chunks(self) -> Iterator[pl.DataFrame]:
+        # Bounded look-ahead -> At most '2 x max_workers' chunks are in flight, regardless of the total row count.
+        window = 2 * self.max_workers
+        pending: deque[Future] = deque()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for index in range(self.chunks):
+                pending.append(executor.submit(self._generate_chunk, index))
+
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+
+    def to_lazyframe(self) -> pl.LazyFrame:
+        # Chunks are produced on demand by the sink/collect that consumes the LazyFrame -> Nothing is buffered upfront.
+        return register_io_source(self._source, schema=self.schema)
+
+    def write(self, path: Union[str, PathLike], format: Optional[str] = None) -> Path:
+        path = Path(path)
+        format = retrieve_factory_format(input=format or path.suffix.lstrip("."))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        lf = self.to_lazyframe()
+
+        if format == "parquet":
+            lf.sink_parquet(path)
+        elif format == "ipc":
+            lf.sink_ipc(path)
+        elif format == "csv":
+            lf.sink_csv(path)
+        elif format == "ndjson":
+            lf.sink_ndjson(path)
+        else:
+            if self.rows > self.EXCEL_MAX_ROWS:
+                raise FactoryConfigError(self, f"Excel worksheets hold at most {self.EXCEL_MAX_ROWS} rows - Recieved {self.rows}")
+
+            # Checked before any row is generated -> Polars only imports its Excel writer on use.
+            if find_spec("xlsxwriter") is None:
+                raise FactoryConfigError(self, "Excel output requires the 'xlsxwriter' package (pip install xlsxwriter)!")
+
+            self.produce().write_excel(path)    # No streaming writer for xlsx -> Bounded by the worksheet limit.
+
+        self._logger.info("Factory: %s wrote %s row(s) to: %s", type(self).__name__, self.rows, path)
+        return path
+
+# Internal Helper-methods --------------------------------------------------
+
+    def _generate_chunk(self, index: int) -> pl.DataFrame:
+        offset = index * self.chunk_rows
+        return self._generate(index, offset, min(self.chunk_rows, self.rows - offset))
+
+    def _source(
+        self,
+        with_columns: Optional[List[str]],
+        predicate: Optional[pl.Expr],
+        n_rows: Optional[int],
+        batch_size: Optional[int],
+    ) -> Iterator[pl.DataFrame]:
+        remaining = n_rows if n_rows is not None else self.rows
+
+        for chunk in self.iter_chunks():
+            if remaining <= 0:
+                break
+
+            chunk = chunk.head(remaining)
+            remaining -= chunk.height
+
+            if with_columns is not None:
+                chunk = chunk.select(with_columns)
+            if predicate is not None:
+                chunk = chunk.filter(predicate)
+
+            yield chunk
+
+# Class __dunder__-methods --------------------------------------------------
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} - Rows={self.rows}, Chunks={self.chunks}, Seed={self.seed}>"
+
 class Other:
-    pass # Placeholder class -> Type checking.
\ No newline at end of file
+    pass # Placeholder class -> Type checking.
@@ -0,0 +1,168 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import numpy as np
+import polars as pl
+
+from src.factory.BaseFactory import BaseFactory
+from src.typings import ColumnSpec
+from src.errors import FactoryConfigError
+
+from typing import Optional, Dict, Any, Tuple
+from datetime import date, datetime
+
+# ---------------------------------------------------------------
+# SYNTHETICFACTORY CLASS -> EXTENSION OF BASEFACTORY
+# ---------------------------------------------------------------
+
+class SyntheticFactory(BaseFactory):
+
+    __slots__ = (
+        "_schema",
+        "specs",
+        "duplicate_rate",
+        "_days",
+    )
+
+    DEFAULT_BOUNDS = {
+        "numeric": (0, 1_000_000),
+        "temporal": (date(2020, 1, 1), date(2024, 12, 31)),
+    }
+    DEFAULT_CARDINALITY = 1_000     # String/Categorical columns without an explicit cardinality.
+
+    def __init__(
+        self,
+        schema: Dict[str, pl.DataType] | pl.Schema,
+        rows: int,
+        specs: Optional[Dict[str, ColumnSpec]] = None,
+        duplicate_rate: float = 0.0,
+        chunk_rows: int = 1_000_000,
+        seed: int = 0,
+        max_workers: Optional[int] = None,
+        verbosity: int = 0,
+    ):
+        super().__init__(rows=rows, chunk_rows=chunk_rows, seed=seed, max_workers=max_workers, verbosity=verbosity)
+
+        self._schema: pl.Schema             = pl.Schema(schema)
+        self.specs: Dict[str, ColumnSpec]   = {column: (specs or {}).get(column, ColumnSpec()) for column in self._schema}
+        self.duplicate_rate: float          = duplicate_rate
+        self._days: Dict[str, np.ndarray]   = {}
+
+        unknown = set(specs or {}) - set(self._schema)
+
+        if unknown:
+            raise FactoryConfigError(self, f"Specs reference columns missing from the Schema: {sorted(unknown)}")
+
+        if not 0.0 <= duplicate_rate < 1.0:
+            raise FactoryConfigError(self, f"Duplicate rate must be within [0, 1) - Recieved {duplicate_rate}")
+
+        for position, (column, dtype) in enumerate(self._schema.items()):
+            if dtype.is_temporal():
+                # Gap days are fixed per column (Not per chunk) -> Every chunk skips the same dates.
+                self._days[column] = self._valid_days(column, position)
+
+    @property
+    def schema(self) -> pl.Schema:
+        return self._schema
+
+# Internal Helper-methods --------------------------------------------------
+
+    def _generate(self, index: int, offset: int, rows: int) -> pl.DataFrame:
+        columns = []
+
+        for position, (column, dtype) in enumerate(self._schema.items()):
+            # Independent stream per (Seed, chunk, column) -> Deterministic under any thread scheduling.
+            rng = np.random.default_rng([self.seed, index, position])
+            spec = self.specs[column]
+            series = self._values(column, dtype, spec, rng, rows)
+
+            if spec.null_rate > 0:
+                series = series.scatter(np.flatnonzero(rng.random(rows) < spec.null_rate), None)
+
+            columns.append(series)
+
+        frame = pl.DataFrame(columns)
+
+        if self.duplicate_rate > 0 and rows > 1:
+            # Duplicated rows copy an earlier row of the same chunk -> Vectorized gather, no Python loop.
+            rng = np.random.default_rng([self.seed, index, len(self._schema)])
+            positions = np.arange(rows)
+            duplicates = np.flatnonzero(rng.random(rows) < self.duplicate_rate)
+            duplicates = duplicates[duplicates > 0]
+            positions[duplicates] = rng.integers(0, duplicates)
+            frame = frame[positions]
+
+        return frame
+
+    def _values(self, column: str, dtype: pl.DataType, spec: ColumnSpec, rng: np.random.Generator, rows: int) -> pl.Series:
+        if dtype == pl.Boolean:
+            return pl.Series(column, rng.random(rows) < 0.5, dtype=dtype)
+
+        if dtype.is_numeric():
+            return pl.Series(column, self._numeric(dtype, spec, rng, rows)).cast(dtype)
+
+        if dtype.is_temporal():
+            days = self._days[column][rng.integers(0, len(self._days[column]), rows)]   # Days since the epoch.
+
+            if dtype == pl.Date:
+                return pl.Series(column, days.astype(np.int32)).cast(pl.Date)
+
+            # Datetimes also draw a time of day -> Microseconds since the epoch, then the target unit/zone.
+            micros = (days * 86_400 + rng.integers(0, 86_400, rows)) * 1_000_000
+            return pl.Series(column, micros).cast(pl.Datetime("us")).cast(dtype)
+
+        if isinstance(dtype, pl.Enum):
+            categories = dtype.categories
+            return categories.gather(rng.integers(0, len(categories), rows)).alias(column).cast(dtype)
+
+        if dtype in (pl.String, pl.Categorical):
+            codes = pl.Series(column, rng.integers(0, spec.cardinality or self.DEFAULT_CARDINALITY, rows))
+            labels = pl.select(pl.concat_str([pl.lit(f"{column}_"), codes.cast(pl.String)]).alias(column))
+
+            return labels.to_series().cast(dtype)
+
+        raise FactoryConfigError(self, f"Column: {column} has unsupported data type: {dtype}")
+
+    def _numeric(self, dtype: pl.DataType, spec: ColumnSpec, rng: np.random.Generator, rows: int) -> np.ndarray:
+        low, high = self._bounds(spec, "numeric")
+
+        if dtype.is_integer():
+            # Default bounds never exceed the integer type -> Only explicit outliers saturate at its limits.
+            limits = np.iinfo(str(dtype).lower())
+            low, high = max(low, limits.min), min(high, limits.max)
+
+        if spec.cardinality is not None:
+            # A fixed grid of distinct values spanning [low, high].
+            values = low + (high - low) * (rng.integers(0, spec.cardinality, rows) / max(spec.cardinality - 1, 1))
+        else:
+            values = rng.uniform(low, high, rows)
+
+        if spec.outlier_rate > 0:
+            outliers = rng.random(rows) < spec.outlier_rate
+            values[outliers] = high + spec.outlier_scale * (high - low) * (1 + rng.random(int(outliers.sum())))
+
+        return np.clip(np.round(values), limits.min, limits.max) if dtype.is_integer() else values
+
+    def _valid_days(self, column: str, position: int) -> np.ndarray:
+        spec = self.specs[column]
+        low, high = self._bounds(spec, "temporal")
+        low, high = np.datetime64(self._as_date(low), "D"), np.datetime64(self._as_date(high), "D")
+        days = np.arange(low, high + 1, dtype="datetime64[D]").astype(np.int64)
+
+        if spec.gap_rate > 0:
+            rng = np.random.default_rng([self.seed, 2**32 - 1, position])    # Reserved chunk index -> Own stream.
+            days = days[rng.random(len(days)) >= spec.gap_rate]
+
+        if not len(days):
+            raise FactoryConfigError(self, f"Column: {column} has no dates left after applying gap rate {spec.gap_rate}")
+
+        return days
+
+    def _bounds(self, spec: ColumnSpec, kind: str) -> Tuple[Any, Any]:
+        low, high = self.DEFAULT_BOUNDS[kind]
+        return (low if spec.low is None else spec.low, high if spec.high is None else spec.high)
+
+    @staticmethod
+    def _as_date(value: Any) -> date:
+        return value.date() if isinstance(value, datetime) else value
@@ -2,12 +2,27 @@
 # IMPORTS
 # ---------------------------------------------------------------
 
+from src.utility.lazy_loader import lazy_package
+
+from typing import TYPE_CHECKING
+
+# Type checkers see the eager imports -> At runtime each export is imported on first access.
+if TYPE_CHECKING:
+    from src.factory.BaseFactory import BaseFactory
+    from src.factory.SyntheticFactory import SyntheticFactory
+
 # ---------------------------------------------------------------
 # PACKAGE MANAGEMENT
 # ---------------------------------------------------------------
 
 __all__ = [
-
+    "BaseFactory",
+    "SyntheticFactory"
 ]
+
+lazy_package(__name__, {
+    "BaseFactory": "src.factory.BaseFactory",
+    "SyntheticFactory": "src.factory.SyntheticFactory",
+})
 __version__ = "0.0.1"
 __author__ = "HysingerDev"
\ No newline at end of file
@@ -2,14 +2,16 @@
 # IMPORTS
 # ---------------------------------------------------------------
 
-import typing
+import asyncio
 
 from src.pipeline.BaseConduit import BaseConduit
+from src.typings import ConduitResult, InputType
+from src.errors import ConduitExecutionError, ConduitTimeoutError, ConduitMemoryError
 
-from typing import List, Union, Optional
-from abc import ABC, abstractmethod
-from dataclasses import field
-from datetime import datetime, timezone
+from typing import List, Union, Optional, Iterable
+from functools import partial
+from pathlib import Path
+from time import perf_counter
 
 # ---------------------------------------------------------------
 # ASYNCHRONOUS CONDUIT CLASS
@@ -17,11 +19,151 @@ from datetime import datetime, timezone
 
 class AsyncConduit(BaseConduit):
 
-    __slots__ = ()
+    __slots__ = (
+        "_concurrency",
+        "_timeout",
+        "_semaphore",
+        "_loop",
+    )
 
-    def __init__(self, reader = None, schema = None, waypoints = ..., factories = ..., verbosity = 1):
-        super().__init__(reader, schema, waypoints, factories, verbosity)
+    def __init__(
+        self,
+        reader = None,
+        schema = None,
+        waypoints = None,
+        factories = None,
+        verbosity = 1,
+        concurrency: int = 8,
+        timeout: Optional[float] = None,
+        **base_kwargs,
+    ):
+        super().__init__(reader, schema, waypoints, factories, verbosity=verbosity, **base_kwargs)
 
-    @typing.Overriede
-    def execute():
-        pass
\ No newline at end of file
+        if concurrency < 1:
+            raise ValueError(f"Concurrency must be a positive integer - Recieved {concurrency}")
+
+        self._concurrency: int                          = concurrency
+        self._timeout: Optional[float]                  = timeout
+        self._semaphore: Optional[asyncio.Semaphore]    = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Class Properties --------------------------------------------------
+
+    @property
+    def concurrency(self) -> int:
+        return self._concurrency
+
+    @property
+    def timeout(self) -> Optional[float]:
+        return self._timeout
+
+# Core Class Operations --------------------------------------------------
+
+    async def execute(self, input: InputType) -> ConduitResult:
+        if self._assert_built():
+            # The Semaphore caps in-flight queries across every caller sharing this Conduit.
+            semaphore = self._acquire_semaphore()
+            await semaphore.acquire()
+            collection: List[asyncio.Future] = []      # Filled by '_run_async' once the worker thread is started.
+
+            try:
+                return await asyncio.wait_for(self._run_async(input, collection), timeout=self._timeout)
+            except asyncio.TimeoutError as err:
+                error_str = f"Input: {self._source_name(input)} exceeded timeout of {self._timeout}s"
+
+                self._logger.error(error_str)
+                raise ConduitTimeoutError(self, error_str) from err
+            finally:
+                # A timed-out query keeps running in its thread -> The slot is only freed once the thread finishes.
+                if collection:
+                    collection[0].add_done_callback(partial(self._release, semaphore))
+                else:
+                    semaphore.release()
+
+    async def execute_many(
+        self,
+        inputs: Iterable[InputType],
+        return_exceptions: bool = False,
+    ) -> List[Union[ConduitResult, Exception]]:
+        if self._assert_built():
+            inputs = list(inputs)
+            results: List[Union[ConduitResult, Exception, None]] = [None] * len(inputs)
+            pending = iter(enumerate(inputs))
+
+            async def worker() -> None:
+                # Workers pull inputs on demand -> At most 'concurrency' tasks exist (Backpressure).
+                for index, input in pending:
+                    try:
+                        results[index] = await self.execute(input)
+                    except Exception as err:
+                        if not return_exceptions:
+                            raise
+                        results[index] = err
+
+            workers = [
+                asyncio.create_task(worker())
+                for _ in range(min(self._concurrency, len(inputs)))
+            ]
+
+            try:
+                await asyncio.gather(*workers)
+            except BaseException:
+                # Cancel the remaining workers on first failure (Or external cancellation).
+                for task in workers:
+                    task.cancel()
+
+                await asyncio.gather(*workers, return_exceptions=True)
+                raise
+
+            return results
+
+# Internal Helper-methods --------------------------------------------------
+
+    def _acquire_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+
+        if self._semaphore is None or self._loop is not loop:
+            # Semaphores are bound to an event loop -> Recreate when reused by a new loop.
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+            self._loop = loop
+
+        return self._semaphore
+
+    @staticmethod
+    def _release(semaphore: asyncio.Semaphore, future: asyncio.Future) -> None:
+        semaphore.release()
+
+        if not future.cancelled():
+            future.exception()      # Abandoned queries may still fail -> Marks the error as retrieved.
+
+    async def _run_async(self, input: InputType, collection: List[asyncio.Future]) -> ConduitResult:
+        start_time = perf_counter()
+
+        ledger = self._open_ledger()
+
+        with self._tracer.span("conduit.execute", conduit=type(self).__name__) as trace:
+            try:
+                # Scan setup can touch file metadata (Or read eagerly, e.g. Excel) and 'pl.collect_all_async' still
+                # plans and drives the query on the calling thread -> The whole collection runs in a worker thread.
+                # 'to_thread' copies the current context -> Spans opened in the worker nest under this run's trace.
+                staged: List[Path] = []
+                collection.append(asyncio.ensure_future(asyncio.to_thread(self._collect, input, ledger, staged)))
+
+                # Shielded -> Cancellation (Or a timeout) abandons the result but never the running thread.
+                result, frames, aborted, sampling = await asyncio.shield(collection[0])
+            except asyncio.CancelledError:
+                # Cancellation drops the pending result -> The query finishes in its worker thread.
+                self._logger.warning("Conduit: %s execution cancelled for: %s", type(self).__name__, self._source_name(input))
+                raise
+            except ConduitMemoryError:
+                self._logger.error("Conduit: %s refused an input exceeding its memory budget.", type(self).__name__)
+                raise
+            except Exception as err:
+                self._logger.error("Conduit: %s execution was unsuccessful.", type(self).__name__)
+                raise ConduitExecutionError(self, f"Input: {self._source_name(input)} failed - {err}") from err
+
+            conduit_result = self._finalize(
+                input, result.metadata, frames, perf_counter() - start_time, aborted, sampling, staged
+            )
+
+        return self._attach_trace(self._attach_memory(conduit_result, ledger), trace)
@@ -2,13 +2,33 @@
 # IMPORTS
 # ---------------------------------------------------------------
 
-from src.utility import retrieve_return_format, retrieve_conduit_severity
+import polars as pl
 
-from typing import List, Union, Optional, Dict, Any
-from collections import OrderedDict
+from src.utility import (retrieve_return_format, retrieve_conduit_severity, get_class_logger, ClassLogger,
+    retrieve_aggregate_expression, retrieve_waypoint_cost, bernoulli_sample, reservoir_sample, block_sample,
+    retrieve_execution_engine, retrieve_aggregate_partition, retrieve_aggregate_sketch, retrieve_memory_policy
+)
+from src.typings import ReaderResult, ConduitResult, ConduitLayout, AggregateRequest, InputType
+from src.errors import ConduitBuildError, ConduitExecutionError, ConduitMemoryError
+from src.reader.BaseReader import BaseReader
+from src.waypoints.BasePoint import BasePoint
+from src.factory.BaseFactory import BaseFactory
+from src.storage.RunHistory import RunHistory
+from src.product.ViolationWriter import ViolationWriter
+from src.product.ViolationMask import ViolationMask
+from src.product.ViolationResult import ViolationResult
+from src.sink.BaseSink import BaseSink
+from src.telemetry import Tracer, Span, NullSpan, NULL_TRACER, MemoryLedger, span
+
+from typing import List, Union, Optional, Dict, Any, Tuple
 from abc import ABC, abstractmethod
-from dataclasses import field
 from datetime import datetime, timezone
+from time import perf_counter, time
+from math import ceil
+from os import PathLike, fspath, stat
+from io import BytesIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
 
 # ---------------------------------------------------------------
 # BASECONDUIT CLASS -> ABSTRACTION
@@ -17,72 +37,931 @@ from datetime import datetime, timezone
 class BaseConduit(ABC):
 
     __slots__ = (
-        "reader",
-        "schema"
-        "waypoints",
-        "factories",
-        "severity",
-        "format",
-        "created_at",
-        "history",
-        "verbosity"
+        "_reader",
+        "_schema",
+        "_waypoints",
+        "_factories",
+        "_severity",
+        "_format",
+        "_created_at",
+        "_history",
+        "_verbosity",
+        "_sample_rows",
+        "_sampling",
+        "_seed",
+        "_engine",
+        "_memory_budget",
+        "_memory_policy",
+        "_track_memory",
+        "_scratch_dir",
+        "_violations",
+        "_tracer",
+        "_built",
+        "_layout",
+        "_sketching",
+        "_logger",
     )
 
+    CHUNK_ROWS = 250_000        # Rows per batch for chunked fallback evaluation without a memory budget.
+    MAX_PARTITIONS = 64         # Upper bound on hash partitions spilled by out-of-core distinct counts.
+    PARTITION_KEY = "__windjam_partition"
+
     def __init__(
         self,
-        reader: "Other" = None,
-        schema: "Other" = None,
-        waypoints: List["Other"] = [],
-        factories: List["Other"] = [],
+        reader: Optional[BaseReader] = None,
+        schema: Optional[pl.Schema] = None,
+        waypoints: Optional[List[BasePoint]] = None,
+        factories: Optional[List[BaseFactory]] = None,
         severity: str = "fatal",
         format: str = "json",
         verbosity: int = 1,
+        sample_rows: int = 10_000,
+        sampling: Union[float, int, None] = None,
+        seed: int = 0,
+        history_capacity: int = 1024,
+        history_spill: Optional[Union[str, PathLike]] = None,
+        engine: str = "auto",
+        memory_budget: Optional[int] = None,
+        memory_policy: str = "stream",
+        track_memory: bool = False,
+        scratch_dir: Optional[Union[str, PathLike]] = None,
+        violations: Optional[ViolationWriter] = None,
+        tracer: Optional[Tracer] = None,
     ):
-        self.reader = reader
-        self.schema = schema
-        self.waypoints = waypoints
-        self.factories = factories
-        self.severity = field(default_factory=retrieve_conduit_severity(input=severity))
-        self.format = field(default_factory=retrieve_return_format(input=format))
-        self.created_at = field(default_factory=datetime.now(timezone.utc))
-        self.history = OrderedDict()
-        self.verbosity = verbosity
+        if isinstance(sampling, bool) or (isinstance(sampling, float) and not 0.0 < sampling <= 1.0) \
+                or (isinstance(sampling, int) and sampling < 1):
+            raise ValueError(f"Sampling must be a fraction within (0, 1] or a positive row count - Recieved {sampling}")
 
-    @abstractmethod
-    def execute(self) -> "Other":
-        pass
+        if memory_budget is not None and memory_budget < 1:
+            raise ValueError(f"Memory budget must be a positive number of bytes - Recieved {memory_budget}")
 
-    @abstractmethod
-    def add_waypoint(self, waypoint: "Other") -> bool:
-        pass
+        self._reader: Optional[BaseReader]  = reader
+        self._schema: Optional[pl.Schema]   = schema
+        self._waypoints: List[BasePoint]    = list(waypoints) if waypoints else []
+        self._factories: List[BaseFactory]  = list(factories) if factories else []
+        self._severity: int                 = retrieve_conduit_severity(input=severity)
+        self._format: str                   = retrieve_return_format(input=format)
+        self._created_at: datetime          = datetime.now(timezone.utc)
+        self._history: RunHistory           = RunHistory(capacity=history_capacity, spill_dir=history_spill)
+        self._verbosity: int                = verbosity
+        self._sample_rows: int              = sample_rows
+        self._sampling: Union[float, int, None] = sampling
+        self._seed: int                     = seed
+        self._engine: str                   = retrieve_execution_engine(input=engine)
+        self._memory_budget: Optional[int]  = memory_budget
+        self._memory_policy: str            = retrieve_memory_policy(input=memory_policy)
+        self._track_memory: bool            = track_memory
+        self._scratch_dir: Optional[Path]   = Path(scratch_dir) if scratch_dir is not None else None
+        self._violations: Optional[ViolationWriter] = violations
+        self._tracer: Tracer                = tracer if tracer is not None else NULL_TRACER
+        self._built: bool                   = False
+        self._layout: Optional[ConduitLayout] = None
+        self._sketching: bool               = False     # Partials carry distinct-key hashes -> Set by merging Conduits.
+        self._logger: ClassLogger           = get_class_logger(self.__class__, verbosity)
 
-    @abstractmethod
-    def add_factory(self, factory: "Other") -> bool:
-        pass
+# Class Properties --------------------------------------------------
 
     @property
-    @abstractmethod
-    def reader(self) -> Union["Other", None]:
-        return self.reader
+    def reader(self) -> Union[BaseReader, None]:
+        return self._reader
 
     @property
-    @abstractmethod
-    def schema(self) -> Union["Other", None]:
-        return self.schema
+    def schema(self) -> Union[pl.Schema, None]:
+        return self._schema
 
     @property
-    @abstractmethod
-    def waypoints(self) -> Union[List["Other"], "Other"]:
-        return self.waypoints
+    def waypoints(self) -> Tuple[BasePoint, ...]:
+        return tuple(self._waypoints)
 
     @property
+    def factories(self) -> Tuple[BaseFactory, ...]:
+        return tuple(self._factories)
+
+    @property
+    def severity(self) -> int:
+        return self._severity
+
+    @property
+    def format(self) -> str:
+        return self._format
+
+    @property
+    def created_at(self) -> datetime:
+        return self._created_at
+
+    @property
+    def history(self) -> RunHistory:
+        return self._history
+
+    @property
+    def sampling(self) -> Union[float, int, None]:
+        return self._sampling
+
+    @property
+    def engine(self) -> str:
+        return self._engine
+
+    @property
+    def memory_budget(self) -> Optional[int]:
+        return self._memory_budget
+
+    @property
+    def memory_policy(self) -> str:
+        return self._memory_policy
+
+    @property
+    def violations(self) -> Optional[ViolationWriter]:
+        return self._violations
+
+    @property
+    def tracer(self) -> Tracer:
+        return self._tracer
+
+    @property
+    def is_built(self) -> bool:
+        return self._built
+
+    @property
+    def _fail_fast(self) -> bool:
+        # Only 'fatal' Conduits trade a single fused pass for staged, abortable execution.
+        return self._severity == retrieve_conduit_severity(input="fatal")
+
+# Abstract Class Methods --------------------------------------------------
+
     @abstractmethod
-    def factories(self) -> Union[List["Other"], "Other"]:
-        return self.factories
-    
-    @abstractmethod
-    def get_state(self) -> Dict[str, Any]:
+    def execute(self, input: InputType) -> ConduitResult:
         pass
 
-class Other:
-    pass # Placeholder class -> Type checking.
\ No newline at end of file
+# Core Class Operations --------------------------------------------------
+
+    def add_waypoint(self, waypoint: BasePoint) -> bool:
+        if self._assert_not_built():
+            self._waypoints.append(waypoint)
+            self._logger.info("Waypoint: %s added to Conduit: %s", type(waypoint).__name__, type(self).__name__)
+            return True
+
+    def add_factory(self, factory: BaseFactory) -> bool:
+        if self._assert_not_built():
+            self._factories.append(factory)
+            self._logger.info("Factory: %s added to Conduit: %s", type(factory).__name__, type(self).__name__)
+            return True
+
+    def build(self, input: InputType = None) -> None:
+
+        if self._built:
+            # If the Conduit instance is already constructed return immediately.
+            self._logger.info("Conduit: %s is already constructed!", type(self).__name__)
+            return
+
+        if self._reader is None:
+            raise ConduitBuildError(self, "No Reader-instance attached to the Conduit!")
+
+        with self._tracer.span("conduit.build", conduit=type(self).__name__):
+            if not self._reader.is_built:
+                self._reader.build(input=input)     # Resolve the Reader's Schema (Explicit or inferred).
+
+            for waypoint in self._waypoints:
+                if not waypoint.is_built:
+                    waypoint.build()
+
+            if self._schema is None:
+                self._schema = self._reader.schema  # DEFAULT -> Adopt the Reader's resolved Schema.
+
+            with span("plan.compile", waypoints=len(self._waypoints)):
+                self._layout = self._compile_layout()
+        self._history = RunHistory(
+            capacity=self._history.capacity,
+            waypoints=[type(waypoint).__name__ for waypoint in self._waypoints],
+            spill_dir=self._history.spill_dir,
+        )
+        self._built = True
+        self._logger.info(
+            "Conduit: %s built successfully with %s waypoint(s).", type(self).__name__, len(self._waypoints)
+        )
+
+    def locate(self, input: InputType, failed_only: bool = True) -> ViolationResult:
+        if self._assert_built():
+            try:
+                result, frames, _, sampling = self._collect(input)
+                names, expressions = [], []
+
+                for index, (waypoint, frame) in enumerate(zip(self._waypoints, frames)):
+                    if frame is None:
+                        continue    # Skipped by a fail-fast abort -> Nothing to locate.
+
+                    if failed_only and self._evaluate(waypoint, frame, sampling).get("passed", True) is not False:
+                        continue
+
+                    mask = waypoint._violation_mask(frame)
+
+                    if mask is not None:
+                        name = type(waypoint).__name__
+                        name = f"{name}:{index}" if name in names else name
+                        names.append(name)
+                        expressions.append(mask.alias(name))
+
+                # One extra pass yields every mask -> Booleans are bit-packed, failing rows are never materialized.
+                collected = result.frame.select(expressions).collect(engine="streaming") if expressions else None
+            except Exception as err:
+                self._logger.error("Conduit: %s could not locate violations.", type(self).__name__)
+                raise ConduitExecutionError(self, f"Input: {self._source_name(input)} failed - {err}") from err
+
+            masks = {name: ViolationMask.from_series(collected[name]) for name in names}
+
+            return ViolationResult(source=self._source_name(input), masks=masks, frame=result.frame)
+
+    def split(
+        self,
+        input: InputType,
+        valid: BaseSink,
+        quarantine: BaseSink,
+        reason_column: str = "violations",
+    ) -> ConduitResult:
+        if self._assert_built():
+            if self._sampling is not None:
+                raise ConduitBuildError(self, "Splits route every row -> Sampling cannot be combined with 'split'.")
+
+            start_time = perf_counter()
+
+            try:
+                result = self._reader.execute(input)
+                lf = result.frame.cache()   # Explicit cache node -> Every branch below shares one scan of the input.
+
+                plans = [self._plan(lf, index) for index in range(len(self._layout.plans) + bool(self._layout.requests))]
+                routed, frames = self._waypoints, None
+
+                if any(waypoint._tolerates_violations() for waypoint in self._waypoints):
+                    # Flagged rows may still pass within a tolerance -> Verdicts first (A second scan), and
+                    # Waypoints that passed never quarantine rows.
+                    frames = self._fan_out(pl.collect_all(plans, engine="streaming"))
+                    routed = [
+                        waypoint
+                        for waypoint, frame in zip(self._waypoints, frames)
+                        if not waypoint._tolerates_violations()
+                        or (frame is not None and self._evaluate(waypoint, frame).get("passed", True) is False)
+                    ]
+                    plans = []
+
+                annotated = lf.with_columns(self._reason_expression(routed).alias(reason_column))
+                flagged = pl.col(reason_column).list.len() > 0
+
+                sinks = [
+                    valid._to_plan(annotated.filter(~flagged).drop(reason_column)),
+                    quarantine._to_plan(annotated.filter(flagged)),
+                ]
+                counter = annotated.select(flagged.sum().alias("quarantined"))
+
+                # Zero tolerance -> Any flagged row fails its Waypoint, so validation, both sinks and the counter
+                # form one query graph and the input is scanned exactly once.
+                collected = pl.collect_all([*plans, *sinks, counter], engine="streaming")
+            except Exception as err:
+                self._logger.error("Conduit: %s split was unsuccessful.", type(self).__name__)
+                raise ConduitExecutionError(self, f"Input: {self._source_name(input)} failed - {err}") from err
+
+            valid_frame, quarantine_frame, counted = collected[len(plans):]
+            frames = frames if frames is not None else self._fan_out(collected[:len(plans)])
+            valid._complete(valid_frame)
+            quarantine._complete(quarantine_frame)
+
+            conduit_result = self._finalize(input, result.metadata, frames, perf_counter() - start_time)
+            conduit_result.metadata["split"] = {
+                "valid": str(valid),
+                "quarantine": str(quarantine),
+                "quarantined": counted["quarantined"].item(),
+            }
+
+            return conduit_result
+
+    def get_state(self) -> Dict[str, Any]:
+        return {
+            "conduit": type(self).__name__,
+            "built": self._built,
+            "reader": str(self._reader) if self._reader is not None else None,
+            "schema": dict(self._schema) if self._schema is not None else None,
+            "waypoints": [repr(waypoint) for waypoint in self._waypoints],
+            "factories": [type(factory).__name__ for factory in self._factories],
+            "severity": self._severity,
+            "sampling": self._sampling,
+            "engine": self._engine,
+            "memory_budget": self._memory_budget,
+            "memory_policy": self._memory_policy,
+            "format": self._format,
+            "created_at": self._created_at.strftime('%Y-%m-%d %H:%M:%S'),
+            "runs": self._history.total,
+        }
+
+# Internal Helper-methods --------------------------------------------------
+
+    def _assert_built(self) -> bool:
+        if not self._built:
+            error_str = f"Conduit-instance is currently not constructed." \
+                        "Please call the 'build' method before using it."
+
+            self._logger.error(error_str)
+            raise ConduitBuildError(self, error_str)
+
+        return True
+
+    def _assert_not_built(self) -> bool:
+        if self._built:
+            error_str = f"Conduit-instance already constructed." \
+                        "Please create a new instance to modify its configuration."
+
+            self._logger.error(error_str)
+            raise ConduitBuildError(self, error_str)
+
+        return True
+
+    def _run(self, input: InputType) -> ConduitResult:
+        # Synchronous execution path -> Shared by 'Conduit' and 'ThreadConduit'.
+        start_time = perf_counter()
+
+        ledger = self._open_ledger()
+
+        with self._tracer.span("conduit.execute", conduit=type(self).__name__) as trace:
+            try:
+                staged: List[Path] = []
+                result, frames, aborted, sampling = self._collect(input, ledger, staged)
+            except ConduitMemoryError:
+                self._logger.error("Conduit: %s refused an input exceeding its memory budget.", type(self).__name__)
+                raise
+            except Exception as err:
+                self._logger.error("Conduit: %s execution was unsuccessful.", type(self).__name__)
+                raise ConduitExecutionError(self, f"Input: {self._source_name(input)} failed - {err}") from err
+
+            conduit_result = self._finalize(
+                input, result.metadata, frames, perf_counter() - start_time, aborted, sampling, staged
+            )
+
+        return self._attach_trace(self._attach_memory(conduit_result, ledger), trace)
+
+    def _compile_layout(self) -> ConduitLayout:
+        requests: Dict[str, AggregateRequest] = {}      # Keyed by alias -> Deterministic, duplicate-free projection.
+        plans: Dict[BasePoint, int] = {}                # Keyed by 'BasePoint._key' (Via __hash__/__eq__).
+        slots, columns = [], []
+
+        for waypoint in self._waypoints:
+            waypoint_requests = waypoint._requests()
+
+            if self._sketching:
+                # Distinct counts of partial results are merged through their key hashes -> Fused alongside the counts.
+                waypoint_requests += tuple(filter(None, map(retrieve_aggregate_sketch, waypoint_requests)))
+
+            if waypoint_requests:
+                # Aggregate Waypoints share the single fused query -> Identical requests are computed once.
+                for request in waypoint_requests:
+                    requests.setdefault(request.alias, request)
+
+                slots.append(-1)
+                columns.append(tuple(dict.fromkeys(request.alias for request in waypoint_requests)))
+            else:
+                # Plan-based Waypoints are deduplicated by their key -> Equal Waypoints share one collected frame.
+                slots.append(plans.setdefault(waypoint, len(plans)))
+                columns.append(())
+
+        # Unified plan indices -> The fused aggregate query (If any) always occupies index 0.
+        offset = 1 if requests else 0
+        slots = [0 if slot < 0 else slot + offset for slot in slots]
+        costs = (("aggregate",) if requests else ()) + tuple(waypoint.COST for waypoint in plans)
+
+        self._logger.debug(
+            "Conduit: %s fused %s unique aggregate(s) and %s plan(s).", type(self).__name__, len(requests), len(plans)
+        )
+
+        return ConduitLayout(
+            requests=tuple(requests.values()),
+            plans=tuple(plans),
+            slots=tuple(slots),
+            columns=tuple(columns),
+            stages=self._compile_stages(costs, slots),
+        )
+
+    def _compile_stages(self, costs: Tuple[str, ...], slots: List[int]) -> Tuple[Tuple[str, Tuple[int, ...]], ...]:
+        if not self._fail_fast:
+            return (("full", tuple(range(len(costs)))),)  # Single pass -> Every plan shares one 'collect_all'.
+
+        stages: Dict[str, List[int]] = {}
+
+        for index in sorted(range(len(costs)), key=lambda index: retrieve_waypoint_cost(costs[index])):
+            stages.setdefault(costs[index], []).append(index)
+
+        if self._sample_rows > 0:
+            # Plans feeding a sample-confirmable Waypoint are first evaluated on the head of the input.
+            confirmable = tuple(sorted({
+                slot
+                for waypoint, slot in zip(self._waypoints, slots)
+                if waypoint._confirms_on_sample() and costs[slot] != "metadata"
+            }))
+
+            if confirmable:
+                ordered = list(stages.items())
+                position = 1 if "metadata" in stages else 0
+                ordered.insert(position, ("sample", confirmable))
+                stages = dict(ordered)
+
+        return tuple((stage, tuple(indices)) for stage, indices in stages.items())
+
+    # 'staged' receives the path of violation records streamed by the final stage -> See '_stage_violations'.
+    def _collect(
+        self,
+        input: InputType,
+        ledger: Optional[MemoryLedger] = None,
+        staged: Optional[List[Path]] = None,
+    ) -> Tuple[ReaderResult, List[Optional[pl.DataFrame]], Optional[str], Optional[Dict[str, Any]]]:
+        engine, rate = self._enforce_budget(input, ledger)  # Before the scan -> Refused inputs are never opened.
+        result = self._reader.execute(input)    # Lazy scan + Schema validation -> No materialization.
+        layout = self._layout
+        source, sampling = self._draw_sample(result.frame, rate) if rate is not None else (result.frame, None)
+
+        if ledger is not None and sampling is not None:
+            ledger.cached_bytes += sampling["bytes"]
+
+        frames: List[Optional[pl.DataFrame]] = [None] * (len(layout.plans) + (1 if layout.requests else 0))
+
+        for position, (stage, indices) in enumerate(layout.stages):
+            if stage == "sample":
+                # 'head' pushes a slice into the scan -> Parquet/IPC only read the leading row group(s).
+                sample = source.head(self._sample_rows)
+                sampled: List[Optional[pl.DataFrame]] = [None] * len(frames)
+
+                if ledger is not None:
+                    ledger.begin()
+
+                with span("collect", stage=stage, plans=len(indices)):
+                    for index, frame in zip(indices, pl.collect_all([self._plan(sample, index) for index in indices])):
+                        sampled[index] = frame
+
+                if ledger is not None:
+                    ledger.end(stage, {index: sampled[index] for index in indices})
+
+                candidates = [
+                    frame if waypoint._confirms_on_sample() else None
+                    for waypoint, frame in zip(self._waypoints, self._fan_out(sampled))
+                ]
+
+                if self._violated(candidates, sampling):
+                    self._logger.warning("Conduit: %s aborted after sample pre-check.", type(self).__name__)
+
+                    # Only confirmed failures are reported from the head -> Passing there says nothing about the rest.
+                    # Waypoints of earlier (Metadata) stages already ran on the full input -> Reported, not skipped.
+                    merged = [
+                        candidate if candidate is not None and self._evaluate(waypoint, candidate, sampling).get("passed", True) is False
+                        else frame
+                        for waypoint, candidate, frame in zip(self._waypoints, candidates, self._fan_out(frames))
+                    ]
+                    return result, merged, stage, sampling
+
+                continue
+
+            sinks = []
+
+            if staged is not None and self._violations is not None and sampling is None and position == len(layout.stages) - 1:
+                # Explicit cache node -> The violation sink and the final stage's plans share one scan.
+                source = source.cache()
+                sink = self._stage_violations(input, source, staged)
+
+                if sink is not None:
+                    sinks.append(sink)
+
+            if ledger is not None:
+                ledger.begin()
+
+            with span("collect", stage=stage, plans=len(indices), engine=engine):
+                for index, frame in zip(indices, self._collect_plans(source, indices, engine, input, sinks)):
+                    frames[index] = frame
+
+            if ledger is not None:
+                ledger.end(stage, {index: frames[index] for index in indices})
+
+            if self._fail_fast and position < len(layout.stages) - 1:
+                waypoint_frames = self._fan_out(frames)
+
+                if self._violated(waypoint_frames, sampling):
+                    # Fatal violation confirmed -> Skip every remaining (More expensive) stage.
+                    self._logger.warning("Conduit: %s aborted after stage: %s", type(self).__name__, stage)
+                    return result, waypoint_frames, stage, sampling
+
+        return result, self._fan_out(frames), None, sampling
+
+    def _draw_sample(self, lf: pl.LazyFrame, rate: Union[float, int]) -> Tuple[pl.LazyFrame, Dict[str, Any]]:
+        fraction = rate if isinstance(rate, float) else None
+
+        if self._reader.ROW_GROUPS:
+            # Row counts are metadata-only for Parquet/IPC -> Sample whole random blocks instead of single rows.
+            population = lf.select(pl.len()).collect().item()
+            rows = ceil(fraction * population) if fraction is not None else rate
+            sample = block_sample(lf, rows, population, seed=self._seed).collect()
+            mode = "blocks"
+        else:
+            sampled = bernoulli_sample(lf, fraction, self._seed) if fraction is not None \
+                else reservoir_sample(lf, rate, self._seed)
+            sample, population = pl.collect_all([sampled, lf.select(pl.len())], engine="streaming")
+            population = population.item()
+            mode = "fraction" if fraction is not None else "reservoir"
+
+        # The (bounded) sample is materialized once -> Every Waypoint-plan then runs in memory.
+        return sample.lazy(), {
+            "mode": mode,
+            "rows": sample.height,
+            "population": population,
+            "fraction": sample.height / population if population else 0.0,
+            "bytes": sample.estimated_size(),
+        }
+
+    def _enforce_budget(self, input: InputType, ledger: Optional[MemoryLedger] = None) -> Tuple[str, Union[float, int, None]]:
+        engine, rate, action = self._engine, self._sampling, "none"
+        estimate = self._estimate_memory(input) if self._memory_budget is not None or ledger is not None else None
+
+        if self._memory_budget is not None and estimate is not None and estimate > self._memory_budget:
+            if self._memory_policy == "refuse":
+                raise ConduitMemoryError(
+                    self,
+                    f"Input: {self._source_name(input)} needs an estimated {estimate} bytes - Budget is {self._memory_budget} bytes"
+                )
+
+            if self._memory_policy == "sample" and self._sampling is None:
+                # Sized so the materialized sample fits the budget -> Verdicts become confidence-bounded estimates.
+                rate, action = self._memory_budget / estimate, "sampling"
+            elif self._engine == "auto":
+                # Inputs larger than the budget can never be held in memory -> Switch to out-of-core execution.
+                engine, action = "streaming", "streaming"
+
+        if ledger is not None:
+            ledger.estimated, ledger.engine, ledger.action = estimate, engine, action
+
+        return engine, rate
+
+    def _estimate_memory(self, input: InputType) -> Optional[int]:
+        size = self._source_bytes(input)
+        return int(size * self._reader.EXPANSION) if size >= 0 else None   # Unknown sizes never trip the budget.
+
+    def _open_ledger(self) -> Optional[MemoryLedger]:
+        if not self._track_memory and self._memory_budget is None:
+            return None
+
+        return MemoryLedger(budget=self._memory_budget, policy=self._memory_policy)
+
+    def _attach_memory(self, result: ConduitResult, ledger: Optional[MemoryLedger]) -> ConduitResult:
+        if ledger is None:
+            return result
+
+        report = ledger.to_dict()
+        report["waypoints"] = []
+
+        for waypoint, slot in zip(self._waypoints, self._layout.slots):
+            # Waypoints sharing a plan (Or the fused aggregate) report the same collected frame.
+            stage, frame_bytes = ledger.plans.get(slot, (None, 0))
+            report["waypoints"].append({
+                "waypoint": type(waypoint).__name__,
+                "stage": stage,
+                "frame_bytes": frame_bytes,
+                "peak_rss": ledger.stage_peak(stage) if stage is not None else None,
+            })
+
+        result.metadata["memory"] = report
+        return result
+
+    def _collect_plans(
+        self,
+        lf: pl.LazyFrame,
+        indices: Tuple[int, ...],
+        engine: str,
+        input: InputType,
+        sinks: List[pl.LazyFrame] = (),
+    ) -> List[pl.DataFrame]:
+        if engine != "streaming":
+            if self._tracer.profile:
+                # One profiled query per plan -> Gives up the shared collect_all to attribute time to each node.
+                frames = [self._tracer.collect_profiled(self._plan(lf, index)) for index in indices]
+                pl.collect_all(sinks, engine=engine)
+                return frames
+
+            return pl.collect_all([*(self._plan(lf, index) for index in indices), *sinks], engine=engine)[:len(indices)]
+
+        layout = self._layout
+        offset = 1 if layout.requests else 0
+        streamed: Dict[int, pl.LazyFrame] = {}
+        frames: Dict[int, pl.DataFrame] = {}
+
+        for index in indices:
+            if offset and index == 0:
+                requests = [request for request in layout.requests if retrieve_aggregate_partition(request) is None]
+
+                if requests:
+                    streamed[index] = lf.select([retrieve_aggregate_expression(request) for request in requests])
+                continue
+
+            waypoint = layout.plans[index - offset]
+
+            if waypoint.STREAMABLE:
+                streamed[index] = waypoint._to_plan(lf)
+            elif waypoint.is_mergeable:
+                frames[index] = self._collect_chunked(lf, waypoint)
+            else:
+                self._logger.warning(
+                    "Waypoint: %s is neither streamable nor mergeable -> Collected in memory.", type(waypoint).__name__
+                )
+                frames[index] = waypoint._to_plan(lf).collect(engine="in-memory")
+
+        for index, frame in zip(streamed, pl.collect_all([*streamed.values(), *sinks], engine="streaming")):
+            frames[index] = frame
+
+        if offset and 0 in indices:
+            frames[0] = self._attach_spilled(lf, frames.get(0), input)
+
+        return [frames[index] for index in indices]
+
+    def _attach_spilled(self, lf: pl.LazyFrame, fused: Optional[pl.DataFrame], input: InputType) -> pl.DataFrame:
+        spilled = {
+            request.alias: pl.Series(request.alias, [self._spill_distinct(lf, request, input)], dtype=pl.get_index_type())
+            for request in self._layout.requests
+            if retrieve_aggregate_partition(request) is not None
+        }
+
+        fused = fused.with_columns(list(spilled.values())) if fused is not None else pl.DataFrame(list(spilled.values()))
+
+        return fused.select([request.alias for request in self._layout.requests])   # Restore the layout's column order.
+
+    def _spill_distinct(self, lf: pl.LazyFrame, request: AggregateRequest, input: InputType) -> int:
+        keys = list(retrieve_aggregate_partition(request))
+        source_bytes = self._source_bytes(input)
+
+        # Sized so one partition's key set fits the budget -> Equal keys always hash into the same partition.
+        partitions = max(1, min(self.MAX_PARTITIONS, ceil(source_bytes / self._memory_budget))) \
+            if self._memory_budget is not None and source_bytes > 0 else self.MAX_PARTITIONS
+
+        if self._scratch_dir is not None:
+            self._scratch_dir.mkdir(parents=True, exist_ok=True)
+
+        with TemporaryDirectory(dir=self._scratch_dir, prefix="windjam-spill-") as scratch:
+            lf.select(keys).with_columns(
+                (pl.struct(keys).hash(seed=self._seed) % partitions).alias(self.PARTITION_KEY)
+            ).sink_parquet(pl.PartitionByKey(scratch, by=self.PARTITION_KEY, include_key=False), engine="streaming")
+
+            return sum(
+                pl.scan_parquet(file).select(pl.struct(keys).n_unique()).collect().item()
+                for file in Path(scratch).rglob("*.parquet")
+            )
+
+    def _collect_chunked(self, lf: pl.LazyFrame, waypoint: BasePoint) -> pl.DataFrame:
+        partials = [
+            waypoint._to_plan(batch.lazy()).collect()
+            for batch in lf.collect_batches(chunk_size=self._chunk_rows(), engine="streaming")
+        ]
+
+        return waypoint._merge(partials) if partials else waypoint._to_plan(lf.head(0)).collect()
+
+    def _chunk_rows(self) -> int:
+        if self._memory_budget is None:
+            return self.CHUNK_ROWS
+
+        # Rough in-memory row width -> Variable-width columns are assumed to average 32 bytes per value.
+        width = sum(32 if dtype in (pl.String, pl.Binary) else 8 for dtype in self._schema.values()) or 8
+
+        return max(1, self._memory_budget // (width * 2))     # Half the budget -> Room for the plan's own output.
+
+    def _reason_expression(self, waypoints: List[BasePoint]) -> pl.Expr:
+        reasons = [
+            pl.when(predicate.fill_null(False)).then(pl.lit(f"{type(waypoint).__name__}:{column}"))
+            for waypoint in dict.fromkeys(waypoints)      # Equal Waypoints contribute one reason.
+            for column, predicate, _ in waypoint._predicates(None)
+        ]
+
+        if not reasons:
+            return pl.lit([], dtype=pl.List(pl.String))
+
+        return pl.concat_list(reasons).list.drop_nulls()
+
+    def _plan(self, lf: pl.LazyFrame, index: int) -> pl.LazyFrame:
+        layout = self._layout
+
+        if layout.requests:
+            if index == 0:
+                return lf.select([retrieve_aggregate_expression(request) for request in layout.requests])
+
+            index -= 1
+
+        return layout.plans[index]._to_plan(lf)
+
+    def _fan_out(self, frames: List[Optional[pl.DataFrame]]) -> List[Optional[pl.DataFrame]]:
+        # Map the unique collected frames back onto every Waypoint (In declaration order).
+        layout = self._layout
+
+        return [
+            None if frames[slot] is None else (frames[slot].select(columns) if columns else frames[slot])
+            for slot, columns in zip(layout.slots, layout.columns)
+        ]
+
+    def _violated(self, frames: List[Optional[pl.DataFrame]], sampling: Optional[Dict[str, Any]] = None) -> bool:
+        return any(
+            self._evaluate(waypoint, frame, sampling).get("passed", True) is False
+            for waypoint, frame in zip(self._waypoints, frames)
+            if frame is not None
+        )
+
+    def _evaluate(
+        self,
+        waypoint: BasePoint,
+        frame: pl.DataFrame,
+        sampling: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        if sampling is None:
+            return waypoint.validate(frame) or {}
+
+        # Sampled runs yield estimates -> Waypoints widen their verdicts with confidence bounds.
+        return waypoint.validate_sample(frame, rows=sampling["rows"], population=sampling["population"]) or {}
+
+    def _finalize(
+        self,
+        input: InputType,
+        reader_metadata: Dict[str, Any],
+        frames: List[Optional[pl.DataFrame]],
+        exec_time: float,
+        aborted: Optional[str] = None,
+        sampling: Optional[Dict[str, Any]] = None,
+        staged: Optional[List[Path]] = None,
+    ) -> ConduitResult:
+        reports = []
+
+        for waypoint, frame in zip(self._waypoints, frames):
+            if frame is None:
+                # Waypoint never ran -> The Conduit aborted before reaching its stage.
+                report = {"waypoint": type(waypoint).__name__, "passed": None, "skipped": True}
+
+                if aborted is not None:
+                    report["reason"] = f"Aborted after stage: {aborted}"
+
+                reports.append(report)
+                continue
+
+            report = {"waypoint": type(waypoint).__name__, "passed": True}
+
+            with span(f"waypoint.{type(waypoint).__name__}"):
+                report.update(self._evaluate(waypoint, frame, sampling))
+
+            reports.append(report)
+
+        conduit_result = ConduitResult(
+            source=self._source_name(input),
+            passed=aborted is None and all(report["passed"] is not False for report in reports),
+            waypoints=tuple(reports),
+            metadata={
+                "conduit": type(self).__name__,
+                "reader": reader_metadata,
+                "severity": self._severity,
+                "aborted": aborted,
+                "sampling": sampling,
+                "datetime": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                "exec_time": exec_time,
+            },
+        )
+
+        if self._violations is not None and not conduit_result.passed:
+            conduit_result.metadata["violations"] = self._write_violations(input, reports, frames, staged)
+        elif staged:
+            self._violations._discard(staged[0])
+
+        self._record(input, conduit_result, frames)
+        self._logger.info("Conduit: %s executed successfully in %.4fs.", type(self).__name__, exec_time)
+
+        return conduit_result
+
+    def _write_violations(
+        self,
+        input: InputType,
+        reports: List[Dict[str, Any]],
+        frames: List[Optional[pl.DataFrame]],
+        staged: Optional[List[Path]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            tolerated = any(
+                report["passed"] is False and waypoint._tolerates_violations()
+                for waypoint, report in zip(self._waypoints, reports)
+            )
+
+            if staged:
+                if not tolerated:
+                    return self._violations._complete(staged[0])
+
+                self._violations._discard(staged[0])
+
+            # A second, lazy scan of the input -> Only paid by aborted runs and failing tolerant Waypoints.
+            lf = self._reader.execute(input).frame.with_row_index(BasePoint.ROW_INDEX)
+            violations = []
+
+            for waypoint, report, frame in zip(self._waypoints, reports, frames):
+                if report["passed"] is False and frame is not None:
+                    records = waypoint._violations(lf, frame)
+
+                    if records is not None:
+                        violations.append((type(waypoint).__name__, records))
+
+            return self._violations.write(self._source_name(input), violations) if violations else None
+        except Exception as err:
+            # Reporting never changes a verdict -> The failure is surfaced in the result metadata instead.
+            self._logger.error("Conduit: %s could not write violation records - %s", type(self).__name__, err)
+            return {"error": f"{type(err).__name__}: {err}"}
+
+    # Zero-tolerance Waypoints flag rows only when they fail -> Their records can be sunk before any verdict.
+    # Tolerant Waypoints may pass despite flagged rows -> Their records are written by '_write_violations'.
+    def _stage_violations(self, input: InputType, lf: pl.LazyFrame, staged: List[Path]) -> Optional[pl.LazyFrame]:
+        try:
+            lf = lf.with_row_index(BasePoint.ROW_INDEX)
+            violations = []
+
+            for waypoint in self._waypoints:
+                records = None if waypoint._tolerates_violations() else waypoint._violations(lf, None)
+
+                if records is not None:
+                    violations.append((type(waypoint).__name__, records))
+
+            if not violations:
+                return None
+
+            path, sink = self._violations._to_plan(self._source_name(input), violations)
+        except Exception as err:
+            # Reporting never changes a verdict -> Failing runs fall back to a second scan in '_write_violations'.
+            self._logger.error("Conduit: %s could not stage violation records - %s", type(self).__name__, err)
+            return None
+
+        staged.append(path)
+        return sink
+
+    def _record(self, input: InputType, result: ConduitResult, frames: List[Optional[pl.DataFrame]]) -> None:
+        # Row counts come for free whenever the fused aggregate query already counted them.
+        rows = next((frame["len:*"].item() for frame in frames if frame is not None and "len:*" in frame.columns), -1)
+
+        bytes_read = self._source_bytes(input)
+
+        self._history.append(
+            timestamp=time(),
+            duration=result.metadata["exec_time"],
+            rows=rows,
+            bytes_read=bytes_read,
+            passed=result.passed,
+            outcomes=[report["passed"] for report in result.waypoints],
+        )
+
+        registry = self._tracer.registry
+
+        if registry is not None:
+            conduit = type(self).__name__
+            registry.increment("windjam_conduit_runs_total", conduit=conduit, passed=result.passed)
+            registry.observe("windjam_conduit_seconds", result.metadata["exec_time"], conduit=conduit)
+            registry.increment("windjam_rows_total", max(rows, 0), conduit=conduit)
+            registry.increment("windjam_bytes_read_total", max(bytes_read, 0), conduit=conduit)
+
+            for report in result.waypoints:
+                if report["passed"] is False:
+                    registry.increment("windjam_waypoint_failures_total", conduit=conduit, waypoint=report["waypoint"])
+
+    @staticmethod
+    def _attach_trace(result: ConduitResult, trace: Union[Span, NullSpan]) -> ConduitResult:
+        if trace:
+            result.metadata["trace"] = trace.to_dict()  # Root span closed -> Durations of the whole tree are final.
+
+        return result
+
+    @staticmethod
+    def _source_bytes(input: InputType) -> int:
+        if isinstance(input, (list, tuple)):
+            sizes = [BaseConduit._source_bytes(item) for item in input]
+            return sum(sizes) if all(size >= 0 for size in sizes) else -1
+
+        if isinstance(input, (str, PathLike)):
+            try:
+                if Path(input).is_dir():
+                    # Unified directory inputs -> The files it holds, not the directory entry.
+                    return sum(path.stat().st_size for path in Path(input).iterdir() if path.is_file())
+
+                return stat(input).st_size
+            except OSError:
+                return -1
+
+        if isinstance(input, BytesIO):
+            return input.getbuffer().nbytes
+
+        return -1
+
+    @staticmethod
+    def _source_name(input: InputType) -> str:
+        if isinstance(input, (str, PathLike)):
+            return str(fspath(input))
+
+        if isinstance(input, (list, tuple)):
+            return f"<{len(input)} inputs>"
+
+        return f"<{type(input).__name__}>"     # In-memory buffers carry no stable identity.
+
+# Class __dunder__-methods --------------------------------------------------
+
+    def __repr__(self) -> str:
+        built_str = "Built" if self._built else "Not Built"
+
+        return f"<{type(self).__name__} ({built_str}) - Waypoints={len(self._waypoints)}>"
+
+    def __len__(self) -> int:
+        return len(self._waypoints)
+
+    def __bool__(self) -> bool:
+        return self._built
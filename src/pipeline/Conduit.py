@@ -2,14 +2,8 @@
 # IMPORTS
 # ---------------------------------------------------------------
 
-import typing
-
 from src.pipeline.BaseConduit import BaseConduit
-
-from typing import List, Union, Optional
-from abc import ABC, abstractmethod
-from dataclasses import field
-from datetime import datetime, timezone
+from src.typings import ConduitResult, InputType
 
 # ---------------------------------------------------------------
 # ORDINARY CONDUIT CLASS
@@ -19,10 +13,9 @@ class Conduit(BaseConduit):
 
     __slots__ = ()
 
-    def __init__(self, reader = None, schema = None, waypoints = ..., factories = ..., verbosity = 1):
-        super().__init__(reader, schema, waypoints, factories, verbosity)
-
-    @typing.Override
-    def execute():
-        pass
+    def __init__(self, reader = None, schema = None, waypoints = None, factories = None, verbosity = 1, **base_kwargs):
+        super().__init__(reader, schema, waypoints, factories, verbosity=verbosity, **base_kwargs)
 
+    def execute(self, input: InputType) -> ConduitResult:
+        if self._assert_built():
+            return self._run(input)
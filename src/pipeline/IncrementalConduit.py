@@ -0,0 +1,191 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+from src.pipeline.BaseConduit import BaseConduit
+from src.storage.StateStore import StateStore
+from src.typings import ConduitResult, InputState
+from src.utility import frame_to_ipc, frame_from_ipc
+from src.errors import ConduitBuildError, ConduitExecutionError, ConduitMemoryError
+
+from typing import List, Union, Optional, Tuple, BinaryIO
+from hashlib import sha1
+from io import BytesIO, SEEK_END
+from os import PathLike, fspath, stat
+from time import perf_counter
+
+# ---------------------------------------------------------------
+# INCREMENTAL CONDUIT CLASS
+# ---------------------------------------------------------------
+
+class IncrementalConduit(BaseConduit):
+
+    __slots__ = ("_store",)
+
+    PROBE_BYTES = 4096      # Bytes preceding the stored offset that must be unchanged between runs.
+
+    def __init__(
+        self,
+        reader = None,
+        schema = None,
+        waypoints = None,
+        factories = None,
+        verbosity = 1,
+        state_dir: Optional[Union[str, PathLike]] = None,
+        **base_kwargs,
+    ):
+        super().__init__(reader, schema, waypoints, factories, verbosity=verbosity, **base_kwargs)
+
+        self._store: StateStore = StateStore(directory=state_dir)
+        self._sketching = True     # Running distinct counts are stored as serialized DistinctFilter sketches.
+
+# Class Properties --------------------------------------------------
+
+    @property
+    def store(self) -> StateStore:
+        return self._store
+
+# Core Class Operations --------------------------------------------------
+
+    def build(self, input: Union[str, PathLike] = None) -> None:
+        if self._reader is not None and not self._reader.LINE_DELIMITED:
+            raise ConduitBuildError(self, f"Reader: {type(self._reader).__name__} is not line-delimited (Append-only)!")
+
+        unmergeable = [type(waypoint).__name__ for waypoint in self._waypoints if not waypoint.is_mergeable]
+
+        if unmergeable:
+            raise ConduitBuildError(self, f"Waypoints do not support merging partial results: {unmergeable}")
+
+        if self._sampling is not None:
+            raise ConduitBuildError(self, "Running states are exact -> Sampling cannot be combined with incremental runs.")
+
+        super().build(input=input)
+
+    def execute(self, input: Union[str, PathLike]) -> ConduitResult:
+        if self._assert_built():
+            start_time = perf_counter()
+            path = fspath(input)
+
+            ledger = self._open_ledger()
+
+            with self._tracer.span("conduit.execute", conduit=type(self).__name__) as trace:
+                try:
+                    previous = self._resolve_previous(path)
+                    header, delta, offset, probe = self._read_delta(path, previous)
+
+                    if previous is not None and not delta:
+                        # Nothing new since the last run -> Re-validate the stored running state.
+                        frames = [frame_from_ipc(state) for state in previous.states]
+                        metadata, aborted = {}, None
+                    else:
+                        # First runs scan the file itself -> Only appended deltas are ever buffered.
+                        source = path if delta is None else BytesIO(header + delta)
+                        result, frames, aborted, _ = self._collect(source, ledger)
+                        metadata = result.metadata
+
+                        if aborted is None:
+                            # Folded even on the first run -> States hold sketches, never the key hashes themselves.
+                            states = previous.states if previous is not None else [None] * len(frames)
+                            frames = [
+                                waypoint._merge([frame] if state is None else [frame_from_ipc(state), frame])
+                                for waypoint, state, frame in zip(self._waypoints, states, frames)
+                            ]
+                except ConduitMemoryError:
+                    self._logger.error("Conduit: %s refused an input exceeding its memory budget.", type(self).__name__)
+                    raise
+                except Exception as err:
+                    self._logger.error("Conduit: %s execution was unsuccessful.", type(self).__name__)
+                    raise ConduitExecutionError(self, f"Input: {path} failed - {err}") from err
+
+                if aborted is None:
+                    # Aborted deltas are never folded in -> The next run re-reads (And re-rejects) the same tail.
+                    self._store.update(path, InputState(
+                        identity=self._identity(path),
+                        offset=offset,
+                        header=header,
+                        probe=probe,
+                        layout=self._layout_fingerprint(),
+                        states=tuple(frame_to_ipc(frame) for frame in frames),
+                    ))
+
+                conduit_result = self._finalize(path, metadata, frames, perf_counter() - start_time, aborted)
+                conduit_result.metadata["incremental"] = {
+                    "offset": offset,
+                    "delta_bytes": offset - (previous.offset if previous is not None else len(header)),
+                    "reset": previous is None,
+                }
+
+            return self._attach_trace(self._attach_memory(conduit_result, ledger), trace)
+
+    def reset(self, input: Union[str, PathLike]) -> bool:
+        return self._store.remove(fspath(input))
+
+# Internal Helper-methods --------------------------------------------------
+
+    def _resolve_previous(self, path: str) -> Optional[InputState]:
+        previous = self._store.retrieve(path)
+
+        if previous is None:
+            return None
+
+        if previous.layout != self._layout_fingerprint() or previous.identity != self._identity(path):
+            self._logger.info("Input: %s changed identity or Conduit layout -> Full revalidation.", path)
+            return None
+
+        if stat(path).st_size < previous.offset or self._probe(path, previous.offset) != previous.probe:
+            # Truncated or rewritten (Not appended) -> Stored states no longer describe the prefix.
+            self._logger.info("Input: %s was truncated or rewritten -> Full revalidation.", path)
+            return None
+
+        return previous
+
+    # Returns (Header, delta, offset, probe) -> A None delta means the whole file can be scanned directly.
+    def _read_delta(self, path: str, previous: Optional[InputState]) -> Tuple[bytes, Optional[bytes], int, str]:
+        with open(path, "rb") as file:
+            if previous is None:
+                header = b"".join(file.readline() for _ in range(self._reader._header_lines()))
+                start = len(header)
+            else:
+                header = previous.header
+                start = previous.offset
+
+            # Only complete lines are consumed -> A partially written trailing record waits for the next run.
+            offset = self._complete_end(file, start)
+
+            if previous is None and offset == file.seek(0, SEEK_END):
+                delta = None
+            else:
+                file.seek(start)
+                delta = file.read(offset - start)
+
+        return header, delta, offset, self._probe(path, offset)
+
+    def _complete_end(self, file: BinaryIO, start: int) -> int:
+        # Searched backwards from the end of the file -> The complete prefix itself is never read.
+        position = file.seek(0, SEEK_END)
+
+        while position > start:
+            block = max(start, position - self.PROBE_BYTES)
+            file.seek(block)
+            newline = file.read(position - block).rfind(b"\n")
+
+            if newline >= 0:
+                return block + newline + 1
+
+            position = block
+
+        return start
+
+    def _probe(self, path: str, offset: int) -> str:
+        with open(path, "rb") as file:
+            file.seek(max(0, offset - self.PROBE_BYTES))
+            return sha1(file.read(min(offset, self.PROBE_BYTES))).hexdigest()
+
+    def _layout_fingerprint(self) -> str:
+        keys = repr((str(self._reader), tuple(waypoint._key() for waypoint in self._waypoints)))
+        return sha1(keys.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _identity(path: str) -> Tuple[int, int]:
+        status = stat(path)
+        return (status.st_dev, status.st_ino)
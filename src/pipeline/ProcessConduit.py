@@ -0,0 +1,256 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import pickle
+import multiprocessing
+
+from src.pipeline.BaseConduit import BaseConduit
+from src.pipeline.Conduit import Conduit
+from src.typings import ConduitResult, InputType
+from src.waypoints.BasePoint import BasePoint
+from src.utility import frame_to_ipc, frame_from_ipc, retrieve_aggregate_partition
+from src.utility.formatting_lists import error_severity_list
+from src.errors import ConduitBuildError, ConduitExecutionError
+
+from typing import List, Union, Optional, Iterable, Iterator, Tuple, Any, Dict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from math import ceil
+from os import cpu_count
+from time import perf_counter
+
+# ---------------------------------------------------------------
+# WORKER-PROCESS STATE
+# ---------------------------------------------------------------
+
+_WORKER_CONDUIT: Optional[Conduit] = None     # Rebuilt once per worker process by '_initialize_worker'.
+
+def _initialize_worker(payload: bytes) -> None:
+    global _WORKER_CONDUIT
+
+    reader, schema, waypoints, options = pickle.loads(payload)
+
+    _WORKER_CONDUIT = Conduit(reader=reader, schema=schema, waypoints=waypoints, verbosity=0, **options)
+    _WORKER_CONDUIT.build()     # Components arrive already built -> Only flips the Conduit's state.
+
+def _execute_shard(shard: List[Tuple[int, InputType]], merge: bool) -> List[Tuple[Any, ...]]:
+    conduit = _WORKER_CONDUIT
+    outcomes = []
+    partials = [[] for _ in conduit._waypoints]
+
+    if conduit._sketching != merge:
+        # Merged runs fuse the distinct-key hashes into the plan -> Recompiled only when the shard mode flips.
+        conduit._sketching = merge
+        conduit._layout = conduit._compile_layout()
+
+    for index, input in shard:
+        start_time = perf_counter()
+
+        try:
+            result, frames, aborted, sampling = conduit._collect(input)
+        except Exception as err:
+            outcomes.append((index, None, None, f"{type(err).__name__}: {err}", None, None))
+            continue
+
+        if merge:
+            if aborted is not None:
+                outcomes.append((index, None, None, f"Fatal violation confirmed at stage: {aborted}", None, None))
+                continue
+
+            for partial, frame in zip(partials, frames):
+                partial.append(frame)
+
+            outcomes.append((index, result.metadata, perf_counter() - start_time, None, None, None))
+        else:
+            payload = [None if frame is None else frame_to_ipc(frame) for frame in frames]
+            outcomes.append((index, result.metadata, perf_counter() - start_time, payload, aborted, sampling))
+
+    if merge:
+        merged = [_shard_state(waypoint, partial) for waypoint, partial in zip(conduit._waypoints, partials)]
+        outcomes.append((None, None, None, merged, None, None))
+
+    return outcomes
+
+def _shard_state(waypoint: BasePoint, partial: List[Any]) -> List[bytes]:
+    if not partial:
+        return []
+
+    # Distinct sketches only extend with key hashes -> Those partials are folded once, in the parent.
+    if any(retrieve_aggregate_partition(request) is not None for request in waypoint._requests()):
+        return [frame_to_ipc(frame) for frame in partial]
+
+    # Pre-merge within the shard -> Only one state per Waypoint crosses the process boundary.
+    return [frame_to_ipc(waypoint._merge(partial))]
+
+# ---------------------------------------------------------------
+# MULTI-PROCESS CONDUIT CLASS
+# ---------------------------------------------------------------
+
+class ProcessConduit(BaseConduit):
+
+    __slots__ = (
+        "_max_workers",
+        "_chunksize",
+        "_mp_context",
+        "_executor",
+    )
+
+    def __init__(
+        self,
+        reader = None,
+        schema = None,
+        waypoints = None,
+        factories = None,
+        verbosity = 1,
+        max_workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        mp_context: str = "spawn",
+        **base_kwargs,
+    ):
+        super().__init__(reader, schema, waypoints, factories, verbosity=verbosity, **base_kwargs)
+
+        self._max_workers: int                          = max_workers or cpu_count() or 1
+        self._chunksize: Optional[int]                  = chunksize
+        self._mp_context: str                           = mp_context    # 'fork' is unsafe once Polars' thread pool exists.
+        self._executor: Optional[ProcessPoolExecutor]   = None
+
+# Class Properties --------------------------------------------------
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+# Core Class Operations --------------------------------------------------
+
+    def execute(self, input: InputType) -> ConduitResult:
+        if self._assert_built():
+            return self._run(input)     # A single input never amortizes the cost of a worker round-trip.
+
+    def execute_many(
+        self,
+        inputs: Iterable[InputType],
+        return_exceptions: bool = False,
+    ) -> List[Union[ConduitResult, Exception]]:
+        if self._assert_built():
+            inputs = list(inputs)
+            results: List[Union[ConduitResult, Exception, None]] = [None] * len(inputs)
+
+            for index, result in self.execute_unordered(inputs, return_exceptions=return_exceptions):
+                results[index] = result
+
+            return results
+
+    def execute_unordered(
+        self,
+        inputs: Iterable[InputType],
+        return_exceptions: bool = False,
+    ) -> Iterator[Tuple[int, Union[ConduitResult, Exception]]]:
+        if self._assert_built():
+            inputs = list(inputs)
+
+            # Yielded per shard as workers finish -> Closing the iterator cancels every shard not yet started.
+            for outcomes in self._dispatch(inputs, merge=False):
+                for index, metadata, exec_time, payload, aborted, sampling in outcomes:
+                    input = inputs[index]
+
+                    if metadata is None:
+                        error = ConduitExecutionError(self, f"Input: {self._source_name(input)} failed - {payload}")
+                        if not return_exceptions:
+                            raise error
+                        yield index, error
+                        continue
+
+                    frames = [None if frame is None else frame_from_ipc(frame) for frame in payload]
+                    yield index, self._finalize(input, metadata, frames, exec_time, aborted, sampling)
+
+    def execute_merged(self, inputs: Iterable[InputType]) -> ConduitResult:
+        if self._assert_built():
+            unmergeable = [type(waypoint).__name__ for waypoint in self._waypoints if not waypoint.is_mergeable]
+
+            if unmergeable:
+                raise ConduitBuildError(self, f"Waypoints do not support merging partial results: {unmergeable}")
+
+            if self._sampling is not None:
+                raise ConduitBuildError(self, "Merged results are exact -> Sampling cannot be combined with 'execute_merged'.")
+
+            inputs = list(inputs)
+            start_time = perf_counter()
+            partials = [[] for _ in self._waypoints]
+            metadata: Dict[str, Any] = {}
+
+            for outcomes in self._dispatch(inputs, merge=True):
+                for index, reader_metadata, _, payload, _, _ in outcomes:
+                    if index is None:
+                        for partial, frames in zip(partials, payload):
+                            partial.extend(frame_from_ipc(frame) for frame in frames)
+                    elif reader_metadata is None:
+                        raise ConduitExecutionError(
+                            self, f"Input: {self._source_name(inputs[index])} failed - {payload}"
+                        )
+                    else:
+                        metadata = reader_metadata
+
+            frames = [waypoint._merge(partial) for waypoint, partial in zip(self._waypoints, partials)]
+
+            return self._finalize(
+                f"<{len(inputs)} inputs>", metadata, frames, perf_counter() - start_time
+            )
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+# Internal Helper-methods --------------------------------------------------
+
+    def _dispatch(self, inputs: List[InputType], merge: bool) -> Iterable[List[Tuple[Any, ...]]]:
+        executor = self._acquire_executor()
+        indexed = list(enumerate(inputs))
+        chunksize = self._chunksize or max(1, ceil(len(indexed) / (self._max_workers * 4)))
+
+        futures = [
+            executor.submit(_execute_shard, indexed[start:start + chunksize], merge)
+            for start in range(0, len(indexed), chunksize)
+        ]
+
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _acquire_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # The built plan is pickled once and handed to every worker at pool start -> Never per task.
+            # Execution options travel along -> Every worker enforces the same severity, sampling, engine and memory budget.
+            options = {
+                "severity": next(name for name, level in error_severity_list.items() if level == self._severity),
+                "engine": self._engine,
+                "memory_budget": self._memory_budget,
+                "memory_policy": self._memory_policy,
+                "scratch_dir": self._scratch_dir,
+                "sampling": self._sampling,
+                "sample_rows": self._sample_rows,
+                "seed": self._seed,
+            }
+            payload = pickle.dumps((self._reader, self._schema, self._waypoints, options))
+
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context(self._mp_context),
+                initializer=_initialize_worker,
+                initargs=(payload,),
+            )
+
+            self._logger.info("Conduit: %s started %s worker process(es).", type(self).__name__, self._max_workers)
+
+        return self._executor
+
+# Class __dunder__-methods --------------------------------------------------
+
+    def __enter__(self) -> "ProcessConduit":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
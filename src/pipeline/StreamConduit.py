@@ -0,0 +1,475 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import polars as pl
+
+from src.pipeline.BaseConduit import BaseConduit
+from src.waypoints.BasePoint import BasePoint
+from src.typings import ConduitResult, AggregateRequest
+from src.utility import DistinctFilter, aggregate_merge_list, retrieve_aggregate_merge, retrieve_aggregate_partition
+from src.errors import ConduitBuildError, ConduitExecutionError, ConduitMemoryError
+
+from typing import List, Union, Optional, Dict, Tuple, Iterator, Any
+from io import BytesIO
+from pathlib import Path
+from threading import Event
+from time import perf_counter, monotonic, sleep
+from os import PathLike, fspath, stat
+
+# ---------------------------------------------------------------
+# STREAM BATCHES & CURSOR
+# ---------------------------------------------------------------
+
+class _BufferBatch(BytesIO):
+    # Header plus complete lines tailed from a growing file -> Read like any in-memory input.
+
+    def __init__(self, payload: bytes, source: str, rows: int, offset: int):
+        super().__init__(payload)
+        self.stream_source = source
+        self.rows = rows
+        self.offset = offset    # End of the batch within the tailed file -> Resume point once validated.
+
+class _FileBatch(list):
+    # Settled files from a landing directory -> Scanned together as one multi-file input.
+
+    def __init__(self, files: List[str], source: str):
+        super().__init__(files)
+        self.stream_source = source
+        self.rows = None
+        self.offset = None
+
+class _StreamCursor():
+
+    __slots__ = ("source", "identity", "offset", "header", "seen", "pending", "batches", "rows")
+
+    def __init__(self, source: str):
+        self.source: str                                = source
+        self.identity: Optional[Tuple[int, int]]        = None      # (st_dev, st_ino) of the tailed file.
+        self.offset: int                                = 0
+        self.header: Optional[bytes]                    = None
+        self.seen: Dict[str, Tuple[int, int]]           = {}        # Landing files already validated -> (Size, mtime).
+        self.pending: Dict[str, Tuple[int, int]]        = {}        # Observed once -> Validated once unchanged.
+        self.batches: int                               = 0
+        self.rows: int                                  = 0
+
+# ---------------------------------------------------------------
+# STREAM CONDUIT CLASS
+# ---------------------------------------------------------------
+
+class StreamConduit(BaseConduit):
+
+    __slots__ = (
+        "_batch_rows",
+        "_batch_window",
+        "_batch_bytes",
+        "_poll_interval",
+        "_distinct_capacity",
+        "_distinct_error",
+        "_states",
+        "_distinct",
+        "_cursor",
+    )
+
+    def __init__(
+        self,
+        reader = None,
+        schema = None,
+        waypoints = None,
+        factories = None,
+        verbosity = 1,
+        severity: str = "error",
+        batch_rows: Optional[int] = 50_000,
+        batch_window: Optional[float] = 5.0,
+        batch_bytes: int = 64 * 1024 * 1024,
+        poll_interval: float = 0.5,
+        distinct_capacity: int = 1_000_000,
+        distinct_error: float = 0.001,
+        **base_kwargs,
+    ):
+        if batch_rows is None and batch_window is None:
+            raise ValueError("Micro-batches need a row count, a time window or both - Recieved neither")
+
+        if (batch_rows is not None and batch_rows < 1) or batch_bytes < 1:
+            raise ValueError(f"Batch rows and bytes must be positive integers - Recieved {batch_rows} and {batch_bytes}")
+
+        super().__init__(reader, schema, waypoints, factories, severity=severity, verbosity=verbosity, **base_kwargs)
+
+        self._batch_rows: Optional[int]                     = batch_rows
+        self._batch_window: Optional[float]                 = batch_window
+        self._batch_bytes: int                              = batch_bytes      # Upper bound on buffered input -> Bounded memory.
+        self._poll_interval: float                          = poll_interval
+        self._distinct_capacity: int                        = distinct_capacity
+        self._distinct_error: float                         = distinct_error
+        self._states: Optional[List[Optional[pl.DataFrame]]] = None             # Running Waypoint frames across batches.
+        self._distinct: Dict[str, DistinctFilter]           = {}                # Distinct-count aliases -> Bounded key filters.
+        self._cursor: Optional[_StreamCursor]               = None
+
+# Class Properties --------------------------------------------------
+
+    @property
+    def batches(self) -> int:
+        return self._cursor.batches if self._cursor is not None else 0
+
+    @property
+    def rows(self) -> int:
+        return self._cursor.rows if self._cursor is not None else 0
+
+# Core Class Operations --------------------------------------------------
+
+    def build(self, input: Union[str, PathLike] = None) -> None:
+        unfoldable = [type(waypoint).__name__ for waypoint in self._waypoints if not self._foldable(waypoint)]
+
+        if unfoldable:
+            raise ConduitBuildError(self, f"Waypoints cannot carry state across batches: {unfoldable}")
+
+        if self._sampling is not None:
+            raise ConduitBuildError(self, "Running states are exact -> Sampling cannot be combined with streaming.")
+
+        if input is not None and Path(input).is_dir():
+            # Landing directories -> The Reader's Schema is resolved from the oldest file already present.
+            files = self._listing(fspath(input))
+            input = str(Path(input) / next(iter(files))) if files else None
+
+        super().build(input=input)
+
+        self._distinct = {
+            request.alias: DistinctFilter(capacity=self._distinct_capacity, error_rate=self._distinct_error)
+            for request in self._layout.requests
+            if retrieve_aggregate_partition(request) is not None
+        }
+
+    def execute(self, input: Union[str, PathLike]) -> ConduitResult:
+        if self._assert_built():
+            result = None
+
+            # Everything available right now, in micro-batches -> The last batch carries the running verdict.
+            for result in self.stream(input, follow=False):
+                pass
+
+            if result is None:
+                # Nothing new since the last batch -> Re-validate the stored running state.
+                frames = self._states if self._states is not None else [None] * len(self._waypoints)
+                result = self._finalize(fspath(input), {}, frames, 0.0)
+
+            return result
+
+    def stream(
+        self,
+        input: Union[str, PathLike],
+        follow: bool = True,
+        max_batches: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+        stop: Optional[Event] = None,
+    ) -> Iterator[ConduitResult]:
+        if self._assert_built():
+            source = fspath(input)
+
+            if self._cursor is None or self._cursor.source != source:
+                self.reset()
+                self._cursor = _StreamCursor(source)
+
+            if Path(source).is_dir():
+                batches = self._watch(source, follow, idle_timeout, stop)
+            elif self._reader.LINE_DELIMITED:
+                batches = self._tail(source, follow, idle_timeout, stop)
+            else:
+                raise ConduitExecutionError(self, f"Reader: {type(self._reader).__name__} is not line-delimited -> Only landing directories can be streamed.")
+
+            try:
+                for emitted, batch in enumerate(batches, start=1):
+                    yield self._run_batch(batch)
+
+                    if max_batches is not None and emitted >= max_batches:
+                        return
+            finally:
+                batches.close()
+
+    def reset(self) -> None:
+        self._states = None
+        self._cursor = None
+
+        for distinct in self._distinct.values():
+            distinct.clear()
+
+    def get_state(self) -> Dict[str, Any]:
+        state = super().get_state()
+        state["stream"] = {
+            "source": self._cursor.source if self._cursor is not None else None,
+            "batches": self.batches,
+            "rows": self.rows,
+            "offset": self._cursor.offset if self._cursor is not None else 0,
+            "distinct_bytes": sum(distinct.nbytes for distinct in self._distinct.values()),
+        }
+
+        return state
+
+# Internal Helper-methods --------------------------------------------------
+
+    def _run_batch(self, batch: Union[_BufferBatch, _FileBatch]) -> ConduitResult:
+        start_time = perf_counter()
+        cursor = self._cursor
+
+        ledger = self._open_ledger()
+
+        with self._tracer.span("conduit.execute", conduit=type(self).__name__, batch=cursor.batches + 1) as trace:
+            try:
+                result, frames, _, _ = self._collect(batch, ledger)
+                rows = batch.rows if batch.rows is not None else self._counted_rows(frames)
+
+                self._observe_distinct(batch)
+                states = self._states or [None] * len(frames)
+                self._states = [
+                    self._fold(waypoint, state, frame)
+                    for waypoint, state, frame in zip(self._waypoints, states, frames)
+                ]
+            except ConduitMemoryError:
+                self._logger.error("Conduit: %s refused a batch exceeding its memory budget.", type(self).__name__)
+                raise
+            except Exception as err:
+                self._logger.error("Conduit: %s execution was unsuccessful.", type(self).__name__)
+                raise ConduitExecutionError(self, f"Input: {cursor.source} batch {cursor.batches + 1} failed - {err}") from err
+
+            cursor.batches += 1
+            cursor.rows += max(rows, 0)
+            conduit_result = self._finalize(batch, result.metadata, self._states, perf_counter() - start_time)
+            conduit_result.metadata["stream"] = {
+                "batch": cursor.batches,
+                "rows": rows,
+                "total_rows": cursor.rows,
+                "files": len(batch) if isinstance(batch, _FileBatch) else None,
+                "offset": batch.offset,
+                "distinct_saturated": any(distinct.saturated for distinct in self._distinct.values()),
+            }
+
+        return self._attach_trace(self._attach_memory(conduit_result, ledger), trace)
+
+    def _compile_stages(self, costs: Tuple[str, ...], slots: List[int]) -> Tuple[Tuple[str, Tuple[int, ...]], ...]:
+        # Every batch is folded into the running states -> Each plan runs on every batch, so stages never abort early.
+        return (("full", tuple(range(len(costs)))),)
+
+    def _tail(self, path: str, follow: bool, idle_timeout: Optional[float], stop: Optional[Event]) -> Iterator[_BufferBatch]:
+        buffer, rows, started, idle_since = bytearray(), 0, None, monotonic()
+
+        while True:
+            chunk = self._read_tail(path)
+
+            if chunk:
+                buffer += chunk
+                rows += chunk.count(b"\n")
+                started = started if started is not None else monotonic()
+                idle_since = monotonic()
+
+            # Full batches leave as soon as they are complete -> At most 'batch_bytes' (Plus one read) stay buffered.
+            while buffer and ((self._batch_rows is not None and rows >= self._batch_rows) or len(buffer) >= self._batch_bytes):
+                cut, lines = self._split(buffer, rows)
+                yield _BufferBatch(self._cursor.header + bytes(buffer[:cut]), path, lines, self._cursor.offset - len(buffer) + cut)
+
+                del buffer[:cut]
+                rows -= lines
+                started = monotonic() if buffer else None
+
+            expired = started is not None and self._batch_window is not None and monotonic() - started >= self._batch_window
+
+            if buffer and (expired or (not chunk and not follow)):
+                yield _BufferBatch(self._cursor.header + bytes(buffer), path, rows, self._cursor.offset)
+                buffer, rows, started = bytearray(), 0, None
+
+            if chunk:
+                continue    # Drain what is already written before waiting for more.
+
+            if not follow or self._halted(idle_since, idle_timeout, stop):
+                return
+
+    def _read_tail(self, path: str) -> bytes:
+        cursor = self._cursor
+
+        try:
+            status = stat(path)
+        except FileNotFoundError:
+            return b""      # Not created yet, or mid-rotation -> Polled again.
+
+        if cursor.identity != (status.st_dev, status.st_ino) or status.st_size < cursor.offset:
+            if cursor.identity is not None:
+                # Rotated or truncated -> The new content is read from its start; running states carry on.
+                self._logger.info("Input: %s was rotated or truncated -> Tailing from the start.", path)
+
+            cursor.identity, cursor.offset, cursor.header = (status.st_dev, status.st_ino), 0, None
+
+        if status.st_size == cursor.offset:
+            return b""
+
+        with open(path, "rb") as file:
+            if cursor.header is None:
+                lines = [file.readline() for _ in range(self._reader._header_lines())]
+
+                if any(not line.endswith(b"\n") for line in lines):
+                    return b""      # Header still being written.
+
+                cursor.header = b"".join(lines)
+                cursor.offset = len(cursor.header)
+
+            file.seek(cursor.offset)
+            chunk = file.read(self._batch_bytes)
+
+        # Only complete lines are consumed -> A partially written trailing record waits for the next poll.
+        complete = chunk.rfind(b"\n") + 1
+
+        if complete == 0 and len(chunk) >= self._batch_bytes:
+            raise ConduitExecutionError(self, f"Input: {path} holds a line longer than batch_bytes ({self._batch_bytes}).")
+
+        cursor.offset += complete
+        return chunk[:complete]
+
+    def _split(self, buffer: bytearray, rows: int) -> Tuple[int, int]:
+        # Cut after 'batch_rows' lines, or the last complete line within 'batch_bytes' -> Whichever comes first.
+        limit = min(len(buffer), self._batch_bytes)
+        lines = min(rows, self._batch_rows) if self._batch_rows is not None else rows
+        cut = 0
+
+        for counted in range(lines):
+            position = buffer.find(b"\n", cut, limit)
+
+            if position < 0:
+                return cut, counted
+
+            cut = position + 1
+
+        return cut, lines
+
+    def _watch(self, directory: str, follow: bool, idle_timeout: Optional[float], stop: Optional[Event]) -> Iterator[_FileBatch]:
+        cursor = self._cursor
+        ready: Dict[str, Tuple[int, int]] = {}
+        started, idle_since = None, monotonic()
+
+        while True:
+            listing = self._listing(directory)
+
+            # Files that vanished are forgotten -> Landing directories that are cleaned keep the cursor bounded.
+            cursor.seen = {name: identity for name, identity in cursor.seen.items() if name in listing}
+
+            for name, identity in listing.items():
+                # Unchanged across two polls -> A file still being written is never validated half-way.
+                if name not in cursor.seen and name not in ready and (not follow or cursor.pending.get(name) == identity):
+                    ready[name] = identity
+
+            cursor.pending = {name: identity for name, identity in listing.items() if name not in cursor.seen}
+
+            if ready:
+                started = started if started is not None else monotonic()
+                idle_since = monotonic()
+
+            expired = started is not None and (self._batch_window is None or monotonic() - started >= self._batch_window)
+
+            if ready and (expired or not follow or self._ready_bytes(ready) >= self._batch_bytes):
+                for files in self._group(directory, ready):
+                    yield _FileBatch(files, directory)
+
+                    for file in files:
+                        cursor.seen[Path(file).name] = ready[Path(file).name]
+
+                ready, started = {}, None
+
+            if not follow or self._halted(idle_since, idle_timeout, stop):
+                return
+
+    def _listing(self, directory: str) -> Dict[str, Tuple[int, int]]:
+        listing: Dict[str, Tuple[int, int]] = {}
+
+        for path in Path(directory).iterdir():
+            if path.name.startswith(".") or (self._reader.EXTENSIONS and path.suffix.lower() not in self._reader.EXTENSIONS):
+                continue    # Hidden (Temporary) files and foreign formats are never picked up.
+
+            try:
+                status = path.stat()
+            except FileNotFoundError:
+                continue
+
+            if path.is_file():
+                listing[path.name] = (status.st_size, status.st_mtime_ns)
+
+        # Arrival (mtime) order -> Ties broken by name for a deterministic batch layout.
+        return dict(sorted(listing.items(), key=lambda item: (item[1][1], item[0])))
+
+    def _group(self, directory: str, ready: Dict[str, Tuple[int, int]]) -> Iterator[List[str]]:
+        # Arrival order, split so no batch exceeds 'batch_bytes' -> A single larger file still forms its own batch.
+        files, size = [], 0
+
+        for name, (length, _) in sorted(ready.items(), key=lambda item: (item[1][1], item[0])):
+            if files and size + length > self._batch_bytes:
+                yield files
+                files, size = [], 0
+
+            files.append(str(Path(directory) / name))
+            size += length
+
+        if files:
+            yield files
+
+    @staticmethod
+    def _ready_bytes(ready: Dict[str, Tuple[int, int]]) -> int:
+        return sum(size for size, _ in ready.values())
+
+    def _halted(self, idle_since: float, idle_timeout: Optional[float], stop: Optional[Event]) -> bool:
+        if idle_timeout is not None and monotonic() - idle_since >= idle_timeout:
+            return True
+
+        if stop is not None:
+            return stop.wait(self._poll_interval)   # Doubles as the poll sleep -> Setting it wakes the stream at once.
+
+        sleep(self._poll_interval)
+        return False
+
+    def _observe_distinct(self, batch: Union[_BufferBatch, _FileBatch]) -> None:
+        if not self._distinct:
+            return
+
+        requests = [request for request in self._layout.requests if request.alias in self._distinct]
+        lf = self._reader.execute(batch).frame      # Second lazy scan of the batch -> Only the key columns are read.
+
+        # Key hashes, de-duplicated within the batch -> Only the filter remembers keys across batches.
+        for request, keys in zip(requests, pl.collect_all([lf.select(self._distinct_key(request).unique()) for request in requests])):
+            self._distinct[request.alias].add(keys.to_series().to_numpy())
+
+    @staticmethod
+    def _distinct_key(request: AggregateRequest) -> pl.Expr:
+        return pl.struct(list(retrieve_aggregate_partition(request))).hash(seed=0)
+
+    def _fold(self, waypoint: BasePoint, state: Optional[pl.DataFrame], frame: Optional[pl.DataFrame]) -> Optional[pl.DataFrame]:
+        if frame is None:
+            return state
+
+        requests = {request.alias: request for request in waypoint._requests()}
+
+        if not requests:
+            return frame if state is None else waypoint._merge([state, frame])
+
+        # Mergeable aggregates combine with the running row -> Distinct counts come from the key filters instead.
+        combined = frame if state is None else pl.concat([state, frame], how="vertical_relaxed")
+
+        return combined.select(
+            pl.lit(self._distinct[alias].count).cast(frame.schema[alias]).alias(alias)
+            if alias in self._distinct else retrieve_aggregate_merge(requests[alias])
+            for alias in frame.columns
+        )
+
+    @staticmethod
+    def _foldable(waypoint: BasePoint) -> bool:
+        if waypoint.is_mergeable:
+            return True
+
+        requests = waypoint._requests()
+
+        return bool(requests) and all(
+            request.kind in aggregate_merge_list or retrieve_aggregate_partition(request) is not None
+            for request in requests
+        )
+
+    @staticmethod
+    def _counted_rows(frames: List[Optional[pl.DataFrame]]) -> int:
+        return next((frame["len:*"].item() for frame in frames if frame is not None and "len:*" in frame.columns), -1)
+
+    @staticmethod
+    def _source_name(input: Any) -> str:
+        source = getattr(input, "stream_source", None)
+        return source if source is not None else BaseConduit._source_name(input)
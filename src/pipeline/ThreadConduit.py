@@ -2,14 +2,13 @@
 # IMPORTS
 # ---------------------------------------------------------------
 
-import typing
-
 from src.pipeline.BaseConduit import BaseConduit
+from src.typings import ConduitResult, InputType
 
-from typing import List, Union, Optional
-from abc import ABC, abstractmethod
-from dataclasses import field
-from datetime import datetime, timezone
+from typing import List, Iterable, Iterator, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
+from os import cpu_count
 
 # ---------------------------------------------------------------
 # MULTI-THREADED CONDUIT CLASS
@@ -17,11 +16,64 @@ from datetime import datetime, timezone
 
 class ThreadConduit(BaseConduit):
 
-    __slots__ = ()
+    __slots__ = ("_max_workers",)
+
+    def __init__(
+        self,
+        reader = None,
+        schema = None,
+        waypoints = None,
+        factories = None,
+        verbosity = 1,
+        max_workers: Optional[int] = None,
+        **base_kwargs,
+    ):
+        super().__init__(reader, schema, waypoints, factories, verbosity=verbosity, **base_kwargs)
+
+        self._max_workers: Optional[int] = max_workers
+
+    def execute(self, input: InputType) -> ConduitResult:
+        if self._assert_built():
+            return self._run(input)
+
+    def execute_many(self, inputs: Iterable[InputType]) -> List[ConduitResult]:
+        if self._assert_built():
+            # Polars releases the GIL while collecting -> Threads overlap I/O and query execution.
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                return list(executor.map(self._run, inputs))
+
+    def execute_unordered(
+        self,
+        inputs: Iterable[InputType],
+        return_exceptions: bool = False,
+    ) -> Iterator[Tuple[int, Union[ConduitResult, Exception]]]:
+        if self._assert_built():
+            workers = self._max_workers or min(32, (cpu_count() or 1) + 4)
+            pending = iter(enumerate(inputs))
+
+            # Bounded submission window -> Results stream out while the remaining inputs are still lazy.
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(self._run, input): index for index, input in islice(pending, workers * 2)}
+
+                try:
+                    while futures:
+                        done, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+                        for future in done:
+                            index = futures.pop(future)
+
+                            for next_index, input in islice(pending, 1):
+                                futures[executor.submit(self._run, input)] = next_index
 
-    def __init__(self, reader = None, schema = None, waypoints = ..., factories = ..., verbosity = 1):
-        super().__init__(reader, schema, waypoints, factories, verbosity)
+                            try:
+                                result = future.result()
+                            except Exception as err:
+                                if not return_exceptions:
+                                    raise
+                                result = err
 
-    @typing.Override
-    def execute(self):
-        pass
\ No newline at end of file
+                            yield index, result
+                finally:
+                    # Closed early (e.g. fail-fast) -> Queued inputs are dropped, running ones finish.
+                    for future in futures:
+                        future.cancel()
@@ -2,14 +2,42 @@
 # IMPORTS
 # ---------------------------------------------------------------
 
-from .BaseConduit import BaseConduit
+from src.utility.lazy_loader import lazy_package
+
+from typing import TYPE_CHECKING
+
+# Type checkers see the eager imports -> At runtime each export is imported on first access.
+if TYPE_CHECKING:
+    from .BaseConduit import BaseConduit
+    from .Conduit import Conduit
+    from .ThreadConduit import ThreadConduit
+    from .AsyncConduit import AsyncConduit
+    from .ProcessConduit import ProcessConduit
+    from .IncrementalConduit import IncrementalConduit
+    from .StreamConduit import StreamConduit
 
 # ---------------------------------------------------------------
 # PACKAGE MANAGEMENT
 # ---------------------------------------------------------------
 
 __all__ = [
-    "BaseConduit"
+    "BaseConduit",
+    "Conduit",
+    "ThreadConduit",
+    "AsyncConduit",
+    "ProcessConduit",
+    "IncrementalConduit",
+    "StreamConduit"
 ]
+
+lazy_package(__name__, {
+    "BaseConduit": "src.pipeline.BaseConduit",
+    "Conduit": "src.pipeline.Conduit",
+    "ThreadConduit": "src.pipeline.ThreadConduit",
+    "AsyncConduit": "src.pipeline.AsyncConduit",
+    "ProcessConduit": "src.pipeline.ProcessConduit",
+    "IncrementalConduit": "src.pipeline.IncrementalConduit",
+    "StreamConduit": "src.pipeline.StreamConduit",
+})
 __version__ = "0.0.1"
-__author__ = "HysingerDev"
\ No newline at end of file
+__author__ = "HysingerDev"
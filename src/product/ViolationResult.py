@@ -0,0 +1,93 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import polars as pl
+
+from src.product.ViolationMask import ViolationMask
+
+from typing import List, Optional, Dict, Iterable
+from functools import reduce
+from operator import or_, and_
+
+# ---------------------------------------------------------------
+# PRODUCT INSTANCE -> PER-WAYPOINT VIOLATION MASKS
+# ---------------------------------------------------------------
+
+class ViolationResult():
+
+    __slots__ = ("source", "masks", "_frame")
+
+    ROW_INDEX = "row_index"
+
+    def __init__(
+        self,
+        source: str,
+        masks: Dict[str, ViolationMask],
+        frame: pl.LazyFrame,
+    ):
+        self.source: str                        = source
+        self.masks: Dict[str, ViolationMask]    = masks
+        self._frame: pl.LazyFrame               = frame     # The Reader's scan -> Rows are only read on demand.
+
+# Class Properties --------------------------------------------------
+
+    @property
+    def waypoints(self) -> List[str]:
+        return list(self.masks.keys())
+
+    @property
+    def nbytes(self) -> int:
+        return sum(mask.nbytes for mask in self.masks.values())
+
+# Core Class Operations --------------------------------------------------
+
+    def union(self, waypoints: Optional[Iterable[str]] = None) -> Optional[ViolationMask]:
+        masks = self._select(waypoints)
+        return reduce(or_, masks) if masks else None
+
+    def intersection(self, waypoints: Optional[Iterable[str]] = None) -> Optional[ViolationMask]:
+        masks = self._select(waypoints)
+        return reduce(and_, masks) if masks else None
+
+    def counts(self) -> Dict[str, int]:
+        return {waypoint: mask.count for waypoint, mask in self.masks.items()}
+
+    def materialize(
+        self,
+        n: int = 100,
+        waypoints: Optional[Iterable[str]] = None,
+        mask: Optional[ViolationMask] = None,
+    ) -> pl.DataFrame:
+        mask = mask if mask is not None else self.union(waypoints)
+        rows = mask.indices(limit=n) if mask is not None else []
+
+        if not len(rows):
+            return self._frame.head(0).with_row_index(self.ROW_INDEX).collect()
+
+        # Slice to the last requested row before filtering -> The scan stops early instead of reading the whole input.
+        return (
+            self._frame.head(int(rows[-1]) + 1)
+            .with_row_index(self.ROW_INDEX)
+            .filter(pl.col(self.ROW_INDEX).is_in(pl.Series(rows, dtype=pl.get_index_type())))
+            .collect()
+        )
+
+# Internal Helper-methods --------------------------------------------------
+
+    def _select(self, waypoints: Optional[Iterable[str]]) -> List[ViolationMask]:
+        if waypoints is None:
+            return list(self.masks.values())
+
+        return [self.masks[waypoint] for waypoint in waypoints]
+
+# Class __dunder__-methods --------------------------------------------------
+
+    def __getitem__(self, waypoint: str) -> ViolationMask:
+        return self.masks[waypoint]
+
+    def __len__(self) -> int:
+        return len(self.masks)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} - Source={self.source}, Waypoints={self.counts()}>"
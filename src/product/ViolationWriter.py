@@ -0,0 +1,124 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import polars as pl
+
+from src.utility import retrieve_violation_format, get_class_logger, ClassLogger
+
+from typing import List, Union, Optional, Dict, Any, Tuple
+from itertools import count
+from pathlib import Path
+from os import PathLike
+from re import sub
+
+# ---------------------------------------------------------------
+# PRODUCT INSTANCE -> COLUMNAR VIOLATION REPORTS
+# ---------------------------------------------------------------
+
+class ViolationWriter():
+
+    __slots__ = (
+        "directory",
+        "format",
+        "compression",
+        "_runs",
+        "_logger",
+    )
+
+    SCHEMA = pl.Schema({
+        "row_index": pl.UInt64,
+        "waypoint": pl.String,
+        "column": pl.String,
+        "value": pl.String,
+    })
+
+    def __init__(
+        self,
+        directory: Union[str, PathLike],
+        format: str = "parquet",
+        compression: str = "zstd",
+        verbosity: int = 0,
+    ):
+        self.directory: Path        = Path(directory)
+        self.format: str            = retrieve_violation_format(input=format)
+        self.compression: str       = compression
+        self._runs: count           = count()   # 'next' is atomic -> Concurrent Conduit runs never share a file.
+        self._logger: ClassLogger   = get_class_logger(self.__class__, verbosity)
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+# Core Class Operations --------------------------------------------------
+
+    def write(self, source: str, violations: List[Tuple[str, pl.LazyFrame]]) -> Dict[str, Any]:
+        path, plan = self._to_plan(source, violations)
+        plan.collect(engine="streaming")
+
+        return self._report(path)
+
+    def scan(self) -> pl.LazyFrame:
+        files = sorted(self.directory.glob(f"violations-*.{self._extension()}"))
+
+        if not files:
+            return pl.LazyFrame(schema=self.SCHEMA)
+
+        return pl.concat([self._scan(file) for file in files], how="vertical")
+
+# Internal Helper-methods --------------------------------------------------
+
+    # A lazy sink -> Collected on its own by 'write', or inside a Conduit's validation query (Same scan).
+    def _to_plan(self, source: str, violations: List[Tuple[str, pl.LazyFrame]]) -> Tuple[Path, pl.LazyFrame]:
+        path = self.directory / f"violations-{next(self._runs):06d}-{self._stem(source)}.{self._extension()}"
+
+        records = pl.concat(
+            [
+                frame.select(
+                    "row_index",
+                    pl.lit(waypoint, dtype=pl.String).alias("waypoint"),
+                    "column",
+                    "value",
+                )
+                for waypoint, frame in violations
+            ],
+            how="vertical",
+        ) if violations else pl.LazyFrame(schema=self.SCHEMA)
+
+        # Sinks stream record batches straight to disk -> Millions of violations never sit in memory at once.
+        if self.format == "parquet":
+            return path, records.sink_parquet(path, compression=self.compression, lazy=True)
+
+        return path, records.sink_ipc(path, compression=self.compression, lazy=True)
+
+    # Staged sinks run before any verdict -> A report without records is removed again.
+    def _complete(self, path: Path) -> Optional[Dict[str, Any]]:
+        report = self._report(path)
+
+        if not report["rows"]:
+            self._discard(path)
+            return None
+
+        return report
+
+    def _discard(self, path: Path) -> None:
+        path.unlink(missing_ok=True)
+
+    def _report(self, path: Path) -> Dict[str, Any]:
+        rows = self._scan(path).select(pl.len()).collect().item()     # Footer/metadata only.
+        self._logger.info("Violation report: %s written with %s record(s).", path, rows)
+
+        return {"path": str(path), "format": self.format, "rows": rows}
+
+    def _scan(self, path: Path) -> pl.LazyFrame:
+        return pl.scan_parquet(path) if self.format == "parquet" else pl.scan_ipc(path)
+
+    def _extension(self) -> str:
+        return "parquet" if self.format == "parquet" else "arrow"
+
+    @staticmethod
+    def _stem(source: str) -> str:
+        return sub(r"[^A-Za-z0-9_.-]+", "_", Path(source).stem)[:64] or "input"
+
+# Class __dunder__-methods --------------------------------------------------
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} - Directory={self.directory}, Format={self.format}>"
@@ -2,12 +2,30 @@
 # IMPORTS
 # ---------------------------------------------------------------
 
+from src.utility.lazy_loader import lazy_package
+
+from typing import TYPE_CHECKING
+
+# Type checkers see the eager imports -> At runtime each export is imported on first access.
+if TYPE_CHECKING:
+    from src.product.ViolationWriter import ViolationWriter
+    from src.product.ViolationMask import ViolationMask
+    from src.product.ViolationResult import ViolationResult
+
 # ---------------------------------------------------------------
 # PACKAGE MANAGEMENT
 # ---------------------------------------------------------------
 
 __all__ = [
-    
+    "ViolationWriter",
+    "ViolationMask",
+    "ViolationResult"
 ]
+
+lazy_package(__name__, {
+    "ViolationWriter": "src.product.ViolationWriter",
+    "ViolationMask": "src.product.ViolationMask",
+    "ViolationResult": "src.product.ViolationResult",
+})
 __version__ = "0.0.1"
 __author__ = "HysingerDev"
\ No newline at end of file
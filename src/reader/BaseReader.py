@@ -4,15 +4,20 @@
 
 import polars as pl
 
-from src.typings import ReaderConfig, ReaderPlan, ReaderResult, InputType
-from src.errors import ReaderSchemaError, ReaderBuildError
-from src.utility.setup_logger import get_class_logger
-
-from typing import Tuple, Any, Dict, Hashable
+from src.typings import ReaderConfig, ReaderPlan, ReaderResult, InputType, SchemaCompatibility, UnifiedSchema
+from src.errors import ReaderSchemaError, ReaderBuildError, ReaderExecutionError
+from src.schema.SchemaUnifier import SchemaUnifier, DEFAULT_UNIFIER
+from src.storage.Fingerprinter import DEFAULT_FINGERPRINTER
+from src.utility.setup_logger import get_class_logger, ClassLogger
+from src.telemetry import span
+
+from typing import List, Tuple, Any, Dict, Hashable, Optional
 from abc import abstractmethod
+from hashlib import blake2b
+from pathlib import Path
+from os import PathLike, fspath
 from datetime import datetime
 from time import perf_counter
-from logging import Logger
 
 # ---------------------------------------------------------------
 # BASEREADER CLASS -> ABSTRACTION
@@ -26,19 +31,29 @@ class BaseReader():
         "_schema",
         "_infer_schema",
         "_infer_rows",
+        "_unify_schema",
+        "_unifier",
+        "_unified",
         "_logger")
 
+    ROW_GROUPS: bool = False    # Format stores independently readable row groups -> Slices skip unread data.
+    LINE_DELIMITED: bool = False    # One record per line -> Appended bytes can be parsed on their own.
+    EXPANSION: float = 1.0          # Rough in-memory bytes per input byte -> Used to check memory budgets before a run.
+    EXTENSIONS: Tuple[str, ...] = ()    # File suffixes picked up from a directory input -> Empty accepts every file.
+
     def __init__(
         self,
         schema: Dict[str, pl.DataType] | pl.Schema = None,
         infer_schema: bool = False,
         infer_rows: int = 100,
+        unify_schema: bool = False,
+        unifier: Optional[SchemaUnifier] = None,
         verbosity: int = 0
     ) -> None:
         if isinstance(schema, dict):
             schema = pl.Schema(schema=schema)
 
-        if schema is None and not infer_schema:
+        if schema is None and not (infer_schema or unify_schema):
             raise ValueError(f"Please provide either an explicit polars.Schema or enable infer_schema - Not both!")
 
         self._config: ReaderConfig   = self._materialize_config()
@@ -46,7 +61,10 @@ class BaseReader():
         self._schema: pl.Schema      = schema
         self._infer_schema: bool     = infer_schema
         self._infer_rows: int        = infer_rows              
-        self._logger: Logger         = get_class_logger(self.__class__, verbosity)
+        self._unify_schema: bool     = unify_schema             # Directory/list inputs -> One supertype Schema.
+        self._unifier: SchemaUnifier = unifier if unifier is not None else DEFAULT_UNIFIER
+        self._unified: Optional[UnifiedSchema] = None
+        self._logger: ClassLogger    = get_class_logger(self.__class__, verbosity)
 
 # Class Properties --------------------------------------------------
     
@@ -73,9 +91,13 @@ class BaseReader():
     def column_types(self) -> Dict[str, pl.DataType]:
         return dict(self._schema) if self._built else {}
     
+    @property
+    def unified(self) -> Optional[UnifiedSchema]:
+        return self._unified
+
     @property
     def requires_input(self):
-        return self._schema is None and self._infer_schema
+        return (self._schema is None and self._infer_schema) or self._unify_schema
 
     @property
     def is_built(self) -> bool:
@@ -91,34 +113,47 @@ class BaseReader():
     def _materialize_config(self) -> ReaderConfig:
         pass
 
+    # Leading lines every parsable chunk must start with (e.g. a CSV header) -> Zero for most formats.
+    def _header_lines(self) -> int:
+        return 0
+
+    # A single file's Schema, as cheaply as the format allows (Metadata, header or sample) -> Overridden per format.
+    def _scan_schema(self, input: InputType) -> pl.Schema:
+        return self._to_lazyframe(input).collect_schema()
+
+    # What '_to_lazyframe' turns a file's own Schema into (Column selection, dtype overrides).
+    def _project_schema(self, schema: pl.Schema) -> pl.Schema:
+        return schema
+
 # Core Class Operations --------------------------------------------------
 
     def has_column(self, column: str) -> bool:
         if not self._built:
             # Ensure that the Reader-class is 'built'.
-            self._logger.info(f"Reader: {type(self).__name__} is not constructed!")
+            self._logger.info("Reader: %s is not constructed!", type(self).__name__)
             return False
         
         column = column.lower()     # Ensure strings are formatted consistently.
         if column in self._schema:
             # Determine if the specified column-string exists in Reader's Schema.
-            self._logger.info(f"Column: {column} found in Reader: {type(self).__name__}")
+            self._logger.info("Column: %s found in Reader: %s", column, type(self).__name__)
             return True
         
-        self._logger.info(f"Column: {column} not found in Reader: {type(self).__name__}")
+        self._logger.info("Column: %s not found in Reader: %s", column, type(self).__name__)
         return False        # DEFAULT -> Returns 'False' if nothing no column matched. 
     
     def build(self, input: InputType = None) -> None:
 
         if self._built:
             # If the Reader instance is already constructed return immediately.
-            self._logger(f"Reader: {type(self).__name__} is already constructed!")
+            self._logger.info("Reader: %s is already constructed!", type(self).__name__)
             return
         
-        self._schema = self._resolve_schema(input=input)    # Resolve the internal Schema.
+        with span("reader.resolve_schema", reader=type(self).__name__, inferred=self._schema is None):
+            self._schema = self._resolve_schema(input=input)    # Resolve the internal Schema.
         self._built = True                                  # Set Reader-intance as 'built'.
         self._logger.info(
-            f"Reader: {type(self).__name__} built successfully with schema: {self._schema}"
+            "Reader: %s built successfully with schema: %s", type(self).__name__, self._schema
         )
 
     def execute(self, input: InputType) -> ReaderResult:
@@ -127,21 +162,23 @@ class BaseReader():
             start_time = perf_counter()
 
             try:
-                lf = self._to_lazyframe(input)  # Convert input to Lazyframe
+                with span("reader.open", reader=type(self).__name__):
+                    lf = self._open(input)          # Convert input to Lazyframe
 
-                self._validate_schema(lf)       # Validate if the Lazyframe matches internal Schema. 
+                with span("reader.validate_schema", reader=type(self).__name__):
+                    self._validate_schema(lf)       # Validate if the Lazyframe matches internal Schema. 
             except Exception as err:
                 end_time = perf_counter()   
                 final_time = end_time - start_time  # Calculate execution time.
                 metadata = self._collect_metadata(input=input, time=final_time, success=False)  # Collect relevant metadata.
-                self._logger.error(f"Reader: {type(self).__name__} execution was unsuccessful.")
+                self._logger.error("Reader: %s execution was unsuccessful.", type(self).__name__)
                 raise err
 
             end_time = perf_counter()
             final_time = end_time - start_time      # Calculate execution time.
             metadata = self._collect_metadata(input=input, time=final_time, success=True)   # Collect relevant metadata.
 
-            self._logger.info(f"Reader: {type(self).__name__} executed successfully.")
+            self._logger.info("Reader: %s executed successfully.", type(self).__name__)
             return ReaderResult(
                 frame=lf,
                 schema=self._schema,
@@ -154,9 +191,24 @@ class BaseReader():
             lf: pl.LazyFrame = self.execute(input)
             df_summary: pl.DataFrame = lf.head(n=n).collect()
 
-            self._logger.info(f"Reader: {type(self).__name__} summary generated successfully.")
+            self._logger.info("Reader: %s summary generated successfully.", type(self).__name__)
         
             return df_summary
+
+    def fingerprint(self, input: InputType, mode: str = "cheap") -> str:
+        if self._assert_built():
+            # '_signature' covers type, config and Schema -> The data fingerprint completes a result cache key.
+            files = self._expand_input(input)
+            sources = [input] if files is None else files
+            hasher = blake2b(repr(self._signature()).encode("utf-8"), digest_size=16)
+
+            for source in sources:
+                if isinstance(source, (str, PathLike)):
+                    hasher.update(fspath(source).encode("utf-8"))
+
+                hasher.update(DEFAULT_FINGERPRINTER.fingerprint(source, mode).encode("utf-8"))
+
+            return hasher.hexdigest()
         
     def clone(self) -> "BaseReader":
 
@@ -169,6 +221,9 @@ class BaseReader():
         new_reader._built = self._built
         new_reader._infer_schema = self._infer_schema
         new_reader._infer_rows = self._infer_rows
+        new_reader._unify_schema = self._unify_schema
+        new_reader._unifier = self._unifier
+        new_reader._unified = self._unified
         new_reader._logger = self._logger
 
         return new_reader
@@ -177,6 +232,7 @@ class BaseReader():
         if self._assert_built():
             self._built = False
             self._schema = None
+            self._unified = None
     
 # Internal Helper-methods --------------------------------------------------
 
@@ -201,26 +257,88 @@ class BaseReader():
         return True
         
     def _resolve_schema(self, input: InputType) -> pl.Schema:
+        files = self._expand_input(input) if self._unify_schema else None
+
+        if files is not None:
+            # Every file's Schema is read concurrently (And cached) -> An explicit Schema becomes the unification target.
+            self._unified = self._unifier.unify(self, files, target=self._schema)
+            self._logger.info(
+                "Reader: %s unified %s file(s) - %s cast, %s incompatible.",
+                type(self).__name__, len(files), self._unified.count("cast"), self._unified.count("incompatible"),
+            )
+            return self._unified.schema
+
         if self._schema is not None:
             return self._schema
         
-        if self._infer_schema:
+        if self._infer_schema or self._unify_schema:
             return self._resolve_schema_from_sample(input=input)
 
         raise ReaderSchemaError(self, "No concrete Schema provided and schema inference disabled!")
     
     def _resolve_schema_from_sample(self, input: InputType) -> pl.Schema:
-        df = pl.scan_csv(
-            input,
-            n_rows=self._infer_rows,
-            infer_schema_length=self._infer_rows,
-            try_parse_dates=True
+        return self._project_schema(self._scan_schema(input))
+
+    def _expand_input(self, input: InputType) -> Optional[List[str]]:
+        if isinstance(input, (list, tuple)):
+            return [fspath(path) for path in input]
+
+        if isinstance(input, (str, PathLike)) and Path(input).is_dir():
+            return sorted(
+                str(path) for path in Path(input).iterdir()
+                if path.is_file() and (not self.EXTENSIONS or path.suffix.lower() in self.EXTENSIONS)
+            )
+
+        return None     # A single file or buffer.
+
+    def _open(self, input: InputType) -> pl.LazyFrame:
+        if not self._unify_schema:
+            return self._to_lazyframe(input)
+
+        files = self._expand_input(input)
+
+        if files is None:
+            return self._conform(input)
+
+        if not files:
+            raise ReaderExecutionError(self, f"Input: {fspath(input) if isinstance(input, (str, PathLike)) else input} holds no readable files.")
+
+        # One lazy scan per file, each conformed on its own -> Nothing is read twice and no file fails the whole set.
+        return pl.concat([self._conform(path) for path in files], how="vertical")
+
+    def _conform(self, input: InputType) -> pl.LazyFrame:
+        compatibility = self._compatibility(input)
+
+        if compatibility is None or compatibility.status == "exact":
+            return self._to_lazyframe(input)
+
+        if compatibility.status == "incompatible":
+            raise ReaderSchemaError(self, f"Input: {compatibility.source} cannot be unified - {compatibility.reason}")
+
+        # Missing columns become typed nulls, the rest are cast (No-op where equal) -> Lazily, per file.
+        return self._to_lazyframe(input).with_columns(
+            pl.lit(None, dtype=self._schema[column]).alias(column) for column in compatibility.missing
+        ).select(
+            pl.col(column).cast(dtype) for column, dtype in self._schema.items()
         )
 
-        return df.schema
+    def _compatibility(self, input: InputType) -> Optional[SchemaCompatibility]:
+        if not isinstance(input, (str, PathLike)) or self._schema is None:
+            return None     # Buffers carry no identity -> Read as-is and validated as before.
+
+        path = fspath(input)
+        known = self._unified.files.get(path) if self._unified is not None else None
+
+        return known if known is not None else self._unifier.compatibility(self, path, self._schema)
+
+    # The Schema a text format must parse this file with -> Its own, once unification decided how to conform it.
+    def _source_schema(self, input: InputType) -> Optional[pl.Schema]:
+        compatibility = self._compatibility(input) if self._unify_schema else None
+
+        return compatibility.schema if compatibility is not None else self._schema
         
     def _validate_schema(self, lf: pl.LazyFrame) -> None:
-        actual_schema: pl.Schema  = lf.schema
+        actual_schema: pl.Schema      = lf.collect_schema()
         expected_schema: pl.Schema    = self._schema
 
         missing_cols = expected_schema.keys() - actual_schema.keys()
@@ -228,15 +346,15 @@ class BaseReader():
         if missing_cols:
             raise ReaderSchemaError(self, f"Missins columns: {sorted(missing_cols)}")
         
-        for column, type in expected_schema.items():
+        for column, dtype in expected_schema.items():
             exp_type = actual_schema[column]
-            if exp_type != type:
+            if exp_type != dtype:
                 raise TypeError(
-                    f"Column: {column} has data type: {exp_type} - Expected type: {type}"
+                    f"Column: {column} has data type: {exp_type} - Expected type: {dtype}"
                 )
         
         self._logger.info(
-            f"Schema validation passed for reader: {type(self).__name__}."
+            "Schema validation passed for reader: %s.", type(self).__name__
         )
 
     def _collect_metadata(self, input: pl.LazyFrame, time: float, success: bool) -> Dict[str, Any]:
@@ -246,8 +364,13 @@ class BaseReader():
             "configuration": self._config,
             "schema": self._schema,
             "datetime": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            "exec_time": 0,
-            "success": True,
+            "exec_time": time,
+            "success": success,
+            "unified": {
+                "files": len(self._unified.files),
+                "cast": self._unified.count("cast"),
+                "incompatible": self._unified.count("incompatible"),
+            } if self._unified is not None else None,
         }
 
     def _signature(self) -> Hashable:
@@ -18,18 +18,21 @@ from src.errors import ReaderConfigError
 class CSVReader(BaseReader):
 
     __slots__ = (
-        "seperator",
+        "separator",
         "header",
         "skip_rows",
         "skip_lines",
         "encoding",
         "null_values",
-        "use_columnns",
+        "use_columns",
         "dtypes",
         "n_rows",
         "low_memory",
     )
 
+    LINE_DELIMITED = True
+    EXTENSIONS = (".csv", ".tsv", ".txt")
+
     def __init__(
         self,
         *,
@@ -39,7 +42,7 @@ class CSVReader(BaseReader):
         header: Optional[bool] = True,
         skip_rows: int = 0,
         skip_lines: int = 0,
-        encoding: str = "utf-8",
+        encoding: str = "utf8",
         null_values: Optional[List[str]] = None,
         use_columns: Optional[List[str]] = None,
         n_rows: Optional[int] = None,
@@ -49,14 +52,7 @@ class CSVReader(BaseReader):
         verbosity: int = 0,
         **base_kwargs,
     ):
-        super().__init__(
-            schema=schema,
-            infer_schema=infer_schema,
-            infer_rows=infer_rows,
-            verbosity=verbosity,
-            **base_kwargs
-        )
-
+        # Options are assigned first -> BaseReader materializes the configuration from them.
         self.separator = separator
         self.header = 0 if header else None
         self.skip_rows = skip_rows
@@ -68,6 +64,14 @@ class CSVReader(BaseReader):
         self.n_rows = n_rows
         self.low_memory = low_memory
 
+        super().__init__(
+            schema=schema,
+            infer_schema=infer_schema,
+            infer_rows=infer_rows,
+            verbosity=verbosity,
+            **base_kwargs
+        )
+
     # Convert and return the internal configuration -> Used for _signature (Hashing).
     def _materialize_config(self) -> ReaderConfig:
         return ReaderConfig(
@@ -85,6 +89,39 @@ class CSVReader(BaseReader):
             }
         )
 
+    # Skipped lines and the header must precede every appended chunk to parse it standalone.
+    def _header_lines(self) -> int:
+        return self.skip_rows + (1 if self.header is not None else 0)
+
+    # Header plus 'infer_rows' sampled rows -> Parsed with the Reader's own dialect.
+    def _scan_schema(self, input: InputType) -> pl.Schema:
+        return pl.scan_csv(
+            input,
+            separator=self.separator,
+            has_header=self.header is not None,
+            skip_rows=self.skip_rows,
+            skip_rows_after_header=self.skip_lines,
+            encoding=self.encoding,
+            null_values=self.null_values,
+            n_rows=self._infer_rows,
+            infer_schema_length=self._infer_rows,
+            try_parse_dates=True,
+        ).collect_schema()
+
+    def _project_schema(self, schema: pl.Schema) -> pl.Schema:
+        schema = self._apply_dtypes(schema)
+
+        if self.use_columns:
+            schema = pl.Schema({column: schema[column] for column in self.use_columns if column in schema})
+
+        return schema
+
+    def _apply_dtypes(self, schema: pl.Schema) -> pl.Schema:
+        if not isinstance(self.dtypes, dict):
+            return schema
+
+        return pl.Schema({**schema, **{column: dtype for column, dtype in self.dtypes.items() if column in schema}})
+
     # Utilise Polars to read specified Data -> Wrapped in ReaderResult-class and returned to Conduit. 
     def _to_lazyframe(self, input: InputType) -> LazyFrame:
 
@@ -95,26 +132,33 @@ class CSVReader(BaseReader):
                     f"Data types must be a Dict[str, polars.Datatype] - Recieved {type(self.dtypes)}"
                 )
             
-            dtypes = pl.Schema(self.dtypes)
+            overrides, schema = pl.Schema(self.dtypes), None
         else:
-            dtypes = self.schema
+            overrides, schema = None, self._source_schema(input)
+
+        if self._unify_schema:
+            # The file's own (Scanned) Schema with the overrides applied -> Conformed to the unified one afterwards.
+            overrides, schema = None, self._apply_dtypes(self._source_schema(input))
 
         lf = pl.scan_csv(
             input,
-            sep=self.separator,
+            separator=self.separator,
             has_header=self.header is not None,
             skip_rows=self.skip_rows,
             skip_rows_after_header=self.skip_lines,
             encoding=self.encoding,
             null_values=self.null_values,
-            columns=self.use_columns,
-            dtypes=dtypes,
+            schema=schema,
+            schema_overrides=overrides,
             n_rows=self.n_rows,
             try_parse_dates=False,
             low_memory=self.low_memory,
         )
 
-        self._logger.info(f"Data succesfully loaded into LazyFrame.")
+        if self.use_columns:
+            lf = lf.select(self.use_columns)
+
+        self._logger.info("Data succesfully loaded into LazyFrame.")
 
         return lf
 
@@ -0,0 +1,394 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import sqlite3
+import polars as pl
+
+from typing import List, Optional, Dict, Tuple, Any, Iterator, Sequence
+from polars.lazyframe import LazyFrame
+from polars.io.plugins import register_io_source
+from concurrent.futures import ThreadPoolExecutor, Future
+from contextlib import contextmanager
+from collections import deque
+from operator import itemgetter
+from threading import Lock, Semaphore
+from pathlib import Path
+from os import PathLike, fspath
+
+from src.reader import BaseReader
+from src.typings import ReaderConfig, InputType
+from src.errors import ReaderConfigError, ReaderSchemaError, ReaderExecutionError
+from src.utility import retrieve_sql_operator
+
+# ---------------------------------------------------------------
+# CONNECTION POOL -> READ-ONLY SQLITE CONNECTIONS
+# ---------------------------------------------------------------
+
+class _ConnectionPool():
+
+    __slots__ = ("uri", "_idle", "_opened", "_available", "_lock")
+
+    def __init__(self, path: str, size: int):
+        self.uri: str                           = f"{Path(path).resolve().as_uri()}?mode=ro"
+        self._idle: List[sqlite3.Connection]    = []
+        self._opened: List[sqlite3.Connection]  = []
+        self._available: Semaphore              = Semaphore(size)
+        self._lock: Lock                        = Lock()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        with self._available:
+            with self._lock:
+                connection = self._idle.pop() if self._idle else None
+
+            if connection is None:
+                # Opened on first demand -> Small tables never open more than one connection.
+                connection = sqlite3.connect(self.uri, uri=True, check_same_thread=False)
+
+                with self._lock:
+                    self._opened.append(connection)
+
+            try:
+                yield connection
+            finally:
+                with self._lock:
+                    self._idle.append(connection)
+
+    def close(self) -> None:
+        with self._lock:
+            for connection in self._opened:
+                connection.close()
+
+            self._opened.clear()
+            self._idle.clear()
+
+# ---------------------------------------------------------------
+# DATABASEREADER CLASS
+# ---------------------------------------------------------------
+
+class DatabaseReader(BaseReader):
+
+    __slots__ = (
+        "table",
+        "use_columns",
+        "filters",
+        "dtypes",
+        "partition_column",
+        "partition_rows",
+        "pool_size",
+    )
+
+    EXPANSION = 1.5         # Pages hold some free space -> Fetched rows are roughly the size of the file.
+    EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+
+    # SQLite type affinity (Checked in order) -> Declared column types resolve like SQLite resolves them.
+    AFFINITIES: Tuple[Tuple[str, pl.DataType], ...] = (
+        ("BOOL", pl.Boolean),
+        ("DATETIME", pl.Datetime("us")),
+        ("TIMESTAMP", pl.Datetime("us")),
+        ("DATE", pl.Date),
+        ("INT", pl.Int64),
+        ("CHAR", pl.String),
+        ("CLOB", pl.String),
+        ("TEXT", pl.String),
+        ("BLOB", pl.Binary),
+        ("REAL", pl.Float64),
+        ("FLOA", pl.Float64),
+        ("DOUB", pl.Float64),
+    )
+
+    def __init__(
+        self,
+        *,
+        table: str,
+        schema: Dict[str, pl.DataType] | pl.Schema = None,
+        dtypes: Optional[Dict[str, pl.DataType]] = None,
+        use_columns: Optional[List[str]] = None,
+        filters: Optional[List[Tuple[Any, ...]]] = None,
+        partition_column: Optional[str] = None,
+        partition_rows: int = 250_000,
+        pool_size: int = 4,
+        infer_schema: bool = True,
+        verbosity: int = 0,
+        **base_kwargs,
+    ):
+        if partition_rows < 1 or pool_size < 1:
+            raise ValueError(f"Partition rows and pool size must be positive integers - Recieved {partition_rows} and {pool_size}")
+
+        # Options are assigned first -> BaseReader materializes the configuration from them.
+        self.table = table
+        self.use_columns = use_columns
+        self.filters = [tuple(predicate) for predicate in filters or []]
+        self.dtypes = dtypes
+        self.partition_column = partition_column
+        self.partition_rows = partition_rows
+        self.pool_size = pool_size
+
+        super().__init__(
+            schema=schema,
+            infer_schema=infer_schema,
+            verbosity=verbosity,
+            **base_kwargs
+        )
+
+    # Convert and return the internal configuration -> Used for _signature (Hashing).
+    def _materialize_config(self) -> ReaderConfig:
+        return ReaderConfig(
+            parameters={
+                "table": self.table,
+                "use_columns": self.use_columns,
+                "filters": self.filters,
+                "partition_column": self.partition_column,
+                "partition_rows": self.partition_rows,
+                "pool_size": self.pool_size,
+            }
+        )
+
+    # Table metadata only -> No row is read.
+    def _scan_schema(self, input: InputType) -> pl.Schema:
+        return pl.Schema({name: self._affinity(declared) for name, declared, _ in self._table_info(input)})
+
+    def _project_schema(self, schema: pl.Schema) -> pl.Schema:
+        if self.use_columns:
+            unknown = [column for column in self.use_columns if column not in schema]
+
+            if unknown:
+                raise ReaderSchemaError(self, f"Columns: {unknown} not found in table: {self.table}")
+
+            schema = pl.Schema({column: schema[column] for column in self.use_columns})
+
+        if isinstance(self.dtypes, dict):
+            schema = pl.Schema({**schema, **{column: dtype for column, dtype in self.dtypes.items() if column in schema}})
+
+        return schema
+
+    # Registered as a Polars IO source -> Rows are only fetched on collect, and only the columns the plan uses.
+    def _to_lazyframe(self, input: InputType) -> LazyFrame:
+        if not isinstance(input, (str, PathLike)) or not Path(input).is_file():
+            raise ReaderExecutionError(self, f"Input: {input} is not an SQLite database file.")
+
+        path = fspath(input)
+        info = self._table_info(path)
+        wire = pl.Schema({name: self._affinity(declared) for name, declared, _ in info})
+        schema = self._source_schema(path) if self._unify_schema else self._schema
+        schema = schema if schema is not None else self._project_schema(wire)
+        where, parameters = self._where(wire)
+        key = self._partition_key(info)
+
+        def source(
+            with_columns: Optional[List[str]],
+            predicate: Optional[pl.Expr],
+            n_rows: Optional[int],
+            batch_size: Optional[int],
+        ) -> Iterator[pl.DataFrame]:
+            columns = list(schema) if with_columns is None else [column for column in schema if column in with_columns]
+            needed = columns + [
+                column for column in (predicate.meta.root_names() if predicate is not None else [])
+                if column in schema and column not in columns
+            ]
+            fetched = needed or list(schema)[:1]    # Row counts still need one column -> Dropped again below.
+
+            for frame in self._fetch(path, fetched, wire, schema, where, parameters, key, n_rows if predicate is None else None):
+                if predicate is not None:
+                    frame = frame.filter(predicate)     # Plan predicates are applied per partition, as it arrives.
+
+                yield frame.select(columns)
+
+        lf = register_io_source(source, schema=schema)
+        self._logger.info("Table: %s registered as a LazyFrame source.", self.table)
+
+        return lf
+
+# Internal Helper-methods --------------------------------------------------
+
+    def _fetch(
+        self,
+        path: str,
+        columns: List[str],
+        wire: pl.Schema,
+        schema: pl.Schema,
+        where: str,
+        parameters: List[Any],
+        key: Optional[str],
+        limit: Optional[int],
+    ) -> Iterator[pl.DataFrame]:
+        select = f"SELECT {', '.join(self._quote(column) for column in columns)} FROM {self._quote(self.table)}"
+        pool = _ConnectionPool(path, self.pool_size)
+
+        try:
+            if limit is not None:
+                # Previews and samples -> One bounded query, no partitioning.
+                yield self._frame(self._rows(pool, f"{select}{where} LIMIT ?", [*parameters, limit]), columns, wire, schema)
+                return
+
+            ranges = self._ranges(pool, key, where, parameters)
+
+            if ranges is None:
+                yield self._frame(self._rows(pool, f"{select}{where}", parameters), columns, wire, schema)
+                return
+
+            bounded = f"{select}{where}{' AND' if where else ' WHERE'} {key} >= ? AND {key} < ? ORDER BY {key}"
+            pending: deque[Future] = deque()
+
+            # Ordered, bounded window -> Partitions fetch concurrently but at most 'pool_size' wait in memory.
+            # Helpers only fetch rows -> Frames are built here, as Polars work on a helper thread could wait on the
+            # Polars thread blocked below (A deadlock with a single Polars thread).
+            with ThreadPoolExecutor(max_workers=self.pool_size) as executor:
+                for low, high in ranges:
+                    pending.append(executor.submit(self._rows, pool, bounded, [*parameters, low, high]))
+
+                    if len(pending) > self.pool_size:
+                        yield self._frame(pending.popleft().result(), columns, wire, schema)
+
+                while pending:
+                    yield self._frame(pending.popleft().result(), columns, wire, schema)
+        finally:
+            pool.close()
+
+    @staticmethod
+    def _rows(pool: _ConnectionPool, query: str, parameters: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        with pool.connection() as connection:
+            return connection.execute(query, parameters).fetchall()
+
+    def _frame(
+        self,
+        rows: List[Tuple[Any, ...]],
+        columns: List[str],
+        wire: pl.Schema,
+        schema: pl.Schema,
+    ) -> pl.DataFrame:
+        values = [list(map(itemgetter(index), rows)) for index in range(len(columns))]
+
+        try:
+            # Column-wise construction in SQLite's own types -> Then converted to the Reader's Schema.
+            frame = pl.DataFrame([
+                pl.Series(column, data, dtype=self._wire_dtype(wire[column], schema[column]))
+                for column, data in zip(columns, values)
+            ])
+        except (TypeError, OverflowError, pl.exceptions.PolarsError) as err:
+            raise ReaderExecutionError(self, f"Table: {self.table} holds values not matching its declared types - {err}") from err
+
+        return frame.with_columns(
+            self._convert(column, frame.schema[column], schema[column]) for column in columns
+        )
+
+    def _ranges(
+        self,
+        pool: _ConnectionPool,
+        key: Optional[str],
+        where: str,
+        parameters: List[Any],
+    ) -> Optional[List[Tuple[int, int]]]:
+        if key is None:
+            return None
+
+        with pool.connection() as connection:
+            try:
+                low, high, rows = connection.execute(
+                    f"SELECT MIN({key}), MAX({key}), COUNT(*) FROM {self._quote(self.table)}{where}", parameters
+                ).fetchone()
+            except sqlite3.OperationalError:
+                return None     # WITHOUT ROWID tables -> Read in a single query.
+
+        if rows <= self.partition_rows or not isinstance(low, int) or not isinstance(high, int):
+            return None
+
+        # Even key ranges -> Row counts per range are only approximately equal when keys have gaps.
+        partitions = min(-(-rows // self.partition_rows), high - low + 1)
+        step = -(-(high - low + 1) // partitions)
+
+        return [(start, min(start + step, high + 1)) for start in range(low, high + 1, step)]
+
+    def _partition_key(self, info: List[Tuple[str, str, int]]) -> Optional[str]:
+        if self.partition_column is not None:
+            # Should be indexed -> Every range query on an unindexed column scans the whole table.
+            if self.partition_column not in {name for name, _, _ in info}:
+                raise ReaderConfigError(self, f"Partition column: {self.partition_column} not found in table: {self.table}")
+
+            return self._quote(self.partition_column)
+
+        primary = [(name, declared) for name, declared, pk in info if pk]
+
+        if len(primary) == 1 and primary[0][1].upper() == "INTEGER":
+            return self._quote(primary[0][0])   # Alias of the rowid -> Ranges are b-tree seeks.
+
+        return "rowid"
+
+    def _where(self, wire: pl.Schema) -> Tuple[str, List[Any]]:
+        clauses, parameters = [], []
+
+        for predicate in self.filters:
+            column, operator, value = (*predicate, None)[:3]
+
+            if column not in wire:
+                raise ReaderConfigError(self, f"Filter column: {column} not found in table: {self.table}")
+
+            operator = retrieve_sql_operator(input=operator)
+
+            if operator in ("IS NULL", "IS NOT NULL"):
+                clauses.append(f"{self._quote(column)} {operator}")
+            elif operator in ("IN", "NOT IN"):
+                values = list(value)
+                clauses.append(f"{self._quote(column)} {operator} ({', '.join('?' * len(values))})")
+                parameters.extend(values)
+            else:
+                clauses.append(f"{self._quote(column)} {operator} ?")
+                parameters.append(value)
+
+        return (f" WHERE {' AND '.join(clauses)}" if clauses else ""), parameters
+
+    def _table_info(self, input: InputType) -> List[Tuple[str, str, int]]:
+        pool = _ConnectionPool(fspath(input), 1)
+
+        try:
+            with pool.connection() as connection:
+                rows = connection.execute(f"PRAGMA table_info({self._quote(self.table)})").fetchall()
+        except sqlite3.Error as err:
+            raise ReaderExecutionError(self, f"Database: {input} could not be opened - {err}") from err
+        finally:
+            pool.close()
+
+        if not rows:
+            raise ReaderSchemaError(self, f"Table: {self.table} not found in database: {input}")
+
+        return [(name, declared or "", pk) for _, name, declared, _, _, pk in rows]
+
+    @classmethod
+    def _affinity(cls, declared: str) -> pl.DataType:
+        declared = declared.upper()
+
+        for token, dtype in cls.AFFINITIES:
+            if token in declared:
+                return dtype
+
+        # No declared type stores values as-is (BLOB affinity) -> Anything else is NUMERIC affinity.
+        return pl.Binary if not declared else pl.Float64
+
+    @staticmethod
+    def _wire_dtype(declared: pl.DataType, target: pl.DataType) -> pl.DataType:
+        # What sqlite3 hands back for a column -> Temporal values arrive as text, booleans as integers.
+        if target.is_temporal():
+            return pl.String
+
+        if target == pl.Boolean or target.is_integer():
+            return pl.Int64
+
+        if target.is_float() or target.is_decimal():
+            return pl.Float64
+
+        return target if declared == target else declared
+
+    @staticmethod
+    def _convert(column: str, actual: pl.DataType, target: pl.DataType) -> pl.Expr:
+        if actual == pl.String and target == pl.Date:
+            return pl.col(column).str.to_date()
+
+        if actual == pl.String and isinstance(target, pl.Datetime):
+            return pl.col(column).str.to_datetime(time_unit=target.time_unit, time_zone=target.time_zone)
+
+        return pl.col(column).cast(target)
+
+    @staticmethod
+    def _quote(identifier: str) -> str:
+        return '"' + str(identifier).replace('"', '""') + '"'
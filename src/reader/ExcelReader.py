@@ -24,6 +24,9 @@ class ExcelReader(BaseReader):
         "excel_engine",
     )
 
+    EXPANSION = 6.0         # Zipped XML, read eagerly.
+    EXTENSIONS = (".xlsx", ".xlsm", ".xlsb", ".xls")
+
     def __init__(
         self,
         *,
@@ -36,8 +39,7 @@ class ExcelReader(BaseReader):
         verbosity: int = 0,
         **base_kwargs,
     ):
-        super().__init__(verbosity=verbosity, **base_kwargs)
-
+        # Options are assigned first -> BaseReader materializes the configuration from them.
         self.sheet_name = sheet_name
         self.header = 0 if header else None
         self.use_columns = use_columns
@@ -45,6 +47,8 @@ class ExcelReader(BaseReader):
         self.drop_empty_rows = drop_empty_rows
         self.excel_engine = excel_engine
 
+        super().__init__(verbosity=verbosity, **base_kwargs)
+
     def _materialize_config(self) -> ReaderConfig:
         return ReaderConfig(
             parameters={
@@ -62,7 +66,7 @@ class ExcelReader(BaseReader):
         lf = pl.read_excel(
             input,
             sheet_name=self.sheet_name,
-            has_header=self.header,
+            has_header=self.header is not None,
             columns=self.use_columns,
             drop_empty_cols=self.drop_empty_columns,
             drop_empty_rows=self.drop_empty_rows,
@@ -70,7 +74,7 @@ class ExcelReader(BaseReader):
         ).lazy()
 
         schema = lf.schema
-        self._logger.info(f"Schema initialized: {schema}")
+        self._logger.info("Schema initialized: %s", schema)
 
         return schema
         
@@ -79,13 +83,13 @@ class ExcelReader(BaseReader):
         lf = pl.read_excel(
             input,
             sheet_name=self.sheet_name,
-            has_header=self.header,
+            has_header=self.header is not None,
             columns=self.use_columns,
             drop_empty_cols=self.drop_empty_columns,
             drop_empty_rows=self.drop_empty_rows,
             engine=self.excel_engine
         ).lazy()
 
-        self._logger.info(f"Data succesfully loaded into LazyFrame.")
+        self._logger.info("Data succesfully loaded into LazyFrame.")
         
         return lf
\ No newline at end of file
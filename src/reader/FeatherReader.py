@@ -18,7 +18,7 @@ from src.typings import ReaderConfig, InputType
 class FeatherReader(BaseReader):
 
     __slots__ = (
-        "schema",
+        "dtypes",
         "n_rows",
         "cache",
         "rechunk",
@@ -26,6 +26,10 @@ class FeatherReader(BaseReader):
         "memory_map",
     )
 
+    ROW_GROUPS = True
+    EXPANSION = 2.0         # Frequently LZ4/ZSTD compressed buffers.
+    EXTENSIONS = (".feather", ".arrow", ".ipc")
+
     def __init__(
         self,
         *,
@@ -41,6 +45,14 @@ class FeatherReader(BaseReader):
         verbosity: int = 0,
         **base_kwargs,
     ):
+        # Options are assigned first -> BaseReader materializes the configuration from them.
+        self.dtypes = dtypes
+        self.n_rows = n_rows
+        self.cache = cache
+        self.rechunk = rechunk
+        self.row_index_name = row_index_name
+        self.memory_map = memory_map
+
         super().__init__(
             schema=schema,
             infer_schema=infer_schema,
@@ -48,13 +60,6 @@ class FeatherReader(BaseReader):
             verbosity=verbosity,
             **base_kwargs
         )
-
-        self.dtypes = dtypes
-        self.n_rows = n_rows
-        self.cache = cache
-        self.rechunk = rechunk
-        self.row_index_name = row_index_name
-        self.memory_map = memory_map
         
     # Convert and return the internal configuration -> Used for _signature (Hashing).
     def _materialize_config(self) -> ReaderConfig:
@@ -68,6 +73,19 @@ class FeatherReader(BaseReader):
             }
         )
     
+    # Schema message only -> No record batch is read.
+    def _scan_schema(self, input: InputType) -> pl.Schema:
+        return pl.Schema(pl.read_ipc_schema(input))
+
+    def _project_schema(self, schema: pl.Schema) -> pl.Schema:
+        if self.row_index_name:
+            schema = pl.Schema({self.row_index_name: pl.UInt32, **schema})
+
+        if isinstance(self.dtypes, dict):
+            schema = pl.Schema({**schema, **{column: dtype for column, dtype in self.dtypes.items() if column in schema}})
+
+        return schema
+
     # Utilise Polars to read specified Data -> Wrapped in ReaderResult-class and returned to Conduit. 
     def _to_lazyframe(self, input: InputType) -> LazyFrame:
 
@@ -80,11 +98,10 @@ class FeatherReader(BaseReader):
             
             dtypes = pl.Schema(self.dtypes)
         else:
-            dtypes = self.schema
+            dtypes = None   # Self-describing format -> The file's own Schema is validated against the Reader's.
         
         lf = pl.scan_ipc(
             source=input,
-            dtypes=dtypes,
             n_rows=self.n_rows,
             cache=self.cache,
             rechunk=self.rechunk,
@@ -92,6 +109,9 @@ class FeatherReader(BaseReader):
             memory_map=self.memory_map
         )
 
-        self._logger(f"Data succesfully loaded into LazyFrame.")
+        if dtypes is not None:
+            lf = lf.cast(dict(dtypes))
+
+        self._logger.info("Data succesfully loaded into LazyFrame.")
 
         return lf
\ No newline at end of file
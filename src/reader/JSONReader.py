@@ -26,6 +26,10 @@ class JSONReader(BaseReader):
         "row_index_name",
     )
 
+    LINE_DELIMITED = True
+    EXPANSION = 0.5         # Keys and punctuation are repeated on every line.
+    EXTENSIONS = (".ndjson", ".jsonl", ".json")
+
     def __init__(
         self,
         *,
@@ -41,6 +45,14 @@ class JSONReader(BaseReader):
         verbosity: int = 0,
         **base_kwargs,
     ):
+        # Options are assigned first -> BaseReader materializes the configuration from them.
+        self.dtypes = dtypes
+        self.use_columns = use_columns
+        self.n_rows = n_rows
+        self.low_memory = low_memory
+        self.rechunk = rechunk
+        self.row_index_name = row_index_name
+
         super().__init__(
             schema=schema,
             infer_schema=infer_schema,
@@ -49,13 +61,6 @@ class JSONReader(BaseReader):
             **base_kwargs
         )
 
-        self.dtypes = dtypes
-        self.use_columns = use_columns
-        self.n_rows = n_rows
-        self.low_memory = low_memory
-        self.rechunk = rechunk
-        self.row_index_name = row_index_name
-
     # Convert and return the internal configuration -> Used for _signature (Hashing).
     def _materialize_config(self) -> ReaderConfig:
         return ReaderConfig(
@@ -68,6 +73,27 @@ class JSONReader(BaseReader):
             }
         )
     
+    # The first 'infer_rows' records -> Enough to type every key without parsing the whole file.
+    def _scan_schema(self, input: InputType) -> pl.Schema:
+        return pl.scan_ndjson(source=input, infer_schema_length=self._infer_rows).collect_schema()
+
+    def _project_schema(self, schema: pl.Schema) -> pl.Schema:
+        schema = self._apply_dtypes(schema)
+
+        if self.use_columns:
+            schema = pl.Schema({column: schema[column] for column in self.use_columns if column in schema})
+
+        if self.row_index_name:
+            schema = pl.Schema({self.row_index_name: pl.UInt32, **schema})
+
+        return schema
+
+    def _apply_dtypes(self, schema: pl.Schema) -> pl.Schema:
+        if not isinstance(self.dtypes, dict):
+            return schema
+
+        return pl.Schema({**schema, **{column: dtype for column, dtype in self.dtypes.items() if column in schema}})
+
     # Utilise Polars to read specified Data -> Wrapped in ReaderResult-class and returned to Conduit. 
     def _to_lazyframe(self, input: InputType) -> LazyFrame:
         
@@ -78,20 +104,27 @@ class JSONReader(BaseReader):
                     f"Data types must be a Dict[str, polars.Datatype] - Recieved {type(self.dtypes)}"
                 )
             
-            dtypes = pl.Schema(self.dtypes)
+            overrides, schema = pl.Schema(self.dtypes), None
         else:
-            dtypes = self.schema
+            overrides, schema = None, self._source_schema(input)
+
+        if self._unify_schema:
+            # The file's own (Scanned) Schema with the overrides applied -> Conformed to the unified one afterwards.
+            overrides, schema = None, self._apply_dtypes(self._source_schema(input))
 
         lf = pl.scan_ndjson(
             source=input,
-            dtypes=dtypes,
-            schema=self.use_columns,
+            schema=schema,
+            schema_overrides=overrides,
             n_rows=self.n_rows,
             low_memory=self.low_memory,
             rechunk=self.rechunk,
             row_index_name=self.row_index_name
         )
 
-        self._logger.info(f"Data succesfully loaded into LazyFrame.")
+        if self.use_columns:
+            lf = lf.select(self.use_columns)
+
+        self._logger.info("Data succesfully loaded into LazyFrame.")
 
         return lf
\ No newline at end of file
@@ -25,6 +25,10 @@ class ParquetReader(BaseReader):
         "low_memory",
     )
 
+    ROW_GROUPS = True
+    EXPANSION = 4.0         # Compressed, dictionary/RLE encoded columns.
+    EXTENSIONS = (".parquet", ".pq")
+
     def __init__(
         self,
         *,
@@ -39,6 +43,13 @@ class ParquetReader(BaseReader):
         verbosity: int = 0,
         **base_kwargs,
     ):
+        # Options are assigned first -> BaseReader materializes the configuration from them.
+        self.dtypes = dtypes
+        self.n_rows = n_rows
+        self.row_index_name = row_index_name
+        self.rechunk = rechunk
+        self.low_memory = low_memory
+
         super().__init__(
             schema=schema,
             infer_schema=infer_schema,
@@ -47,12 +58,6 @@ class ParquetReader(BaseReader):
             **base_kwargs
         )
 
-        self.dtypes = dtypes
-        self.n_rows = n_rows
-        self.row_index_name = row_index_name
-        self.rechunk = rechunk
-        self.low_memory = low_memory
-
     # Convert and return the internal configuration -> Used for _signature (Hashing).
     def _materialize_config(self) -> ReaderConfig:
         return ReaderConfig(
@@ -64,6 +69,19 @@ class ParquetReader(BaseReader):
             }
         )
     
+    # Footer metadata only -> No column chunk is read.
+    def _scan_schema(self, input: InputType) -> pl.Schema:
+        return pl.Schema(pl.read_parquet_schema(input))
+
+    def _project_schema(self, schema: pl.Schema) -> pl.Schema:
+        if self.row_index_name:
+            schema = pl.Schema({self.row_index_name: pl.UInt32, **schema})
+
+        if isinstance(self.dtypes, dict):
+            schema = pl.Schema({**schema, **{column: dtype for column, dtype in self.dtypes.items() if column in schema}})
+
+        return schema
+
     # Utilise Polars to read specified Data -> Wrapped in ReaderResult-class and returned to Conduit. 
     def _to_lazyframe(self, input: InputType) -> LazyFrame:
 
@@ -76,18 +94,20 @@ class ParquetReader(BaseReader):
             
             dtypes = pl.Schema(self.dtypes)
         else:
-            dtypes = self.schema
+            dtypes = None   # Self-describing format -> The file's own Schema is validated against the Reader's.
         
         lf = pl.scan_parquet(
             source=input,
-            dtypes=dtypes,
             n_rows=self.n_rows,
             row_index_name=self.row_index_name,
             rechunk=self.rechunk,
             low_memory=self.low_memory,
         )
 
-        self._logger(f"Data succesfully loaded into LazyFrame.")
+        if dtypes is not None:
+            lf = lf.cast(dict(dtypes))
+
+        self._logger.info("Data succesfully loaded into LazyFrame.")
 
         return lf
 
@@ -2,12 +2,19 @@
 # IMPORTS
 # ---------------------------------------------------------------
 
-from src.reader.BaseReader import BaseReader
-from src.reader.CSVReader import CSVReader
-from src.reader.JSONReader import JSONReader
-from src.reader.ExcelReader import ExcelReader
-from src.reader.ParquetReader import ParquetReader
-from src.reader.FeatherReader import FeatherReader
+from src.utility.lazy_loader import lazy_package
+
+from typing import TYPE_CHECKING
+
+# Type checkers see the eager imports -> At runtime each export is imported on first access.
+if TYPE_CHECKING:
+    from src.reader.BaseReader import BaseReader
+    from src.reader.CSVReader import CSVReader
+    from src.reader.JSONReader import JSONReader
+    from src.reader.ExcelReader import ExcelReader
+    from src.reader.ParquetReader import ParquetReader
+    from src.reader.FeatherReader import FeatherReader
+    from src.reader.DatabaseReader import DatabaseReader
 
 # ---------------------------------------------------------------
 # PACKAGE MANAGEMENT
@@ -20,6 +27,17 @@ __all__ = [
     "ExcelReader",
     "ParquetReader",
     "FeatherReader",
+    "DatabaseReader",
 ]
+
+lazy_package(__name__, {
+    "BaseReader": "src.reader.BaseReader",
+    "CSVReader": "src.reader.CSVReader",
+    "JSONReader": "src.reader.JSONReader",
+    "ExcelReader": "src.reader.ExcelReader",
+    "ParquetReader": "src.reader.ParquetReader",
+    "FeatherReader": "src.reader.FeatherReader",
+    "DatabaseReader": "src.reader.DatabaseReader",
+})
 __version__ = "0.0.1"
 __author__ = "HysingerDev"
\ No newline at end of file
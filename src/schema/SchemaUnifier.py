@@ -0,0 +1,242 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import polars as pl
+
+from src.typings import SchemaCompatibility, UnifiedSchema
+
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Tuple, Hashable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from os import fspath, stat, cpu_count
+
+if TYPE_CHECKING:
+    from src.reader import BaseReader
+
+# ---------------------------------------------------------------
+# SCHEMAUNIFIER CLASS -> ONE SCHEMA ACROSS MANY FILES
+# ---------------------------------------------------------------
+
+class SchemaUnifier():
+
+    __slots__ = (
+        "max_workers",
+        "max_entries",
+        "_schemas",
+        "_unified",
+        "_lock",
+    )
+
+    def __init__(self, max_workers: Optional[int] = None, max_entries: int = 65_536):
+        if max_entries < 1:
+            raise ValueError(f"Max entries must be a positive integer - Recieved {max_entries}")
+
+        self.max_workers: int                               = max_workers or min(32, (cpu_count() or 1) * 4)
+        self.max_entries: int                               = max_entries
+        self._schemas: Dict[Tuple, pl.Schema]               = {}    # (Reader, path, size, mtime) -> File Schema.
+        self._unified: Dict[Tuple, UnifiedSchema]           = {}
+        self._lock: Lock                                    = Lock()
+
+# Core Class Operations --------------------------------------------------
+
+    def unify(
+        self,
+        reader: "BaseReader",
+        paths: Sequence[str],
+        target: Optional[pl.Schema] = None,
+    ) -> UnifiedSchema:
+        paths = [fspath(path) for path in paths]
+        keys = tuple(self._key(reader, path) for path in paths)
+        cache_key = (keys, tuple(target.items()) if target is not None else None)
+
+        cached = self._unified.get(cache_key)
+        if cached is not None:
+            return cached   # Same files at the same size/mtime -> Not a single file is reopened.
+
+        schemas = self._scan(reader, paths, keys)
+        projected = [None if isinstance(raw, Exception) else reader._project_schema(raw) for raw in schemas]
+        schema = target if target is not None else self._fold([logical for logical in projected if logical is not None])
+
+        unified = UnifiedSchema(
+            schema=schema,
+            files={
+                path: self._unreadable(path, raw) if logical is None else self._compare(path, raw, logical, schema)
+                for path, raw, logical in zip(paths, schemas, projected)
+            },
+        )
+
+        with self._lock:
+            self._evict(self._unified)
+            self._unified[cache_key] = unified
+
+        return unified
+
+    def scan(self, reader: "BaseReader", paths: Sequence[str]) -> List[pl.Schema]:
+        schemas = self._scan(reader, [fspath(path) for path in paths])
+
+        for schema in schemas:
+            if isinstance(schema, Exception):
+                raise schema
+
+        return schemas
+
+    def compatibility(self, reader: "BaseReader", path: str, target: pl.Schema) -> SchemaCompatibility:
+        # Files outside the unified set (e.g. new arrivals) -> Checked against the resolved Schema on demand.
+        path = fspath(path)
+        raw, = self._scan(reader, [path])
+
+        if isinstance(raw, Exception):
+            return self._unreadable(path, raw)
+
+        return self._compare(path, raw, reader._project_schema(raw), target)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._schemas.clear()
+            self._unified.clear()
+
+# Internal Helper-methods --------------------------------------------------
+
+    def _scan(self, reader: "BaseReader", paths: List[str], keys: Optional[Sequence[Tuple]] = None) -> List[Any]:
+        keys = keys or [self._key(reader, path) for path in paths]
+        schemas = [self._schemas.get(key) for key in keys]
+        misses = [index for index, schema in enumerate(schemas) if schema is None]
+
+        if misses:
+            # Metadata/header reads are I/O bound and release the GIL -> Threads overlap them file by file.
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(misses))) as executor:
+                scanned = list(executor.map(self._scan_file, [reader] * len(misses), [paths[index] for index in misses]))
+
+            with self._lock:
+                self._evict(self._schemas, len(misses))
+
+                for index, schema in zip(misses, scanned):
+                    schemas[index] = schema
+
+                    if not isinstance(schema, Exception):
+                        self._schemas[keys[index]] = schema     # Failures are retried on the next scan.
+
+        return schemas
+
+    @staticmethod
+    def _scan_file(reader: "BaseReader", path: str) -> Any:
+        try:
+            return reader._scan_schema(path)
+        except Exception as err:
+            return err      # One unreadable file must not abort the others -> Reported per file.
+
+    @staticmethod
+    def _unreadable(path: str, err: Exception) -> SchemaCompatibility:
+        return SchemaCompatibility(
+            source=path,
+            schema=pl.Schema(),
+            status="incompatible",
+            reason=f"Unreadable - {type(err).__name__}: {next(iter(str(err).splitlines()), '')}",
+        )
+
+    def _key(self, reader: "BaseReader", path: str) -> Tuple[Hashable, ...]:
+        try:
+            status = stat(path)
+            identity = (status.st_size, status.st_mtime_ns)
+        except OSError:
+            identity = (None, None)     # Unreadable -> Never cached as if unchanged; the scan reports the error.
+
+        return (type(reader).__name__, reader._canonicalize(reader.config.parameters), path, *identity)
+
+    def _evict(self, cache: Dict[Tuple, Any], incoming: int = 1) -> None:
+        # Oldest entries first (Insertion order) -> Bounded memory for long-lived processes.
+        while cache and len(cache) + incoming > self.max_entries:
+            cache.pop(next(iter(cache)))
+
+    @classmethod
+    def _fold(cls, schemas: List[pl.Schema]) -> pl.Schema:
+        unified: Optional[pl.Schema] = None
+
+        for schema in schemas:
+            if unified is None:
+                unified = pl.Schema(schema)
+                continue
+
+            try:
+                unified = cls._supertype(unified, schema)
+            except pl.exceptions.PolarsError:
+                continue    # No common supertype -> The file is reported as incompatible by '_compare'.
+
+        return unified if unified is not None else pl.Schema()
+
+    @staticmethod
+    def _supertype(left: pl.Schema, right: pl.Schema) -> pl.Schema:
+        # A relaxed diagonal concat of empty frames resolves Polars' own supertype rules -> No data is touched.
+        return pl.concat(
+            [pl.LazyFrame(schema=left), pl.LazyFrame(schema=right)],
+            how="diagonal_relaxed",
+        ).collect_schema()
+
+    @classmethod
+    def _compare(cls, path: str, raw: pl.Schema, schema: pl.Schema, target: pl.Schema) -> SchemaCompatibility:
+        casts, reasons = [], []
+
+        for column, dtype in target.items():
+            actual = schema.get(column)
+
+            if actual is None or actual == dtype:
+                continue
+
+            try:
+                widened = cls._supertype(pl.Schema({column: actual}), pl.Schema({column: dtype}))[column]
+            except pl.exceptions.PolarsError:
+                widened = None
+
+            if widened == dtype:
+                casts.append((column, actual, dtype))
+            else:
+                reasons.append(f"Column: {column} has data type: {actual} - No lossless cast to: {dtype}")
+
+        missing = tuple(column for column in target if column not in schema)
+        extra = tuple(column for column in schema if column not in target)
+
+        if reasons:
+            status = "incompatible"
+        elif casts or missing or extra or list(schema) != list(target):
+            status = "cast"
+        else:
+            status = "exact"
+
+        return SchemaCompatibility(
+            source=path,
+            schema=raw,
+            status=status,
+            casts=tuple(casts),
+            missing=missing,
+            extra=extra,
+            reason="; ".join(reasons) or None,
+        )
+
+# Class __dunder__-methods --------------------------------------------------
+
+    # The shared default pickles by reference -> Workers reuse their own cache instead of a copy.
+    def __reduce__(self):
+        if self is DEFAULT_UNIFIER:
+            return "DEFAULT_UNIFIER"
+
+        return (self.__class__, (self.max_workers, self.max_entries), self.__getstate__())
+
+    # Locks cannot be pickled -> Readers holding a unifier still travel to workers and snapshots.
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"max_workers": self.max_workers, "max_entries": self.max_entries, "schemas": self._schemas, "unified": self._unified}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.max_workers = state["max_workers"]
+        self.max_entries = state["max_entries"]
+        self._schemas = state["schemas"]
+        self._unified = state["unified"]
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._schemas)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} - Files={len(self._schemas)}, Unified={len(self._unified)}>"
+
+DEFAULT_UNIFIER = SchemaUnifier()     # Shared across Readers -> Rebuilt Conduits reuse every cached file Schema.
@@ -2,12 +2,26 @@
 # IMPORTS
 # ---------------------------------------------------------------
 
+from src.utility.lazy_loader import lazy_package
+
+from typing import TYPE_CHECKING
+
+# Type checkers see the eager imports -> At runtime each export is imported on first access.
+if TYPE_CHECKING:
+    from src.schema.SchemaUnifier import SchemaUnifier, DEFAULT_UNIFIER
+
 # ---------------------------------------------------------------
 # PACKAGE MANAGEMENT
 # ---------------------------------------------------------------
 
 __all__ = [
-
+    "SchemaUnifier",
+    "DEFAULT_UNIFIER",
 ]
+
+lazy_package(__name__, {
+    "SchemaUnifier": "src.schema.SchemaUnifier",
+    "DEFAULT_UNIFIER": "src.schema.SchemaUnifier",
+})
 __version__ = "0.0.1"
 __author__ = "HysingerDev"
\ No newline at end of file
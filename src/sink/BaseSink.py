@@ -0,0 +1,53 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import polars as pl
+
+from src.utility.setup_logger import get_class_logger, ClassLogger
+
+from typing import Dict, Any
+from abc import abstractmethod
+
+# ---------------------------------------------------------------
+# BASESINK CLASS -> ABSTRACTION
+# ---------------------------------------------------------------
+
+class BaseSink():
+
+    __slots__ = ("_logger",)
+
+    def __init__(
+        self,
+        verbosity: int = 0,
+    ) -> None:
+        self._logger: ClassLogger = get_class_logger(self.__class__, verbosity)
+
+# Abstract Class Methods --------------------------------------------------
+
+    # Wrap 'lf' in a lazy sink node -> Nothing executes until the Conduit collects every plan together.
+    @abstractmethod
+    def _to_plan(self, lf: pl.LazyFrame) -> pl.LazyFrame:
+        pass
+
+    @abstractmethod
+    def _parameters(self) -> Dict[str, Any]:
+        pass
+
+    # Receives the collected result of '_to_plan' -> Empty for disk sinks, the data itself for in-memory sinks.
+    def _complete(self, frame: pl.DataFrame) -> None:
+        return None
+
+# Core Class Operations --------------------------------------------------
+
+    def write(self, lf: pl.LazyFrame) -> None:
+        self._complete(self._to_plan(lf).collect(engine="streaming"))
+        self._logger.info("Sink: %s written successfully.", type(self).__name__)
+
+# Class __dunder__-methods --------------------------------------------------
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} - {self._parameters()}>"
+
+    def __str__(self) -> str:
+        return f"Type={type(self).__name__}, Config=({self._parameters()})"
@@ -0,0 +1,63 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import polars as pl
+
+from src.sink.BaseSink import BaseSink
+from src.errors import SinkConfigError
+
+from typing import Union, Dict, Any
+from pathlib import Path
+from os import PathLike
+
+# ---------------------------------------------------------------
+# CSVSINK CLASS
+# ---------------------------------------------------------------
+
+class CSVSink(BaseSink):
+
+    __slots__ = (
+        "path",
+        "separator",
+        "include_header",
+    )
+
+    def __init__(
+        self,
+        path: Union[str, PathLike],
+        separator: str = ",",
+        include_header: bool = True,
+        verbosity: int = 0,
+    ):
+        super().__init__(verbosity=verbosity)
+
+        if len(separator) != 1:
+            raise SinkConfigError(self, f"Separator must be a single character - Recieved {separator!r}")
+
+        self.path = Path(path)
+        self.separator = separator
+        self.include_header = include_header
+
+    def _to_plan(self, lf: pl.LazyFrame) -> pl.LazyFrame:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # CSV has no nested types -> List columns (e.g. quarantine reasons) are flattened into one string.
+        nested = [name for name, dtype in lf.collect_schema().items() if isinstance(dtype, pl.List)]
+
+        if nested:
+            lf = lf.with_columns([pl.col(name).cast(pl.List(pl.String)).list.join(";") for name in nested])
+
+        return lf.sink_csv(
+            self.path,
+            separator=self.separator,
+            include_header=self.include_header,
+            lazy=True,
+        )
+
+    def _parameters(self) -> Dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "separator": self.separator,
+            "include_header": self.include_header,
+        }
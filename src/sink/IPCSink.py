@@ -0,0 +1,44 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import polars as pl
+
+from src.sink.BaseSink import BaseSink
+
+from typing import Union, Dict, Any
+from pathlib import Path
+from os import PathLike
+
+# ---------------------------------------------------------------
+# IPCSINK CLASS
+# ---------------------------------------------------------------
+
+class IPCSink(BaseSink):
+
+    __slots__ = (
+        "path",
+        "compression",
+    )
+
+    def __init__(
+        self,
+        path: Union[str, PathLike],
+        compression: str = "zstd",
+        verbosity: int = 0,
+    ):
+        super().__init__(verbosity=verbosity)
+
+        self.path = Path(path)
+        self.compression = compression
+
+    def _to_plan(self, lf: pl.LazyFrame) -> pl.LazyFrame:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        return lf.sink_ipc(self.path, compression=self.compression, lazy=True)
+
+    def _parameters(self) -> Dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "compression": self.compression,
+        }
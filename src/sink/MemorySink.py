@@ -0,0 +1,45 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import polars as pl
+
+from src.sink.BaseSink import BaseSink
+
+from typing import List, Dict, Any
+
+# ---------------------------------------------------------------
+# MEMORYSINK CLASS
+# ---------------------------------------------------------------
+
+class MemorySink(BaseSink):
+
+    __slots__ = ("_frames",)
+
+    def __init__(
+        self,
+        verbosity: int = 0,
+    ):
+        super().__init__(verbosity=verbosity)
+
+        self._frames: List[pl.DataFrame] = []
+
+    @property
+    def frame(self) -> pl.DataFrame:
+        if not self._frames:
+            return pl.DataFrame()
+
+        return pl.concat(self._frames, how="vertical_relaxed", rechunk=False)
+
+    def clear(self) -> None:
+        self._frames = []
+
+    # The plan itself is the result -> Collected alongside every other plan of the same pass.
+    def _to_plan(self, lf: pl.LazyFrame) -> pl.LazyFrame:
+        return lf
+
+    def _complete(self, frame: pl.DataFrame) -> None:
+        self._frames.append(frame)
+
+    def _parameters(self) -> Dict[str, Any]:
+        return {"frames": len(self._frames), "rows": sum(frame.height for frame in self._frames)}
@@ -0,0 +1,53 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import polars as pl
+
+from src.sink.BaseSink import BaseSink
+
+from typing import Optional, Union, Dict, Any
+from pathlib import Path
+from os import PathLike
+
+# ---------------------------------------------------------------
+# PARQUETSINK CLASS
+# ---------------------------------------------------------------
+
+class ParquetSink(BaseSink):
+
+    __slots__ = (
+        "path",
+        "compression",
+        "row_group_size",
+    )
+
+    def __init__(
+        self,
+        path: Union[str, PathLike],
+        compression: str = "zstd",
+        row_group_size: Optional[int] = None,
+        verbosity: int = 0,
+    ):
+        super().__init__(verbosity=verbosity)
+
+        self.path = Path(path)
+        self.compression = compression
+        self.row_group_size = row_group_size
+
+    def _to_plan(self, lf: pl.LazyFrame) -> pl.LazyFrame:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        return lf.sink_parquet(
+            self.path,
+            compression=self.compression,
+            row_group_size=self.row_group_size,
+            lazy=True,
+        )
+
+    def _parameters(self) -> Dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "compression": self.compression,
+            "row_group_size": self.row_group_size,
+        }
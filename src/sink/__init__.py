@@ -0,0 +1,37 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+from src.utility.lazy_loader import lazy_package
+
+from typing import TYPE_CHECKING
+
+# Type checkers see the eager imports -> At runtime each export is imported on first access.
+if TYPE_CHECKING:
+    from src.sink.BaseSink import BaseSink
+    from src.sink.ParquetSink import ParquetSink
+    from src.sink.IPCSink import IPCSink
+    from src.sink.CSVSink import CSVSink
+    from src.sink.MemorySink import MemorySink
+
+# ---------------------------------------------------------------
+# PACKAGE MANAGEMENT
+# ---------------------------------------------------------------
+
+__all__ = [
+    "BaseSink",
+    "ParquetSink",
+    "IPCSink",
+    "CSVSink",
+    "MemorySink",
+]
+
+lazy_package(__name__, {
+    "BaseSink": "src.sink.BaseSink",
+    "ParquetSink": "src.sink.ParquetSink",
+    "IPCSink": "src.sink.IPCSink",
+    "CSVSink": "src.sink.CSVSink",
+    "MemorySink": "src.sink.MemorySink",
+})
+__version__ = "0.0.1"
+__author__ = "HysingerDev"
\ No newline at end of file
@@ -2,14 +2,44 @@
 # IMPORTS
 # ---------------------------------------------------------------
 
-from src.pipeline import BaseConduit
+import json
+import pickle
+import polars as pl
 
-from typing import List, Union, Optional, Tuple, Any, Dict
-from collections import OrderedDict
-from dataclasses import dataclass
-from abc import ABC, abstractmethod
-from dataclasses import field
-from datetime import datetime, timezone
+from src.utility import retrieve_aggregate_expression
+from src.utility.setup_logger import get_class_logger, ClassLogger
+from src.typings import ConduitResult, AggregateRequest, InputType
+from src.storage.Fingerprinter import DEFAULT_FINGERPRINTER
+from src.errors import ConduitError, ConduitExecutionError
+
+from typing import TYPE_CHECKING, List, Union, Optional, Callable, Dict, Any, Iterable, Hashable
+from concurrent.futures import Future
+from copy import deepcopy
+from hashlib import sha1
+from itertools import count
+from pathlib import Path
+from threading import Lock
+from time import perf_counter
+from os import PathLike, fspath, replace
+
+if TYPE_CHECKING:
+    # 'src.pipeline' imports 'src.storage' -> Only resolved for type-checkers to avoid a circular import.
+    from src.pipeline.BaseConduit import BaseConduit
+
+ConduitDefinition = Union["BaseConduit", Callable[[], "BaseConduit"]]
+
+# ---------------------------------------------------------------
+# STORAGE ENTRY -> BUILT CONDUIT
+# ---------------------------------------------------------------
+
+class _StoreEntry():
+
+    __slots__ = ("conduit", "size", "last_used")
+
+    def __init__(self, conduit: "BaseConduit", size: int, last_used: int):
+        self.conduit: "BaseConduit"     = conduit
+        self.size: int                  = size
+        self.last_used: int             = last_used
 
 # ---------------------------------------------------------------
 # STORAGE INSTANCE -> CONDUITS
@@ -17,32 +47,462 @@ from datetime import datetime, timezone
 
 class ConduitStore():
 
-    __slots__ = ("conduits", "ordered")
+    __slots__ = (
+        "memory_budget",
+        "max_entries",
+        "_definitions",
+        "_cache",
+        "_pending",
+        "_inputs",
+        "_clock",
+        "_usage",
+        "_lock",
+        "_logger",
+    )
+
+    SNAPSHOT_VERSION = 2    # Bumped whenever the pickled Conduit layout changes -> Older snapshots are ignored.
+    PLAN_BYTES = 4096       # Estimated footprint of one compiled plan / fused aggregate request.
+    COLUMN_BYTES = 256      # Estimated footprint of one resolved Schema entry.
 
     def __init__(
         self,
-        conduits: Dict[str, BaseConduit] = {},
-        ordered: bool = False,
+        conduits: Optional[Dict[str, ConduitDefinition]] = None,
+        memory_budget: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        verbosity: int = 0,
     ):
-        self.conduits = self._produce_ordered_dict(dict=conduits)
-        self.ordered = ordered
+        if memory_budget is not None and memory_budget < 1:
+            raise ValueError(f"Memory budget must be a positive number of bytes - Recieved {memory_budget}")
+
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"Max entries must be a positive integer - Recieved {max_entries}")
 
-    def add(identifier: str, conduit: BaseConduit) -> bool:
-        pass
+        self.memory_budget: Optional[int]               = memory_budget
+        self.max_entries: Optional[int]                 = max_entries
+        self._definitions: Dict[str, ConduitDefinition] = dict(conduits) if conduits else {}
+        self._cache: Dict[str, _StoreEntry]             = {}
+        self._pending: Dict[str, Future]                = {}
+        self._inputs: Dict[str, Any]                    = {}        # Input each Conduit was built against.
+        self._clock: count                              = count()   # 'next' is atomic -> Lock-free recency stamps.
+        self._usage: int                                = 0
+        self._lock: Lock                                = Lock()
+        self._logger: ClassLogger                       = get_class_logger(self.__class__, verbosity)
 
-    def retrieve(identifier: str) -> Optional[BaseConduit]:
-        pass
+# Class Properties --------------------------------------------------
 
     @property
-    def keys() -> List[str]:
-        pass
+    def keys(self) -> List[str]:
+        return list(self._definitions.keys())
 
     @property
-    def conduits() -> List[BaseConduit]:
-        pass
-
-    def _produce_ordered_dict(self, dict: Dict[str, BaseConduit]) -> Union[dict, OrderedDict]:
-        if self.ordered:
-            return OrderedDict(dict)
-        else:
-            return dict
\ No newline at end of file
+    def conduits(self) -> List["BaseConduit"]:
+        return [entry.conduit for entry in list(self._cache.values())]
+
+    @property
+    def usage(self) -> int:
+        return self._usage
+
+# Core Class Operations --------------------------------------------------
+
+    def add(self, identifier: str, conduit: ConduitDefinition) -> bool:
+        with self._lock:
+            if identifier in self._definitions:
+                self._logger.info("Conduit: %s is already registered in the store!", identifier)
+                return False
+
+            self._definitions[identifier] = conduit
+
+        self._logger.info("Conduit: %s registered in the store.", identifier)
+        return True
+
+    def remove(self, identifier: str) -> bool:
+        with self._lock:
+            if self._definitions.pop(identifier, None) is None:
+                return False
+
+            self._discard(identifier)
+            self._inputs.pop(identifier, None)
+
+        return True
+
+    def retrieve(self, identifier: str, input = None) -> Optional["BaseConduit"]:
+        # Hot path -> A single dict lookup and a recency stamp, no lock.
+        entry = self._cache.get(identifier)
+
+        if entry is not None:
+            entry.last_used = next(self._clock)
+            return entry.conduit
+
+        if identifier not in self._definitions:
+            return None
+
+        return self._build(identifier, input)
+
+    def evict(self, identifier: str) -> bool:
+        with self._lock:
+            return self._discard(identifier)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache = {}
+            self._inputs = {}
+            self._usage = 0
+
+    def execute_batch(
+        self,
+        identifiers: Iterable[str],
+        inputs: Iterable[InputType],
+        return_exceptions: bool = False,
+    ) -> Dict[str, List[Union[ConduitResult, Exception]]]:
+        identifiers, inputs = list(dict.fromkeys(identifiers)), list(inputs)
+        unknown = [identifier for identifier in identifiers if identifier not in self._definitions]
+
+        if unknown:
+            raise KeyError(f"Conduits not registered in the store: {unknown}")
+
+        results: Dict[str, List[Union[ConduitResult, Exception, None]]] = {
+            identifier: [None] * len(inputs) for identifier in identifiers
+        }
+        conduits: Dict[str, "BaseConduit"] = {}
+
+        for identifier in identifiers:
+            try:
+                # Built against the batch's first input -> Inferred Schemas resolve exactly as for a single run.
+                conduits[identifier] = self.retrieve(identifier, inputs[0] if inputs else None)
+            except ConduitError:
+                raise   # Definition failures -> No input can be validated.
+            except Exception as err:
+                error = ConduitExecutionError(self, f"Conduit: {identifier} could not be built - {type(err).__name__}: {err}")
+
+                if not return_exceptions:
+                    raise error from err
+                results[identifier] = [error] * len(inputs)
+
+        # Conduits whose Readers share a signature produce identical scans -> One group reads each input once.
+        groups: Dict[Hashable, List[str]] = {}
+
+        for identifier, conduit in conduits.items():
+            if self._shareable(conduit):
+                groups.setdefault(conduit.reader._signature(), []).append(identifier)
+            else:
+                groups[("solo", identifier)] = [identifier]     # Runs its own '_collect' -> Never shares a scan.
+
+        for members in groups.values():
+            for index, input in enumerate(inputs):
+                try:
+                    if len(members) == 1:
+                        outcomes = [conduits[members[0]]._run(input)]
+                    else:
+                        outcomes = self._execute_shared([conduits[member] for member in members], input)
+                except ConduitExecutionError as err:
+                    if not return_exceptions:
+                        raise
+                    outcomes = [err] * len(members)
+
+                for member, outcome in zip(members, outcomes):
+                    results[member][index] = outcome
+
+        return results
+
+    def save_snapshot(self, directory: Union[str, PathLike]) -> int:
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        entries: Dict[str, Dict[str, Any]] = {}
+
+        for identifier, entry in list(self._cache.items()):
+            definition = self._definitions.get(identifier)
+
+            if definition is None:
+                continue
+
+            try:
+                payload = pickle.dumps(entry.conduit, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as err:
+                # Live runtime handles (Process pools, event-loop primitives) -> Rebuilt on the next cold start instead.
+                self._logger.warning("Conduit: %s cannot be snapshotted - %s", identifier, err)
+                continue
+
+            name = f"conduit-{sha1(identifier.encode('utf-8')).hexdigest()}.pkl"
+            self._write_atomic(directory / name, payload)
+
+            entries[identifier] = {
+                "file": name,
+                "definition": self._definition_fingerprint(self._instantiate(definition)),
+                "input": self._input_fingerprint(self._inputs.get(identifier)),
+            }
+
+        manifest = {
+            "version": self.SNAPSHOT_VERSION,
+            "polars": pl.__version__,
+            "entries": entries,
+        }
+
+        # The manifest is written last -> A crash mid-save never exposes a partially written snapshot.
+        self._write_atomic(directory / "snapshot.json", json.dumps(manifest, indent=2).encode("utf-8"))
+        self._logger.info("Store snapshot saved with %s Conduit(s) to: %s", len(entries), directory)
+
+        return len(entries)
+
+    def load_snapshot(self, directory: Union[str, PathLike]) -> int:
+        manifest_path = Path(directory) / "snapshot.json"
+
+        if not manifest_path.exists():
+            return 0
+
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+
+        if manifest.get("version") != self.SNAPSHOT_VERSION or manifest.get("polars") != pl.__version__:
+            # Pickled plans are only valid for the exact layout and Polars build that produced them.
+            self._logger.info("Store snapshot: %s is incompatible -> Cold start.", directory)
+            return 0
+
+        restored = 0
+
+        for identifier, record in manifest.get("entries", {}).items():
+            conduit = self._restore(Path(directory), identifier, record)
+
+            if conduit is None:
+                continue
+
+            with self._lock:
+                if identifier in self._definitions and identifier not in self._cache:
+                    self._inputs[identifier] = record["input"] and record["input"][0]
+                    self._admit(identifier, conduit)
+                    restored += 1
+
+        self._logger.info("Store snapshot restored %s Conduit(s) from: %s", restored, directory)
+        return restored
+
+# Internal Helper-methods --------------------------------------------------
+
+    def _restore(self, directory: Path, identifier: str, record: Dict[str, Any]) -> Optional["BaseConduit"]:
+        definition = self._definitions.get(identifier)
+
+        if definition is None:
+            return None
+
+        # Reader configuration and explicit Schemas are part of the definition, inferred Schemas follow the input
+        # -> Both fingerprints matching means a rebuild resolves the same Reader, so nothing is re-inferred here.
+        if record["definition"] != self._definition_fingerprint(self._instantiate(definition)):
+            self._logger.info("Conduit: %s definition changed since the snapshot -> Rebuilding.", identifier)
+            return None
+
+        if record["input"] is not None and record["input"] != self._input_fingerprint(record["input"][0]):
+            # The inferred Schema was resolved from an input that has since changed.
+            self._logger.info("Conduit: %s build input changed since the snapshot -> Rebuilding.", identifier)
+            return None
+
+        try:
+            conduit = pickle.loads((directory / record["file"]).read_bytes())
+        except Exception as err:
+            self._logger.warning("Conduit: %s snapshot is unreadable - %s", identifier, err)
+            return None
+
+        conduit.history.clear()     # Snapshots carry build state only -> Run history starts empty.
+        return conduit
+
+
+    def _build(self, identifier: str, input) -> "BaseConduit":
+        with self._lock:
+            entry = self._cache.get(identifier)
+
+            if entry is not None:
+                return entry.conduit    # Built by another thread while this one waited for the lock.
+
+            future = self._pending.get(identifier)
+            owner = future is None
+
+            if owner:
+                future = self._pending[identifier] = Future()
+
+        if not owner:
+            # Concurrent first retrievals share one build -> Waiters block on the owner's Future.
+            return future.result()
+
+        try:
+            conduit = self._instantiate(self._definitions[identifier])
+            conduit.build(input=input)
+        except BaseException as err:
+            with self._lock:
+                del self._pending[identifier]
+            future.set_exception(err)
+            raise
+
+        with self._lock:
+            del self._pending[identifier]
+
+            if identifier in self._definitions:
+                # Removed while building -> Hand the Conduit out but never cache it.
+                self._inputs[identifier] = fspath(input) if isinstance(input, (str, PathLike)) else None
+                self._admit(identifier, conduit)
+
+        future.set_result(conduit)
+        self._logger.info("Conduit: %s built and cached in the store.", identifier)
+
+        return conduit
+
+    def _execute_shared(self, conduits: List["BaseConduit"], input: InputType) -> List[ConduitResult]:
+        start_time = perf_counter()
+        requests: Dict[str, AggregateRequest] = {}
+        plans: Dict[Any, int] = {}
+
+        for conduit in conduits:
+            # Union of every member's layout -> Identical aggregates/plans across Conduits are computed once.
+            for request in conduit._layout.requests:
+                requests.setdefault(request.alias, request)
+
+            for plan in conduit._layout.plans:
+                plans.setdefault(plan, len(plans))
+
+        try:
+            result = conduits[0].reader.execute(input)
+            lf = result.frame.cache()   # Diverging projections defeat automatic subplan elimination -> Cache explicitly.
+
+            queries = [lf.select([retrieve_aggregate_expression(request) for request in requests.values()])] \
+                if requests else []
+            queries.extend(plan._to_plan(lf) for plan in plans)
+
+            collected = pl.collect_all(queries)     # One scan of the input feeds every member Conduit.
+        except Exception as err:
+            self._logger.error("Shared scan over %s Conduit(s) was unsuccessful.", len(conduits))
+            raise ConduitExecutionError(self, f"Input: {conduits[0]._source_name(input)} failed - {err}") from err
+
+        fused = collected[0] if requests else None
+        offset = 1 if requests else 0
+        exec_time = perf_counter() - start_time
+        outcomes = []
+
+        for conduit in conduits:
+            layout = conduit._layout
+            frames = [fused.select([request.alias for request in layout.requests])] if layout.requests else []
+            frames.extend(collected[offset + plans[plan]] for plan in layout.plans)
+
+            conduit_result = conduit._finalize(input, result.metadata, conduit._fan_out(frames), exec_time)
+            conduit_result.metadata["shared_scan"] = len(conduits)
+            outcomes.append(conduit_result)
+
+        return outcomes
+
+    @staticmethod
+    def _shareable(conduit: "BaseConduit") -> bool:
+        # The shared scan is one in-memory 'collect_all' -> Only Conduits that would run exactly that way may join it.
+        # Samples, staged (fail-fast) layouts, engines, memory budgets/ledgers and tracing all change how they collect.
+        return (
+            conduit.sampling is None
+            and len(conduit._layout.stages) == 1
+            and conduit.engine == "auto"
+            and conduit.memory_budget is None
+            and not conduit._track_memory
+            and not conduit.tracer.enabled
+        )
+
+    def _instantiate(self, definition: ConduitDefinition) -> "BaseConduit":
+        if callable(definition):
+            return definition()
+
+        # Definitions are templates -> Every (Re)build works on a private copy, so evicted plans are actually freed.
+        return deepcopy(definition)
+
+    def _admit(self, identifier: str, conduit: "BaseConduit") -> None:
+        size = self._estimate_size(conduit)
+
+        # Copy-on-write -> Concurrent lock-free readers always observe a complete dict.
+        cache = dict(self._cache)
+        cache[identifier] = _StoreEntry(conduit, size, next(self._clock))
+        usage = self._usage + size
+
+        while len(cache) > 1 and self._over_budget(len(cache), usage):
+            victim = min(
+                (key for key in cache if key != identifier),
+                key=lambda key: cache[key].last_used,
+            )
+            usage -= cache.pop(victim).size
+            self._logger.debug("Conduit: %s evicted from the store (Least recently used).", victim)
+
+        self._cache = cache
+        self._usage = usage
+
+    def _discard(self, identifier: str) -> bool:
+        if identifier not in self._cache:
+            return False
+
+        cache = dict(self._cache)
+        self._usage -= cache.pop(identifier).size
+        self._cache = cache
+
+        return True
+
+    @staticmethod
+    def _definition_fingerprint(conduit: "BaseConduit") -> str:
+        # Computed on an unbuilt instance -> Captures configuration, never resolved state or creation time.
+        description = repr((
+            type(conduit).__qualname__,
+            str(conduit.reader),
+            dict(conduit.reader._schema) if conduit.reader is not None and conduit.reader._schema else None,
+            dict(conduit.schema) if conduit.schema is not None else None,
+            tuple(waypoint._key() for waypoint in conduit.waypoints),
+            ConduitStore._options(conduit),
+        ))
+
+        return sha1(description.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _options(conduit: "BaseConduit") -> Dict[str, Any]:
+        # Every scalar option slot, subclasses included (Engine, budget, severity, sampling, batch sizes, ...).
+        # Runtime objects (Logger, history, timestamps) are not options -> Skipped, so they never invalidate snapshots.
+        slots = dict.fromkeys(slot for cls in reversed(type(conduit).__mro__) for slot in getattr(cls, "__slots__", ()))
+
+        return {
+            slot: fspath(value) if isinstance(value, PathLike) else value
+            for slot in slots
+            if isinstance(value := getattr(conduit, slot, None), (str, int, float, PathLike, type(None)))
+        }
+
+    @staticmethod
+    def _input_fingerprint(input: Optional[str]) -> Optional[List[Any]]:
+        if input is None:
+            return None
+
+        try:
+            if Path(input).is_dir():
+                # Unified directory inputs -> Any added, removed or rewritten file invalidates the Schema.
+                files = sorted(path for path in Path(input).iterdir() if path.is_file())
+                return [input, {path.name: DEFAULT_FINGERPRINTER.fingerprint(path) for path in files}]
+
+            # Size, mtime and sampled content -> A rewrite that keeps the size is still caught.
+            return [input, DEFAULT_FINGERPRINTER.fingerprint(input)]    # List -> Compares equal after a JSON round-trip.
+        except OSError:
+            return [input, None]
+
+    @staticmethod
+    def _write_atomic(path: Path, payload: bytes) -> None:
+        temporary = path.with_suffix(path.suffix + ".tmp")
+        temporary.write_bytes(payload)
+        replace(temporary, path)
+
+    def _over_budget(self, entries: int, usage: int) -> bool:
+        if self.max_entries is not None and entries > self.max_entries:
+            return True
+
+        return self.memory_budget is not None and usage > self.memory_budget
+
+    def _estimate_size(self, conduit: "BaseConduit") -> int:
+        layout = conduit._layout
+        plans = len(layout.plans) + len(layout.requests) if layout is not None else 0
+        columns = len(conduit.schema) if conduit.schema is not None else 0
+
+        return conduit.history.nbytes + plans * self.PLAN_BYTES + columns * self.COLUMN_BYTES
+
+# Class __dunder__-methods --------------------------------------------------
+
+    def __contains__(self, identifier: str) -> bool:
+        return identifier in self._definitions
+
+    def __len__(self) -> int:
+        return len(self._definitions)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} - Conduits={len(self._definitions)}, "
+            f"Built={len(self._cache)}, Usage={self._usage}B>"
+        )
@@ -0,0 +1,198 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+from src.utility.formatting_lists import retrieve_fingerprint_mode
+
+from typing import Optional, Union, Dict, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b
+from io import BytesIO
+from mmap import mmap, ACCESS_READ
+from threading import Lock
+from time import time_ns
+from os import PathLike, fspath, stat, cpu_count
+
+FingerprintSource = Union[str, PathLike, bytes, bytearray, memoryview, mmap, BytesIO]
+
+# ---------------------------------------------------------------
+# FINGERPRINTER CLASS -> HAS THIS INPUT CHANGED?
+# ---------------------------------------------------------------
+
+class Fingerprinter():
+
+    __slots__ = (
+        "block_size",
+        "samples",
+        "chunk_size",
+        "max_workers",
+        "max_entries",
+        "_memo",
+        "_lock",
+    )
+
+    DIGEST_BYTES = 16               # 128-bit digests -> Collisions are not a practical concern for change detection.
+    RACY_NS = 2_000_000_000         # Files written this recently may change again within one mtime tick -> Never memoized.
+
+    def __init__(
+        self,
+        block_size: int = 16_384,
+        samples: int = 8,
+        chunk_size: int = 8_388_608,
+        max_workers: Optional[int] = None,
+        max_entries: int = 65_536,
+    ):
+        if block_size < 1 or chunk_size < 1:
+            raise ValueError(f"Block and chunk sizes must be positive integers - Recieved {block_size} and {chunk_size}")
+
+        if samples < 2:
+            raise ValueError(f"Samples must cover at least the head and tail block - Recieved {samples}")
+
+        if max_entries < 1:
+            raise ValueError(f"Max entries must be a positive integer - Recieved {max_entries}")
+
+        self.block_size: int                        = block_size
+        self.samples: int                           = samples
+        self.chunk_size: int                        = chunk_size
+        self.max_workers: int                       = max_workers or min(32, (cpu_count() or 1))
+        self.max_entries: int                       = max_entries
+        self._memo: Dict[Tuple, str]                = {}    # (Path, inode, size, mtime, mode) -> Digest.
+        self._lock: Lock                            = Lock()
+
+# Core Class Operations --------------------------------------------------
+
+    def fingerprint(self, source: FingerprintSource, mode: str = "cheap") -> str:
+        mode = retrieve_fingerprint_mode(input=mode)
+
+        if isinstance(source, (str, PathLike)):
+            return self._fingerprint_path(fspath(source), mode)
+
+        # Buffers carry no identity to memoize on -> Hashed in place, without a copy.
+        with self._view(source) as view:
+            return self._digest(view, mode)
+
+    def changed(self, source: FingerprintSource, previous: Optional[str], mode: str = "cheap") -> bool:
+        try:
+            return self.fingerprint(source, mode) != previous
+        except OSError:
+            return True     # Missing or unreadable -> Never reported as unchanged.
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memo.clear()
+
+# Internal Helper-methods --------------------------------------------------
+
+    def _fingerprint_path(self, path: str, mode: str) -> str:
+        status = stat(path)
+        key = (path, status.st_ino, status.st_size, status.st_mtime_ns, mode)
+
+        cached = self._memo.get(key)
+        if cached is not None:
+            return cached   # Unchanged stat -> One syscall and a dict lookup, no bytes read.
+
+        with open(path, "rb") as file:
+            if status.st_size == 0:
+                digest = self._digest(memoryview(b""), mode, status.st_mtime_ns)
+            else:
+                # Mapped rather than read -> Cheap mode only faults in the sampled pages.
+                with mmap(file.fileno(), 0, access=ACCESS_READ) as mapped, memoryview(mapped) as view:
+                    digest = self._digest(view, mode, status.st_mtime_ns)
+
+        after = stat(path)
+        settled = (after.st_ino, after.st_size, after.st_mtime_ns) == key[1:4]
+
+        # Written mid-hash or too recently -> Re-hashed on the next call instead of trusting the stat.
+        if settled and time_ns() - status.st_mtime_ns > self.RACY_NS:
+            with self._lock:
+                while len(self._memo) >= self.max_entries:
+                    self._memo.pop(next(iter(self._memo)))
+
+                self._memo[key] = digest
+
+        return digest
+
+    @staticmethod
+    def _view(source: Any) -> memoryview:
+        if isinstance(source, BytesIO):
+            return source.getbuffer()
+
+        if isinstance(source, (bytes, bytearray, memoryview, mmap)):
+            view = memoryview(source)
+
+            if view.format == "B" and view.ndim == 1:
+                return view
+
+            with view:
+                return view.cast("B")   # Typed or shaped buffers -> Hashed as their raw bytes.
+
+        raise TypeError(f"Fingerprint source must be a path, buffer or mmap - Currenty type: {type(source)}")
+
+    def _digest(self, view: memoryview, mode: str, mtime: Optional[int] = None) -> str:
+        if mode == "exact":
+            return self._exact(view)
+
+        return self._cheap(view, mtime)
+
+    def _cheap(self, view: memoryview, mtime: Optional[int]) -> str:
+        size = len(view)
+        hasher = blake2b(f"cheap:{size}:{mtime}:{self.block_size}:{self.samples}".encode("utf-8"), digest_size=self.DIGEST_BYTES)
+
+        if size <= self.block_size * self.samples:
+            hasher.update(view)     # Small inputs -> Hashing everything costs no more than sampling.
+            return hasher.hexdigest()
+
+        # Evenly spaced blocks, always including head and tail -> Appends, truncations and headers are all seen.
+        last = size - self.block_size
+        for index in range(self.samples):
+            offset = index * last // (self.samples - 1)
+            hasher.update(view[offset:offset + self.block_size])
+
+        return hasher.hexdigest()
+
+    def _exact(self, view: memoryview) -> str:
+        size = len(view)
+        chunks = [view[offset:offset + self.chunk_size] for offset in range(0, size, self.chunk_size)] or [view]
+
+        if len(chunks) == 1:
+            digests = [self._hash_chunk(chunks[0])]
+        else:
+            # hashlib releases the GIL on large updates -> Chunks hash in parallel across cores.
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as executor:
+                digests = list(executor.map(self._hash_chunk, chunks))
+
+        # Content only (No mtime) -> Touched or copied files with the same bytes keep their fingerprint.
+        root = blake2b(f"exact:{size}:{self.chunk_size}".encode("utf-8"), digest_size=self.DIGEST_BYTES)
+
+        for digest in digests:
+            root.update(digest)
+
+        return root.hexdigest()
+
+    def _hash_chunk(self, chunk: memoryview) -> bytes:
+        return blake2b(chunk, digest_size=self.DIGEST_BYTES).digest()
+
+# Class __dunder__-methods --------------------------------------------------
+
+    # The shared default pickles by reference -> Workers reuse their own memo instead of a copy.
+    def __reduce__(self):
+        if self is DEFAULT_FINGERPRINTER:
+            return "DEFAULT_FINGERPRINTER"
+
+        return (self.__class__, (self.block_size, self.samples, self.chunk_size, self.max_workers, self.max_entries), self.__getstate__())
+
+    # Locks cannot be pickled -> Holders of a Fingerprinter still travel to workers and snapshots.
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"memo": self._memo}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._memo = state["memo"]
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._memo)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} - Block={self.block_size}, Samples={self.samples}, Memoized={len(self._memo)}>"
+
+DEFAULT_FINGERPRINTER = Fingerprinter()     # Shared across Readers and Stores -> One memo per process.
@@ -0,0 +1,200 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import numpy as np
+import polars as pl
+
+from typing import Optional, Union, Sequence
+from pathlib import Path
+from threading import Lock
+from os import PathLike
+
+# ---------------------------------------------------------------
+# STORAGE INSTANCE -> BOUNDED RUN HISTORY
+# ---------------------------------------------------------------
+
+class RunHistory():
+
+    __slots__ = (
+        "capacity",
+        "waypoints",
+        "spill_dir",
+        "_timestamps",
+        "_durations",
+        "_rows",
+        "_bytes",
+        "_passed",
+        "_outcomes",
+        "_head",
+        "_total",
+        "_spills",
+        "_pending",
+        "_lock",
+    )
+
+    # Waypoint outcome encoding -> One int8 per Waypoint per run (Stored Waypoint-major for contiguous columns).
+    PASSED, FAILED, SKIPPED = 1, 0, -1
+
+    def __init__(
+        self,
+        capacity: int = 1024,
+        waypoints: Sequence[str] = (),
+        spill_dir: Optional[Union[str, PathLike]] = None,
+    ):
+        if capacity < 1:
+            raise ValueError(f"History capacity must be a positive integer - Recieved {capacity}")
+
+        self.capacity: int                  = capacity
+        self.waypoints: tuple               = tuple(waypoints)
+        self.spill_dir: Optional[Path]      = Path(spill_dir) if spill_dir is not None else None
+        self._timestamps: np.ndarray        = np.zeros(capacity, dtype=np.float64)
+        self._durations: np.ndarray         = np.zeros(capacity, dtype=np.float64)
+        self._rows: np.ndarray              = np.full(capacity, -1, dtype=np.int64)
+        self._bytes: np.ndarray             = np.full(capacity, -1, dtype=np.int64)
+        self._passed: np.ndarray            = np.zeros(capacity, dtype=np.bool_)
+        self._outcomes: np.ndarray          = np.full((len(self.waypoints), capacity), self.SKIPPED, dtype=np.int8)
+        self._head: int                     = 0     # Next slot to write.
+        self._total: int                    = 0     # Runs appended over the lifetime (Including evicted ones).
+        self._spills: int                   = 0     # Next spill file index -> Continues after files already on disk.
+        self._pending: int                  = 0     # Runs appended since the last spill.
+        self._lock: Lock                    = Lock()
+
+        if self.spill_dir is not None:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            self._spills = self._next_spill()
+
+# Class Properties --------------------------------------------------
+
+    @property
+    def total(self) -> int:
+        return self._total
+
+    @property
+    def nbytes(self) -> int:
+        return sum(
+            buffer.nbytes
+            for buffer in (self._timestamps, self._durations, self._rows, self._bytes, self._passed, self._outcomes)
+        )
+
+# Core Class Operations --------------------------------------------------
+
+    def append(
+        self,
+        timestamp: float,
+        duration: float,
+        rows: int,
+        bytes_read: int,
+        passed: bool,
+        outcomes: Sequence[Optional[bool]] = (),
+    ) -> None:
+        with self._lock:
+            if self.spill_dir is not None and self._pending == self.capacity:
+                self._spill()   # The buffer is full and about to wrap -> Persist it before overwriting.
+
+            slot = self._head
+
+            self._timestamps[slot] = timestamp
+            self._durations[slot] = duration
+            self._rows[slot] = rows
+            self._bytes[slot] = bytes_read
+            self._passed[slot] = passed
+            self._outcomes[:, slot] = [
+                self.SKIPPED if outcome is None else (self.PASSED if outcome else self.FAILED)
+                for outcome in outcomes
+            ]
+
+            self._head = (slot + 1) % self.capacity
+            self._total += 1
+            self._pending += 1
+
+    def to_frame(self) -> pl.DataFrame:
+        with self._lock:
+            if self._total <= self.capacity or self._head == 0:
+                return self._frame(slice(0, min(self._total, self.capacity)))
+
+            # Wrapped ring -> Two chunks in chronological order (Oldest first).
+            return pl.concat(
+                [self._frame(slice(self._head, self.capacity)), self._frame(slice(0, self._head))],
+                rechunk=False,
+            )
+
+    def scan(self) -> pl.LazyFrame:
+        if self.spill_dir is None:
+            return self.to_frame().lazy()
+
+        # Spilled parts plus the runs appended since the last spill -> The complete history for trend analysis.
+        with self._lock:
+            pending = self._frame(slice(0, self._pending)).lazy()
+
+        # Spills from earlier instances on the same directory count too -> Not only those written by this one.
+        if not any(self.spill_dir.glob("history-*.parquet")):
+            return pending
+
+        return pl.concat(
+            [pl.scan_parquet(self.spill_dir / "history-*.parquet"), pending],
+            how="vertical_relaxed",
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._head = 0
+            self._total = 0
+            self._pending = 0
+
+# Internal Helper-methods --------------------------------------------------
+
+    def _frame(self, window: slice) -> pl.DataFrame:
+        # Copied out of the ring -> Series built on NumPy views would change as later runs overwrite their slots.
+        columns = {
+            "timestamp": pl.Series("timestamp", self._timestamps[window].copy()),
+            "duration": pl.Series("duration", self._durations[window].copy()),
+            "rows": pl.Series("rows", self._rows[window].copy()),
+            "bytes_read": pl.Series("bytes_read", self._bytes[window].copy()),
+            "passed": pl.Series("passed", self._passed[window].copy()),
+        }
+
+        for index, waypoint in enumerate(self.waypoints):
+            name = f"{index}:{waypoint}"
+            columns[name] = pl.Series(name, self._outcomes[index, window].copy())
+
+        return pl.DataFrame(columns).with_columns(
+            (pl.col("timestamp") * 1_000_000).cast(pl.Int64).cast(pl.Datetime("us", "UTC"))
+        )
+
+    def _spill(self) -> None:
+        frame = self._frame(slice(0, self.capacity))
+
+        while True:
+            try:
+                # Exclusive creation -> Another history spilling into the same directory never loses a file.
+                with open(self.spill_dir / f"history-{self._spills:06d}.parquet", "xb") as file:
+                    frame.write_parquet(file)
+                break
+            except FileExistsError:
+                self._spills = self._next_spill()
+
+        self._spills += 1
+        self._pending = 0
+
+    def _next_spill(self) -> int:
+        suffixes = [path.stem.rpartition("-")[2] for path in self.spill_dir.glob("history-*.parquet")]
+        return max((int(suffix) for suffix in suffixes if suffix.isdigit()), default=-1) + 1
+
+# Class __dunder__-methods --------------------------------------------------
+
+    def __getstate__(self) -> dict:
+        # Locks cannot be pickled/copied -> Every copy receives a fresh one.
+        return {name: getattr(self, name) for name in self.__slots__ if name != "_lock"}
+
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return min(self._total, self.capacity)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} - Runs={len(self)}/{self.capacity}, Total={self._total}>"
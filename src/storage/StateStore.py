@@ -0,0 +1,140 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import json
+
+from src.typings import InputState
+
+from typing import Optional, Dict, Union, List
+from hashlib import sha1
+from pathlib import Path
+from threading import Lock
+from os import PathLike, replace
+
+# ---------------------------------------------------------------
+# STORAGE INSTANCE -> INCREMENTAL INPUT STATES
+# ---------------------------------------------------------------
+
+class StateStore():
+
+    __slots__ = ("directory", "_states", "_lock")
+
+    def __init__(
+        self,
+        directory: Optional[Union[str, PathLike]] = None,
+    ):
+        self.directory: Optional[Path]      = Path(directory) if directory is not None else None
+        self._states: Dict[str, InputState] = {}
+        self._lock: Lock                    = Lock()
+
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def retrieve(self, identifier: str) -> Optional[InputState]:
+        state = self._states.get(identifier)
+
+        if state is None and self.directory is not None:
+            state = self._load(identifier)      # Lazily restore states persisted by earlier processes.
+
+            if state is not None:
+                self._states[identifier] = state
+
+        return state
+
+    def update(self, identifier: str, state: InputState) -> None:
+        with self._lock:
+            self._states[identifier] = state
+
+            if self.directory is not None:
+                self._save(identifier, state)
+
+    def remove(self, identifier: str) -> bool:
+        with self._lock:
+            removed = self._states.pop(identifier, None) is not None
+
+            if self.directory is not None:
+                location = self._location(identifier)
+
+                for file in sorted(location.glob("*")) if location.exists() else []:
+                    file.unlink()
+                    removed = True
+
+        return removed
+
+    @property
+    def keys(self) -> List[str]:
+        return list(self._states.keys())
+
+    def __getstate__(self) -> dict:
+        # Locks cannot be pickled/copied -> Every copy receives a fresh one.
+        return {"directory": self.directory, "_states": self._states}
+
+    def __setstate__(self, state: dict) -> None:
+        self.directory = state["directory"]
+        self._states = state["_states"]
+        self._lock = Lock()
+
+    def _location(self, identifier: str) -> Path:
+        return self.directory / sha1(identifier.encode("utf-8")).hexdigest()
+
+    def _save(self, identifier: str, state: InputState) -> None:
+        location = self._location(identifier)
+        location.mkdir(parents=True, exist_ok=True)
+
+        # A new generation per save -> Files the current manifest points at are never written to.
+        generation = self._generation(location) + 1
+        files = [f"state_{generation}_{index}.arrow" for index in range(len(state.states))]
+
+        for file, payload in zip(files, state.states):
+            (location / file).write_bytes(payload)
+
+        manifest = {
+            "identifier": identifier,
+            "identity": list(state.identity),
+            "offset": state.offset,
+            "header": state.header.hex(),
+            "probe": state.probe,
+            "layout": state.layout,
+            "states": len(state.states),
+            "generation": generation,
+            "files": files,
+        }
+
+        # Write-then-rename -> A crash never leaves a manifest pointing at half-written states.
+        temporary = location / "manifest.json.tmp"
+        temporary.write_text(json.dumps(manifest), encoding="utf-8")
+        replace(temporary, location / "manifest.json")
+
+        # Older generations are only dropped once the new manifest is in place.
+        for file in location.glob("state_*.arrow"):
+            if file.name not in files:
+                file.unlink(missing_ok=True)
+
+    @staticmethod
+    def _generation(location: Path) -> int:
+        try:
+            return json.loads((location / "manifest.json").read_text(encoding="utf-8")).get("generation", 0)
+        except (OSError, ValueError):
+            return 0
+
+    def _load(self, identifier: str) -> Optional[InputState]:
+        location = self._location(identifier)
+        manifest_path = location / "manifest.json"
+
+        if not manifest_path.exists():
+            return None
+
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+
+        return InputState(
+            identity=tuple(manifest["identity"]),
+            offset=manifest["offset"],
+            header=bytes.fromhex(manifest["header"]),
+            probe=manifest["probe"],
+            layout=manifest["layout"],
+            states=tuple(
+                (location / file).read_bytes()
+                for file in manifest.get("files", [f"state_{index}.arrow" for index in range(manifest["states"])])
+            ),
+        )
@@ -2,12 +2,35 @@
 # IMPORTS
 # ---------------------------------------------------------------
 
+from src.utility.lazy_loader import lazy_package
+
+from typing import TYPE_CHECKING
+
+# Type checkers see the eager imports -> At runtime each export is imported on first access.
+if TYPE_CHECKING:
+    from src.storage.StateStore import StateStore
+    from src.storage.RunHistory import RunHistory
+    from src.storage.ConduitStore import ConduitStore
+    from src.storage.Fingerprinter import Fingerprinter, DEFAULT_FINGERPRINTER
+
 # ---------------------------------------------------------------
 # PACKAGE MANAGEMENT
 # ---------------------------------------------------------------
 
 __all__ = [
-
+    "StateStore",
+    "RunHistory",
+    "ConduitStore",
+    "Fingerprinter",
+    "DEFAULT_FINGERPRINTER"
 ]
+
+lazy_package(__name__, {
+    "StateStore": "src.storage.StateStore",
+    "RunHistory": "src.storage.RunHistory",
+    "ConduitStore": "src.storage.ConduitStore",
+    "Fingerprinter": "src.storage.Fingerprinter",
+    "DEFAULT_FINGERPRINTER": "src.storage.Fingerprinter",
+})
 __version__ = "0.0.1"
 __author__ = "HysingerDev"
\ No newline at end of file
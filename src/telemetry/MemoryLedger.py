@@ -0,0 +1,99 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import polars as pl
+
+from src.utility import current_rss, peak_rss, reset_peak_rss
+
+from typing import List, Optional, Dict, Any, Tuple
+
+# ---------------------------------------------------------------
+# MEMORYLEDGER CLASS -> PER-RUN MEMORY ACCOUNTING
+# ---------------------------------------------------------------
+
+class MemoryLedger():
+
+    __slots__ = (
+        "budget",
+        "policy",
+        "estimated",
+        "action",
+        "engine",
+        "cached_bytes",
+        "rss_start",
+        "resettable",
+        "stages",
+        "plans",
+        "_mark",
+    )
+
+    def __init__(self, budget: Optional[int] = None, policy: Optional[str] = None):
+        self.budget: Optional[int]                  = budget
+        self.policy: Optional[str]                  = policy
+        self.estimated: Optional[int]               = None
+        self.action: str                            = "none"
+        self.engine: Optional[str]                  = None
+        self.cached_bytes: int                      = 0
+        self.resettable: bool                       = reset_peak_rss()     # Lifetime peaks say nothing about this run.
+        self.rss_start: Optional[int]               = current_rss()
+        self.stages: List[Dict[str, Any]]           = []
+        self.plans: Dict[int, Tuple[str, int]]      = {}    # Plan index -> (Stage, collected frame bytes).
+        self._mark: Tuple[Optional[int], Optional[int]] = (None, None)
+
+# Core Class Operations --------------------------------------------------
+
+    def begin(self) -> None:
+        # The high-water mark is reset before every stage -> Each stage reports its own peak.
+        self.resettable = self.resettable and reset_peak_rss()
+        self._mark = (current_rss(), self._peak())
+
+    def end(self, stage: str, frames: Dict[int, Optional[pl.DataFrame]]) -> None:
+        rss_before, peak_before = self._mark
+        peak = self._peak()
+        sizes = {index: frame.estimated_size() for index, frame in frames.items() if frame is not None}
+
+        for index, size in sizes.items():
+            self.plans[index] = (stage, size)
+
+        # The high-water mark is process-wide -> Peaks are only attributable when no other run shares the process.
+        self.stages.append({
+            "stage": stage,
+            "frame_bytes": sum(sizes.values()),
+            "rss_before": rss_before,
+            "rss_after": current_rss(),
+            "peak_rss": peak,
+            "peak_growth": max(0, peak - peak_before) if peak is not None and peak_before is not None else None,
+        })
+
+    def stage_peak(self, stage: str) -> Optional[int]:
+        return next((record["peak_rss"] for record in self.stages if record["stage"] == stage), None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        # Stage peaks plus the mark since the last reset -> Covers the whole run.
+        peaks = [record["peak_rss"] for record in self.stages] + [self._peak()]
+        peak = max(peaks) if None not in peaks else None
+
+        return {
+            "budget": self.budget,
+            "policy": self.policy,
+            "estimated": self.estimated,
+            "action": self.action,
+            "engine": self.engine,
+            "cached_bytes": self.cached_bytes,
+            "frame_bytes": sum(size for _, size in self.plans.values()),
+            "rss_start": self.rss_start,
+            "peak_rss": peak,
+            "peak_growth": max(0, peak - self.rss_start) if peak is not None and self.rss_start is not None else None,
+            "stages": self.stages,
+        }
+
+# Internal Helper-methods --------------------------------------------------
+
+    def _peak(self) -> Optional[int]:
+        return peak_rss() if self.resettable else None
+
+# Class __dunder__-methods --------------------------------------------------
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} - Budget={self.budget}, Estimated={self.estimated}, Action={self.action}>"
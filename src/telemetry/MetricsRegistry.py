@@ -0,0 +1,169 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import json
+
+from src.utility import retrieve_metrics_format
+
+from typing import List, Union, Optional, Dict, Any, Tuple
+from bisect import bisect_left
+from threading import Lock
+from pathlib import Path
+from os import PathLike, replace
+
+# ---------------------------------------------------------------
+# METRICSREGISTRY CLASS -> IN-PROCESS COUNTERS AND HISTOGRAMS
+# ---------------------------------------------------------------
+
+class MetricsRegistry():
+
+    __slots__ = (
+        "buckets",
+        "_counters",
+        "_histograms",
+        "_lock",
+    )
+
+    DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0)    # Seconds.
+
+    def __init__(self, buckets: Optional[Tuple[float, ...]] = None):
+        self.buckets: Tuple[float, ...]                     = tuple(sorted(buckets or self.DEFAULT_BUCKETS))
+        self._counters: Dict[Tuple[str, Tuple], float]      = {}
+        self._histograms: Dict[Tuple[str, Tuple], List]     = {}    # Key -> [Per-bucket counts (+Inf last), count, sum].
+        self._lock: Lock                                    = Lock()
+
+# Core Class Operations --------------------------------------------------
+
+    def increment(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        key = (name, self._labels(labels))
+
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        key = (name, self._labels(labels))
+        position = bisect_left(self.buckets, value)     # 'le' semantics -> A value on a bound lands in that bucket.
+
+        with self._lock:
+            histogram = self._histograms.get(key)
+
+            if histogram is None:
+                histogram = self._histograms[key] = [[0] * (len(self.buckets) + 1), 0, 0.0]
+
+            histogram[0][position] += 1
+            histogram[1] += 1
+            histogram[2] += value
+
+    def counter(self, name: str, **labels: Any) -> float:
+        return self._counters.get((name, self._labels(labels)), 0.0)
+
+    def histogram(self, name: str, **labels: Any) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            histogram = self._histograms.get((name, self._labels(labels)))
+
+            return self._histogram_entry(histogram) if histogram is not None else None
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        with self._lock:
+            return {
+                "counters": [
+                    {"name": name, "labels": dict(labels), "value": value}
+                    for (name, labels), value in sorted(self._counters.items())
+                ],
+                "histograms": [
+                    {"name": name, "labels": dict(labels), **self._histogram_entry(histogram)}
+                    for (name, labels), histogram in sorted(self._histograms.items(), key=lambda item: item[0])
+                ],
+            }
+
+    def to_prometheus(self) -> str:
+        snapshot = self.snapshot()
+        lines, typed = [], set()
+
+        for entry in snapshot["counters"]:
+            if entry["name"] not in typed:
+                typed.add(entry["name"])
+                lines.append(f"# TYPE {entry['name']} counter")
+
+            lines.append(f"{entry['name']}{self._format_labels(entry['labels'])} {entry['value']:g}")
+
+        for entry in snapshot["histograms"]:
+            name, labels = entry["name"], entry["labels"]
+
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} histogram")
+
+            for bound, count in entry["buckets"].items():
+                lines.append(f"{name}_bucket{self._format_labels({**labels, 'le': bound})} {count}")
+
+            lines.append(f"{name}_sum{self._format_labels(labels)} {entry['sum']:g}")
+            lines.append(f"{name}_count{self._format_labels(labels)} {entry['count']}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2)
+
+    def write(self, path: Union[str, PathLike], format: Optional[str] = None) -> Path:
+        path = Path(path)
+        format = retrieve_metrics_format(input=format or path.suffix.lstrip(".") or "prometheus")
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Written next to the target, then renamed -> Scrapers never read a half-written file.
+        partial = path.with_name(f"{path.name}.partial")
+        partial.write_text(self.to_prometheus() if format == "prometheus" else self.to_json())
+        replace(partial, path)
+
+        return path
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+# Internal Helper-methods --------------------------------------------------
+
+    def _histogram_entry(self, histogram: List) -> Dict[str, Any]:
+        counts, count, total = histogram
+        cumulative, buckets = 0, {}
+
+        for bound, bucket in zip((*self.buckets, float("inf")), counts):
+            cumulative += bucket
+            buckets["+Inf" if bound == float("inf") else f"{bound:g}"] = cumulative
+
+        return {"count": count, "sum": total, "buckets": buckets}
+
+    @staticmethod
+    def _labels(labels: Dict[str, Any]) -> Tuple[Tuple[str, str], ...]:
+        return tuple(sorted((key, str(value)) for key, value in labels.items())) if labels else ()
+
+    @staticmethod
+    def _format_labels(labels: Dict[str, str]) -> str:
+        if not labels:
+            return ""
+
+        escaped = (
+            f'{key}="' + str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+            for key, value in labels.items()
+        )
+        return "{" + ",".join(escaped) + "}"
+
+# Class __dunder__-methods --------------------------------------------------
+
+    # Locks cannot be pickled -> Conduits holding a registry still travel to workers and snapshots.
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"buckets": self.buckets, "counters": self._counters, "histograms": self._histograms}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.buckets = state["buckets"]
+        self._counters = state["counters"]
+        self._histograms = state["histograms"]
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._counters) + len(self._histograms)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} - Counters={len(self._counters)}, Histograms={len(self._histograms)}>"
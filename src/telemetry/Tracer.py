@@ -0,0 +1,181 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import polars as pl
+
+from src.telemetry.MetricsRegistry import MetricsRegistry
+
+from typing import List, Optional, Dict, Any, Union
+from contextvars import ContextVar
+from time import perf_counter
+
+# ---------------------------------------------------------------
+# ACTIVE SPAN -> PER THREAD/TASK CONTEXT
+# ---------------------------------------------------------------
+
+# ContextVar (Not thread-local) -> Concurrent asyncio tasks each keep their own span stack.
+_ACTIVE: ContextVar[Optional["Span"]] = ContextVar("windjam_active_span", default=None)
+
+# ---------------------------------------------------------------
+# SPAN CLASSES
+# ---------------------------------------------------------------
+
+class Span():
+
+    __slots__ = (
+        "name",
+        "attributes",
+        "start",
+        "duration",
+        "children",
+        "error",
+        "_tracer",
+        "_parent",
+        "_token",
+    )
+
+    def __init__(self, tracer: "Tracer", name: str, parent: Optional["Span"], attributes: Dict[str, Any]):
+        self.name: str                      = name
+        self.attributes: Dict[str, Any]     = attributes
+        self.start: float                   = 0.0
+        self.duration: Optional[float]      = None
+        self.children: List[Span]           = []
+        self.error: Optional[str]           = None
+        self._tracer: Tracer                = tracer
+        self._parent: Optional[Span]        = parent
+        self._token                         = None
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "duration": self.duration,
+            "attributes": self.attributes,
+            "error": self.error,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+    def __enter__(self) -> "Span":
+        self._token = _ACTIVE.set(self)
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        self.duration = perf_counter() - self.start
+        _ACTIVE.reset(self._token)
+
+        if exc_type is not None:
+            self.error = exc_type.__name__
+
+        if self._parent is not None:
+            self._parent.children.append(self)
+
+        self._tracer._finish(self)
+        return False
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} - Name={self.name}, Duration={self.duration}, Children={len(self.children)}>"
+
+class NullSpan():
+
+    __slots__ = ()
+
+    # Shared no-op -> Disabled tracing allocates nothing and records nothing.
+    def set(self, **attributes: Any) -> None:
+        pass
+
+    def to_dict(self) -> None:
+        return None
+
+    def __enter__(self) -> "NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        return False
+
+    def __bool__(self) -> bool:
+        return False
+
+NULL_SPAN = NullSpan()
+
+# ---------------------------------------------------------------
+# TRACER CLASS
+# ---------------------------------------------------------------
+
+class Tracer():
+
+    __slots__ = (
+        "registry",
+        "enabled",
+        "profile",
+    )
+
+    def __init__(
+        self,
+        registry: Optional[MetricsRegistry] = None,
+        enabled: bool = True,
+        profile: bool = False,
+    ):
+        self.registry: Optional[MetricsRegistry]    = registry if registry is not None or not enabled else MetricsRegistry()
+        self.enabled: bool                          = enabled
+        self.profile: bool                          = enabled and profile   # Per-node Polars timings (Slower, diagnostic).
+
+# Core Class Operations --------------------------------------------------
+
+    def span(self, name: str, **attributes: Any) -> Union[Span, NullSpan]:
+        if not self.enabled:
+            return NULL_SPAN
+
+        return Span(self, name, _ACTIVE.get(), attributes)
+
+    def collect_profiled(self, lf: pl.LazyFrame) -> pl.DataFrame:
+        # 'profile' runs the plan once and reports when each physical node ran -> Nested as child spans.
+        frame, timings = lf.profile()
+        parent = _ACTIVE.get()
+
+        if parent is not None:
+            for node, start, end in timings.iter_rows():
+                child = Span(self, f"polars:{node}", parent, {})
+                child.start, child.duration = start / 1e6, (end - start) / 1e6   # Microseconds since the query started.
+                parent.children.append(child)
+                self._finish(child)
+
+        return frame
+
+# Internal Helper-methods --------------------------------------------------
+
+    def _finish(self, span: Span) -> None:
+        if self.registry is not None:
+            self.registry.observe("windjam_span_seconds", span.duration, span=span.name)
+
+            if span.error is not None:
+                self.registry.increment("windjam_span_errors_total", span=span.name, error=span.error)
+
+# Class __dunder__-methods --------------------------------------------------
+
+    def __bool__(self) -> bool:
+        return self.enabled
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} - Enabled={self.enabled}, Profile={self.profile}>"
+
+NULL_TRACER = Tracer(enabled=False)
+
+# ---------------------------------------------------------------
+# MODULE-LEVEL ACCESS -> READERS/WAYPOINTS JOIN THE CALLER'S TRACE
+# ---------------------------------------------------------------
+
+def span(name: str, **attributes: Any) -> Union[Span, NullSpan]:
+    parent = _ACTIVE.get()
+
+    if parent is None:
+        return NULL_SPAN    # No trace in progress -> Nothing is timed or allocated.
+
+    return Span(parent._tracer, name, parent, attributes)
+
+def current_span() -> Union[Span, NullSpan]:
+    active = _ACTIVE.get()
+    return active if active is not None else NULL_SPAN
@@ -0,0 +1,43 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+from src.utility.lazy_loader import lazy_package
+
+from typing import TYPE_CHECKING
+
+# Type checkers see the eager imports -> At runtime each export is imported on first access.
+if TYPE_CHECKING:
+    from src.telemetry.MetricsRegistry import MetricsRegistry
+    from src.telemetry.MemoryLedger import MemoryLedger
+    from src.telemetry.Tracer import Tracer, Span, NullSpan, NULL_SPAN, NULL_TRACER, span, current_span
+
+# ---------------------------------------------------------------
+# PACKAGE MANAGEMENT
+# ---------------------------------------------------------------
+
+__all__ = [
+    "MetricsRegistry",
+    "MemoryLedger",
+    "Tracer",
+    "Span",
+    "NullSpan",
+    "NULL_SPAN",
+    "NULL_TRACER",
+    "span",
+    "current_span",
+]
+
+lazy_package(__name__, {
+    "MetricsRegistry": "src.telemetry.MetricsRegistry",
+    "MemoryLedger": "src.telemetry.MemoryLedger",
+    "Tracer": "src.telemetry.Tracer",
+    "Span": "src.telemetry.Tracer",
+    "NullSpan": "src.telemetry.Tracer",
+    "NULL_SPAN": "src.telemetry.Tracer",
+    "NULL_TRACER": "src.telemetry.Tracer",
+    "span": "src.telemetry.Tracer",
+    "current_span": "src.telemetry.Tracer",
+})
+__version__ = "0.0.1"
+__author__ = "HysingerDev"
\ No newline at end of file
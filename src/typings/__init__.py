@@ -2,7 +2,16 @@
 # IMPORTS
 # ---------------------------------------------------------------
 
-from ._typings import (InputType, ReaderConfig, ReaderPlan, ReaderResult)
+from src.utility.lazy_loader import lazy_package
+
+from typing import TYPE_CHECKING
+
+# Type checkers see the eager imports -> At runtime each export is imported on first access.
+if TYPE_CHECKING:
+    from ._typings import (InputType, ReaderConfig, ReaderPlan, ReaderResult, ConduitResult,
+        AggregateRequest, ConduitLayout, InputState, ColumnSpec,
+        SchemaCompatibility, UnifiedSchema
+    )
 
 # ---------------------------------------------------------------
 # PACKAGE MANAGEMENT
@@ -12,7 +21,28 @@ __all__ = [
     "InputType",
     "ReaderConfig",
     "ReaderPlan",
-    "ReaderResult"
+    "ReaderResult",
+    "ConduitResult",
+    "AggregateRequest",
+    "ConduitLayout",
+    "InputState",
+    "ColumnSpec",
+    "SchemaCompatibility",
+    "UnifiedSchema"
 ]
+
+lazy_package(__name__, {
+    "InputType": "src.typings._typings",
+    "ReaderConfig": "src.typings._typings",
+    "ReaderPlan": "src.typings._typings",
+    "ReaderResult": "src.typings._typings",
+    "ConduitResult": "src.typings._typings",
+    "AggregateRequest": "src.typings._typings",
+    "ConduitLayout": "src.typings._typings",
+    "InputState": "src.typings._typings",
+    "ColumnSpec": "src.typings._typings",
+    "SchemaCompatibility": "src.typings._typings",
+    "UnifiedSchema": "src.typings._typings",
+})
 __version__ = "0.0.1"
 __author__ = "HysingerDev"
\ No newline at end of file
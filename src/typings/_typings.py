@@ -7,7 +7,7 @@ import polars as pl
 from dataclasses import dataclass
 from io import StringIO, BytesIO
 from os import PathLike
-from typing import Any, Mapping, Union, Tuple, Hashable, Dict
+from typing import Any, Mapping, Sequence, Union, Tuple, Hashable, Dict, Optional
 
 # ---------------------------------------------------------------
 # CUSTOM DATA TYPES
@@ -29,5 +29,70 @@ class ReaderPlan:
     config: Tuple[Tuple[str, pl.DataType], ...]
     fingerprint: Hashable
 
-InputType = Union[str, PathLike, StringIO, BytesIO]
+@dataclass(frozen=True, slots=True)
+class AggregateRequest:
+    kind: str
+    column: str
+    parameter: Hashable = None
+
+    @property
+    def alias(self) -> str:
+        if self.parameter is None:
+            return f"{self.kind}:{self.column}"
+
+        return f"{self.kind}:{self.column}:{self.parameter}"
+
+@dataclass(frozen=True, slots=True)
+class ConduitLayout:
+    requests: Tuple[AggregateRequest, ...]
+    plans: Tuple[Any, ...]
+    slots: Tuple[int, ...]
+    columns: Tuple[Tuple[str, ...], ...]
+    stages: Tuple[Tuple[str, Tuple[int, ...]], ...]
+
+@dataclass(frozen=True, slots=True)
+class ConduitResult:
+    source: str
+    passed: bool
+    waypoints: Tuple[Dict[str, Any], ...]
+    metadata: Dict[str, Any]
+
+@dataclass(frozen=True, slots=True)
+class InputState:
+    identity: Tuple[int, int]
+    offset: int
+    header: bytes
+    probe: str
+    layout: str
+    states: Tuple[bytes, ...]
+
+@dataclass(frozen=True, slots=True)
+class ColumnSpec:
+    null_rate: float = 0.0
+    cardinality: Optional[int] = None       # Distinct (non-null) values -> None draws freely from [low, high].
+    low: Any = None
+    high: Any = None
+    outlier_rate: float = 0.0
+    outlier_scale: float = 10.0             # Outliers land this many range-widths beyond 'high'.
+    gap_rate: float = 0.0                   # Temporal columns -> Share of days in [low, high] that never occur.
+
+@dataclass(frozen=True, slots=True)
+class SchemaCompatibility:
+    source: str
+    schema: pl.Schema                       # The file's own Schema, as read from its metadata/header.
+    status: str                             # 'exact', 'cast' (Conformed lazily) or 'incompatible'.
+    casts: Tuple[Tuple[str, pl.DataType, pl.DataType], ...] = ()
+    missing: Tuple[str, ...] = ()           # Unified columns the file lacks -> Filled with nulls.
+    extra: Tuple[str, ...] = ()             # File columns outside the unified Schema -> Dropped.
+    reason: Optional[str] = None
+
+@dataclass(frozen=True, slots=True)
+class UnifiedSchema:
+    schema: pl.Schema
+    files: Mapping[str, SchemaCompatibility]
+
+    def count(self, status: str) -> int:
+        return sum(compatibility.status == status for compatibility in self.files.values())
+
+InputType = Union[str, PathLike, StringIO, BytesIO, Sequence[Union[str, PathLike]]]
 
@@ -2,8 +2,22 @@
 # IMPORTS
 # ---------------------------------------------------------------
 
-from .formatting_lists import (retrieve_conduit_severity, retrieve_return_format)
-from .setup_logger import get_class_logger
+from .lazy_loader import lazy_package
+
+from typing import TYPE_CHECKING
+
+# Type checkers see the eager imports -> At runtime each export is imported on first access.
+if TYPE_CHECKING:
+    from .formatting_lists import (retrieve_conduit_severity, retrieve_return_format, retrieve_waypoint_cost,
+        retrieve_execution_engine, retrieve_violation_format, retrieve_factory_format, retrieve_metrics_format, retrieve_memory_policy,
+        retrieve_definition_format, retrieve_fingerprint_mode, retrieve_sql_operator)
+    from .setup_logger import (get_class_logger, ClassLogger, EventSink, set_event_sink, get_event_sink)
+    from .sampling import (bernoulli_sample, reservoir_sample, block_sample, wilson_interval)
+    from .serialization import (frame_to_ipc, frame_from_ipc)
+    from .sketches import DistinctFilter
+    from .memory import (current_rss, peak_rss, reset_peak_rss)
+    from .aggregate_lists import (retrieve_aggregate_expression, retrieve_aggregate_merge, aggregate_merge_list,
+        retrieve_aggregate_partition, retrieve_aggregate_sketch)
 
 # ---------------------------------------------------------------
 # PACKAGE MANAGEMENT
@@ -12,7 +26,69 @@ from .setup_logger import get_class_logger
 __all__ = [
     "retrieve_conduit_severity",
     "retrieve_return_format",
+    "retrieve_waypoint_cost",
+    "retrieve_execution_engine",
+    "retrieve_violation_format",
+    "retrieve_factory_format",
+    "retrieve_metrics_format",
+    "retrieve_memory_policy",
+    "retrieve_definition_format",
+    "retrieve_fingerprint_mode",
+    "retrieve_sql_operator",
     "get_class_logger",
+    "ClassLogger",
+    "EventSink",
+    "set_event_sink",
+    "get_event_sink",
+    "retrieve_aggregate_expression",
+    "retrieve_aggregate_merge",
+    "aggregate_merge_list",
+    "retrieve_aggregate_partition",
+    "retrieve_aggregate_sketch",
+    "bernoulli_sample",
+    "reservoir_sample",
+    "block_sample",
+    "wilson_interval",
+    "frame_to_ipc",
+    "frame_from_ipc",
+    "DistinctFilter",
+    "current_rss",
+    "peak_rss",
+    "reset_peak_rss",
 ]
+
+lazy_package(__name__, {
+    "retrieve_conduit_severity": "src.utility.formatting_lists",
+    "retrieve_return_format": "src.utility.formatting_lists",
+    "retrieve_waypoint_cost": "src.utility.formatting_lists",
+    "retrieve_execution_engine": "src.utility.formatting_lists",
+    "retrieve_violation_format": "src.utility.formatting_lists",
+    "retrieve_factory_format": "src.utility.formatting_lists",
+    "retrieve_metrics_format": "src.utility.formatting_lists",
+    "retrieve_memory_policy": "src.utility.formatting_lists",
+    "retrieve_definition_format": "src.utility.formatting_lists",
+    "retrieve_fingerprint_mode": "src.utility.formatting_lists",
+    "retrieve_sql_operator": "src.utility.formatting_lists",
+    "get_class_logger": "src.utility.setup_logger",
+    "ClassLogger": "src.utility.setup_logger",
+    "EventSink": "src.utility.setup_logger",
+    "set_event_sink": "src.utility.setup_logger",
+    "get_event_sink": "src.utility.setup_logger",
+    "bernoulli_sample": "src.utility.sampling",
+    "reservoir_sample": "src.utility.sampling",
+    "block_sample": "src.utility.sampling",
+    "wilson_interval": "src.utility.sampling",
+    "frame_to_ipc": "src.utility.serialization",
+    "frame_from_ipc": "src.utility.serialization",
+    "DistinctFilter": "src.utility.sketches",
+    "current_rss": "src.utility.memory",
+    "peak_rss": "src.utility.memory",
+    "reset_peak_rss": "src.utility.memory",
+    "retrieve_aggregate_expression": "src.utility.aggregate_lists",
+    "retrieve_aggregate_merge": "src.utility.aggregate_lists",
+    "aggregate_merge_list": "src.utility.aggregate_lists",
+    "retrieve_aggregate_partition": "src.utility.aggregate_lists",
+    "retrieve_aggregate_sketch": "src.utility.aggregate_lists",
+})
 __version__ = "0.0.1"
 __author__ = "HysingerDev"
\ No newline at end of file
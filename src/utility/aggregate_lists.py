@@ -0,0 +1,79 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import polars as pl
+
+from src.typings import AggregateRequest
+
+from typing import Optional, Tuple
+
+# ---------------------------------------------------------------
+# AGGREGATE LISTS
+# ---------------------------------------------------------------
+
+aggregate_expression_list = {
+    "len": lambda column, parameter: pl.len(),
+    "count": lambda column, parameter: pl.col(column).count(),
+    "null_count": lambda column, parameter: pl.col(column).null_count(),
+    "min": lambda column, parameter: pl.col(column).min(),
+    "max": lambda column, parameter: pl.col(column).max(),
+    "sum": lambda column, parameter: pl.col(column).sum(),
+    "mean": lambda column, parameter: pl.col(column).mean(),
+    "std": lambda column, parameter: pl.col(column).std(),
+    "n_unique": lambda column, parameter: pl.col(column).n_unique(),
+    "n_unique_rows": lambda column, parameter: pl.struct(list(parameter)).n_unique(),
+    "cast_null_count": lambda column, parameter: pl.col(column).cast(parameter, strict=False).null_count(),
+    "key_hashes": lambda column, parameter: pl.struct(list(parameter)).hash(seed=0).unique().implode(),
+}
+
+# Partial results of these aggregates combine exactly -> Enables merging across inputs/shards.
+aggregate_merge_list = {
+    "len": "sum",
+    "count": "sum",
+    "null_count": "sum",
+    "min": "min",
+    "max": "max",
+    "sum": "sum",
+    "cast_null_count": "sum",
+}
+
+# Distinct counts hold every unique key in memory -> Out-of-core runs hash-partition these key columns to disk.
+aggregate_partition_list = {
+    "n_unique": lambda column, parameter: (column,),
+    "n_unique_rows": lambda column, parameter: tuple(parameter),
+}
+
+def retrieve_aggregate_expression(request: AggregateRequest) -> pl.Expr:
+    if not isinstance(request, AggregateRequest):
+        raise TypeError(f"Request must be of Type: AggregateRequest - Currenty type: {type(request)}")
+
+    factory = aggregate_expression_list.get(request.kind)
+
+    if factory is None:
+        raise ValueError(
+            f"Aggregate type: {request.kind} not supported!\n List of supported aggregate types: {list(aggregate_expression_list.keys())}"
+        )
+    else:
+        return factory(request.column, request.parameter).alias(request.alias)
+
+def retrieve_aggregate_merge(request: AggregateRequest) -> pl.Expr:
+    strategy = aggregate_merge_list.get(request.kind)
+
+    if strategy is None:
+        raise ValueError(f"Aggregate type: {request.kind} cannot be merged across partial results!")
+
+    return getattr(pl.col(request.alias), strategy)()
+
+
+def retrieve_aggregate_partition(request: AggregateRequest) -> Optional[Tuple[str, ...]]:
+    keys = aggregate_partition_list.get(request.kind)
+
+    return None if keys is None else keys(request.column, request.parameter)
+
+# Distinct counts do not add up across partial results -> Partials carry their unique key hashes instead.
+# 'BasePoint._merge' folds these hashes into a DistinctFilter sketch.
+def retrieve_aggregate_sketch(request: AggregateRequest) -> Optional[AggregateRequest]:
+    keys = retrieve_aggregate_partition(request)
+
+    return None if keys is None else AggregateRequest("key_hashes", "*", keys)
\ No newline at end of file
@@ -12,6 +12,94 @@ return_format_list = {
     "toon": "toon"
 }
 
+# Columnar formats for row-level violation records -> Summaries stay in 'return_format_list'.
+violation_format_list = {
+    "parquet": "parquet",
+    "ipc": "ipc",
+    "arrow": "ipc",
+    "feather": "ipc"
+}
+
+# Output formats for generated (Synthetic) data.
+factory_format_list = {
+    "csv": "csv",
+    "ndjson": "ndjson",
+    "json": "ndjson",
+    "parquet": "parquet",
+    "ipc": "ipc",
+    "arrow": "ipc",
+    "feather": "ipc",
+    "xlsx": "xlsx",
+    "excel": "xlsx"
+}
+
+# Export formats for the in-process metrics registry.
+metrics_format_list = {
+    "prometheus": "prometheus",
+    "prom": "prometheus",
+    "txt": "prometheus",
+    "json": "json"
+}
+
+# What a Conduit does when an input's estimated footprint exceeds its memory budget.
+memory_policy_list = {
+    "stream": "stream",
+    "streaming": "stream",
+    "sample": "sample",
+    "sampling": "sample",
+    "refuse": "refuse",
+    "fail": "refuse"
+}
+
+# Conduit definition files accepted by the command line.
+definition_format_list = {
+    "json": "json",
+    "toml": "toml",
+    "py": "python",
+    "python": "python"
+}
+
+sql_operator_list = {
+    "=": "=",
+    "==": "=",
+    "eq": "=",
+    "!=": "!=",
+    "<>": "!=",
+    "ne": "!=",
+    "<": "<",
+    "lt": "<",
+    "<=": "<=",
+    "le": "<=",
+    ">": ">",
+    "gt": ">",
+    ">=": ">=",
+    "ge": ">=",
+    "in": "IN",
+    "not in": "NOT IN",
+    "is null": "IS NULL",
+    "is not null": "IS NOT NULL",
+    "like": "LIKE"
+}
+
+fingerprint_mode_list = {
+    "cheap": "cheap",
+    "sampled": "cheap",
+    "exact": "exact",
+    "full": "exact"
+}
+
+waypoint_cost_list = {
+    "metadata": 0,
+    "aggregate": 1,
+    "scan": 2
+}
+
+execution_engine_list = {
+    "auto": "auto",
+    "in-memory": "in-memory",
+    "streaming": "streaming"
+}
+
 error_severity_list = {
     "ok": 0,
     "debug": 1,
@@ -45,4 +133,130 @@ def retrieve_conduit_severity(input: str) -> int:
             f"Severity type: {input} not supported!\n List of supported severity types: {error_severity_list.keys}"
         )
     else:
-        return final_severity
\ No newline at end of file
+        return final_severity
+
+def retrieve_waypoint_cost(input: str) -> int:
+    if not isinstance(input, str):
+        raise TypeError(f"Input string must be of Type: str - Currenty type: {type(input)}")
+    
+    input = input.lower()
+    final_cost = waypoint_cost_list.get(input)
+
+    if final_cost is None:
+        raise ValueError(
+            f"Cost type: {input} not supported!\n List of supported cost types: {waypoint_cost_list.keys}"
+        )
+    else:
+        return final_cost
+
+def retrieve_execution_engine(input: str) -> str:
+    if not isinstance(input, str):
+        raise TypeError(f"Input string must be of Type: str - Currenty type: {type(input)}")
+    
+    input = input.lower()
+    final_engine = execution_engine_list.get(input)
+
+    if final_engine is None:
+        raise ValueError(
+            f"Engine type: {input} not supported!\n List of supported engine types: {execution_engine_list.keys}"
+        )
+    else:
+        return final_engine
+
+def retrieve_violation_format(input: str) -> str:
+    if not isinstance(input, str):
+        raise TypeError(f"Input string must be of Type: str - Currenty type: {type(input)}")
+    
+    input = input.lower()
+    final_format = violation_format_list.get(input)
+
+    if final_format is None:
+        raise ValueError(
+            f"Violation format: {input} not supported!\n List of supported violation formats: {violation_format_list.keys}"
+        )
+    else:
+        return final_format
+
+def retrieve_factory_format(input: str) -> str:
+    if not isinstance(input, str):
+        raise TypeError(f"Input string must be of Type: str - Currenty type: {type(input)}")
+    
+    input = input.lower()
+    final_format = factory_format_list.get(input)
+
+    if final_format is None:
+        raise ValueError(
+            f"Factory format: {input} not supported!\n List of supported factory formats: {factory_format_list.keys}"
+        )
+    else:
+        return final_format
+
+def retrieve_metrics_format(input: str) -> str:
+    if not isinstance(input, str):
+        raise TypeError(f"Input string must be of Type: str - Currenty type: {type(input)}")
+    
+    input = input.lower()
+    final_format = metrics_format_list.get(input)
+
+    if final_format is None:
+        raise ValueError(
+            f"Metrics format: {input} not supported!\n List of supported metrics formats: {metrics_format_list.keys}"
+        )
+    else:
+        return final_format
+
+def retrieve_memory_policy(input: str) -> str:
+    if not isinstance(input, str):
+        raise TypeError(f"Input string must be of Type: str - Currenty type: {type(input)}")
+    
+    input = input.lower()
+    final_policy = memory_policy_list.get(input)
+
+    if final_policy is None:
+        raise ValueError(
+            f"Memory policy: {input} not supported!\n List of supported memory policies: {memory_policy_list.keys}"
+        )
+    else:
+        return final_policy
+
+def retrieve_definition_format(input: str) -> str:
+    if not isinstance(input, str):
+        raise TypeError(f"Input string must be of Type: str - Currenty type: {type(input)}")
+    
+    input = input.lower()
+    final_format = definition_format_list.get(input)
+
+    if final_format is None:
+        raise ValueError(
+            f"Definition format: {input} not supported!\n List of supported definition formats: {definition_format_list.keys}"
+        )
+    else:
+        return final_format
+
+def retrieve_fingerprint_mode(input: str) -> str:
+    if not isinstance(input, str):
+        raise TypeError(f"Input string must be of Type: str - Currenty type: {type(input)}")
+    
+    input = input.lower()
+    final_mode = fingerprint_mode_list.get(input)
+
+    if final_mode is None:
+        raise ValueError(
+            f"Fingerprint mode: {input} not supported!\n List of supported fingerprint modes: {fingerprint_mode_list.keys}"
+        )
+    else:
+        return final_mode
+
+def retrieve_sql_operator(input: str) -> str:
+    if not isinstance(input, str):
+        raise TypeError(f"Input string must be of Type: str - Currenty type: {type(input)}")
+    
+    input = " ".join(input.lower().split())
+    final_operator = sql_operator_list.get(input)
+
+    if final_operator is None:
+        raise ValueError(
+            f"SQL operator: {input} not supported!\n List of supported SQL operators: {sql_operator_list.keys}"
+        )
+    else:
+        return final_operator
\ No newline at end of file
@@ -0,0 +1,44 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import sys
+
+from typing import List, Dict, Any
+from importlib import import_module
+from types import ModuleType
+
+# ---------------------------------------------------------------
+# LAZYPACKAGE CLASS -> EXPORTS IMPORTED ON FIRST ACCESS
+# ---------------------------------------------------------------
+
+class LazyPackage(ModuleType):
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached on a miss -> Once resolved, an export is a plain module attribute.
+        exports = ModuleType.__getattribute__(self, "__dict__").get("_EXPORTS", {})
+
+        if name not in exports:
+            raise AttributeError(f"module '{self.__name__}' has no attribute '{name}'")
+
+        value = getattr(import_module(exports[name], self.__name__), name)
+        ModuleType.__setattr__(self, name, value)
+
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing 'pkg.Name' binds the submodule onto the package -> The export it shadows is kept instead.
+        if isinstance(value, ModuleType) and value.__name__ == f"{self.__name__}.{name}" \
+                and name in self.__dict__.get("_EXPORTS", {}) and hasattr(value, name):
+            value = getattr(value, name)
+
+        ModuleType.__setattr__(self, name, value)
+
+    def __dir__(self) -> List[str]:
+        return sorted(set(self.__dict__) | set(self.__dict__.get("_EXPORTS", {})))
+
+def lazy_package(name: str, exports: Dict[str, str]) -> None:
+    # 'exports' maps each public name -> The (relative) submodule defining it.
+    module = sys.modules[name]
+    module._EXPORTS = exports
+    module.__class__ = LazyPackage
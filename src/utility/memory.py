@@ -0,0 +1,49 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+from typing import Optional, Dict
+from sys import platform
+
+try:
+    from resource import getrusage, RUSAGE_SELF
+except ImportError:     # Windows -> Only what '/proc' style sources provide (Nothing).
+    getrusage = None
+
+# ---------------------------------------------------------------
+# PROCESS MEMORY UTILITIES
+# ---------------------------------------------------------------
+
+def _proc_status() -> Dict[str, int]:
+    # Linux only -> VmRSS/VmHWM in bytes. Any other platform yields an empty mapping.
+    try:
+        with open("/proc/self/status") as status:
+            return {
+                line.split(":", 1)[0]: int(line.split()[1]) * 1024
+                for line in status
+                if line.startswith(("VmRSS:", "VmHWM:"))
+            }
+    except OSError:
+        return {}
+
+def current_rss() -> Optional[int]:
+    return _proc_status().get("VmRSS")
+
+# Linux only -> Writing "5" to 'clear_refs' resets VmHWM to the current RSS. False where no reset is possible.
+def reset_peak_rss() -> bool:
+    try:
+        with open("/proc/self/clear_refs", "w") as clear_refs:
+            clear_refs.write("5")
+    except OSError:
+        return False
+
+    return True
+
+def peak_rss() -> Optional[int]:
+    peak = _proc_status().get("VmHWM")
+
+    if peak is None and getrusage is not None:
+        peak = getrusage(RUSAGE_SELF).ru_maxrss
+        peak = peak if platform == "darwin" else peak * 1024     # macOS reports bytes, other platforms KiB.
+
+    return peak
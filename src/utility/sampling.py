@@ -0,0 +1,80 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import polars as pl
+
+from typing import Optional, Tuple
+from random import Random
+from math import sqrt, ceil
+
+# ---------------------------------------------------------------
+# SAMPLING UTILITIES
+# ---------------------------------------------------------------
+
+SAMPLE_KEY = "__windjam_sample_key__"
+
+def bernoulli_sample(lf: pl.LazyFrame, fraction: float, seed: int = 0) -> pl.LazyFrame:
+    # Keep every row whose hashed index falls below the fraction -> A streaming filter, no buffering.
+    threshold = pl.lit(min(int(fraction * 2**64), 2**64 - 1), dtype=pl.UInt64)
+
+    return (
+        lf.with_row_index(SAMPLE_KEY)
+        .filter(pl.col(SAMPLE_KEY).hash(seed) < threshold)
+        .drop(SAMPLE_KEY)
+    )
+
+def reservoir_sample(lf: pl.LazyFrame, rows: int, seed: int = 0) -> pl.LazyFrame:
+    # Bottom-k over uniformly hashed keys is a reservoir sample -> Streaming top-k keeps only 'rows' rows in memory.
+    return (
+        lf.with_row_index(SAMPLE_KEY)
+        .with_columns(pl.col(SAMPLE_KEY).hash(seed))
+        .bottom_k(rows, by=SAMPLE_KEY)
+        .drop(SAMPLE_KEY)
+    )
+
+def block_sample(
+    lf: pl.LazyFrame,
+    rows: int,
+    population: int,
+    seed: int = 0,
+    block_rows: int = 65_536,
+) -> pl.LazyFrame:
+    # Random aligned slices -> Slice pushdown makes Parquet/IPC scans read only the selected row groups.
+    # Blocks never exceed the requested rows and the last one is cut short -> No more than 'rows' rows are read.
+    size = max(1, min(block_rows, rows))
+    blocks = max(1, ceil(population / size))
+    chosen = sorted(Random(seed).sample(range(blocks), k=min(blocks, ceil(rows / size))))
+    slices, remaining = [], max(1, rows)
+
+    for block in chosen:
+        slices.append(lf.slice(block * size, min(size, remaining)))
+        remaining -= size
+
+    return pl.concat(slices)
+
+def wilson_interval(
+    successes: int,
+    n: int,
+    population: Optional[int] = None,
+    z: float = 1.96,
+) -> Tuple[float, float]:
+    if n <= 0:
+        return (0.0, 1.0)   # No observations -> Nothing can be ruled out.
+
+    ratio = successes / n
+    denominator = 1 + z**2 / n
+    center = (ratio + z**2 / (2 * n)) / denominator
+    margin = z * sqrt(ratio * (1 - ratio) / n + z**2 / (4 * n**2)) / denominator
+    lower, upper = center - margin, center + margin
+
+    if population is not None and population > 1 and n <= population:
+        # Finite population correction -> Both bounds shrink towards the observed ratio (A census collapses onto it).
+        correction = sqrt((population - n) / (population - 1))
+        lower, upper = ratio - (ratio - lower) * correction, ratio + (upper - ratio) * correction
+
+    # No (Or only) successes observed -> The bound is exact, never a rounding residue above 0 (Or below 1).
+    lower = 0.0 if successes == 0 else max(0.0, lower)
+    upper = 1.0 if successes == n else min(1.0, upper)
+
+    return (lower, upper)
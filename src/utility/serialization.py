@@ -0,0 +1,20 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import polars as pl
+
+from io import BytesIO
+
+# ---------------------------------------------------------------
+# SERIALIZATION UTILITIES
+# ---------------------------------------------------------------
+
+def frame_to_ipc(frame: pl.DataFrame, compression: str = "lz4") -> bytes:
+    buffer = BytesIO()
+    frame.write_ipc(buffer, compression=compression)
+
+    return buffer.getvalue()
+
+def frame_from_ipc(payload: bytes) -> pl.DataFrame:
+    return pl.read_ipc(BytesIO(payload))
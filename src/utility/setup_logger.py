@@ -3,26 +3,45 @@
 # ---------------------------------------------------------------
 
 import logging
+import atexit
+import json
+import sys
+
+from typing import List, Union, Optional, Dict, Any, Tuple, IO
+from threading import Lock
+from time import time
+from os import PathLike
 
 # ---------------------------------------------------------------
 # LOGGING SETUP
 # ---------------------------------------------------------------
 
-def get_class_logger(cls: str, verbosity: int) -> logging.Logger:
-
-    logger_name = f"{cls.__module__}.{cls.__name__}"
-    logger = logging.getLogger(logger_name)
-    
-    if verbosity <= 0:
-        logger.setLevel(logging.ERROR)
-    elif verbosity == 1:
-        logger.setLevel(logging.WARNING)
-    elif verbosity == 2:
-        logger.setLevel(logging.INFO)
-    else:
-        logger.setLevel(logging.DEBUG)
-    
-    if not logger.hasHandlers():
+_LEVELS = (logging.ERROR, logging.WARNING, logging.INFO, logging.DEBUG)     # Verbosity 0..3+ -> Threshold.
+
+_LOGGERS: Dict[Tuple[str, int], "ClassLogger"] = {}
+_LOCK = Lock()
+_EVENT_SINK: Optional["EventSink"] = None
+
+def get_class_logger(cls: type, verbosity: int) -> "ClassLogger":
+    return _class_logger(f"{cls.__module__}.{cls.__name__}", verbosity)
+
+def _class_logger(name: str, verbosity: int) -> "ClassLogger":
+    # One shared instance per (Class, verbosity) -> Instances no longer reconfigure the logger on every construction.
+    logger = _LOGGERS.get((name, verbosity))
+
+    if logger is None:
+        with _LOCK:
+            logger = _LOGGERS.get((name, verbosity))
+
+            if logger is None:
+                logger = _LOGGERS[(name, verbosity)] = ClassLogger(_configure(name), verbosity)
+
+    return logger
+
+def _configure(name: str) -> logging.Logger:
+    logger = logging.getLogger(name)
+
+    if not logger.handlers:
         handler = logging.StreamHandler()
         formatter = logging.Formatter(
             "%(asctime)s | %(name)s | %(levelname)s | %(message)s",
@@ -31,6 +50,195 @@ def get_class_logger(cls: str, verbosity: int) -> logging.Logger:
         handler.setFormatter(formatter)
         logger.addHandler(handler)
 
+    # Filtering happens per ClassLogger -> The shared logger lets everything through to its handler.
+    logger.setLevel(logging.DEBUG)
     logger.propagate = False
-    
-    return logger
\ No newline at end of file
+
+    return logger
+
+# ---------------------------------------------------------------
+# CLASSLOGGER CLASS -> CACHED LEVEL CHECK, LAZY FORMATTING
+# ---------------------------------------------------------------
+
+class ClassLogger():
+
+    __slots__ = (
+        "name",
+        "verbosity",
+        "level",
+        "threshold",
+        "_logger",
+    )
+
+    def __init__(self, logger: logging.Logger, verbosity: int):
+        self.name: str                  = logger.name
+        self.verbosity: int             = verbosity
+        self.level: int                 = _LEVELS[min(max(verbosity, 0), len(_LEVELS) - 1)]
+        self.threshold: int             = self.level    # Lowest level anyone consumes -> Console or event sink.
+        self._logger: logging.Logger    = logger
+        self._refresh()
+
+# Core Class Operations --------------------------------------------------
+
+    # Below the threshold a call is one integer comparison -> The message is never formatted.
+    def debug(self, message: str, *args: Any, **fields: Any) -> None:
+        if self.threshold <= logging.DEBUG:
+            self._emit(logging.DEBUG, message, args, fields)
+
+    def info(self, message: str, *args: Any, **fields: Any) -> None:
+        if self.threshold <= logging.INFO:
+            self._emit(logging.INFO, message, args, fields)
+
+    def warning(self, message: str, *args: Any, **fields: Any) -> None:
+        if self.threshold <= logging.WARNING:
+            self._emit(logging.WARNING, message, args, fields)
+
+    def error(self, message: str, *args: Any, **fields: Any) -> None:
+        if self.threshold <= logging.ERROR:
+            self._emit(logging.ERROR, message, args, fields)
+
+    def is_enabled(self, level: int) -> bool:
+        return level >= self.threshold
+
+# Internal Helper-methods --------------------------------------------------
+
+    def _emit(self, level: int, message: str, args: Tuple, fields: Dict[str, Any]) -> None:
+        if level >= self.level:
+            self._logger.log(level, message, *args, stacklevel=3)   # Records the caller, not this wrapper.
+
+        sink = _EVENT_SINK
+        if sink is not None and level >= sink.level:
+            sink.emit(self.name, level, message, args, fields)
+
+    def _refresh(self) -> None:
+        sink = _EVENT_SINK
+        self.threshold = min(self.level, sink.level) if sink is not None else self.level
+
+# Class __dunder__-methods --------------------------------------------------
+
+    # Rebuilt from the shared cache -> Pickled Readers/Conduits arrive with the worker's own logger.
+    def __reduce__(self):
+        return (_class_logger, (self.name, self.verbosity))
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} - Name={self.name}, Level={logging.getLevelName(self.level)}>"
+
+# ---------------------------------------------------------------
+# EVENTSINK CLASS -> BATCHED STRUCTURED EVENTS (NDJSON)
+# ---------------------------------------------------------------
+
+class EventSink():
+
+    __slots__ = (
+        "level",
+        "batch_size",
+        "_stream",
+        "_owned",
+        "_buffer",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        target: Union[str, PathLike, IO[str], None] = None,
+        level: int = logging.INFO,
+        batch_size: int = 512,
+    ):
+        if batch_size < 1:
+            raise ValueError(f"Batch size must be a positive integer - Recieved {batch_size}")
+
+        self.level: int                 = level
+        self.batch_size: int            = batch_size
+        self._owned: bool               = isinstance(target, (str, PathLike))
+        self._stream: IO[str]           = open(target, "a", encoding="utf8") if self._owned else (target or sys.stderr)
+        self._buffer: List[Tuple]       = []
+        self._lock: Lock                = Lock()
+
+# Core Class Operations --------------------------------------------------
+
+    def emit(self, logger: str, level: int, message: str, args: Tuple = (), fields: Optional[Dict[str, Any]] = None) -> None:
+        # Stored raw -> Formatting and serialization are paid once per batch, off the caller's path.
+        event = (time(), logger, level, message, args, fields)
+
+        with self._lock:
+            self._buffer.append(event)
+            full = len(self._buffer) >= self.batch_size
+
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        with self._lock:
+            events, self._buffer = self._buffer, []
+
+            if not events:
+                return 0
+
+            self._stream.write("".join(self._serialize(event) + "\n" for event in events))
+            self._stream.flush()
+
+        return len(events)
+
+    def close(self) -> None:
+        self.flush()
+
+        if self._owned:
+            self._stream.close()
+
+# Internal Helper-methods --------------------------------------------------
+
+    @staticmethod
+    def _serialize(event: Tuple) -> str:
+        timestamp, logger, level, message, args, fields = event
+
+        try:
+            text = message % args if args else message
+        except (TypeError, ValueError):
+            text = f"{message} {args}"      # Mismatched arguments must not drop the event.
+
+        return json.dumps(
+            {"ts": timestamp, "logger": logger, "level": logging.getLevelName(level), "message": text, **(fields or {})},
+            default=str,
+        )
+
+# Class __dunder__-methods --------------------------------------------------
+
+    def __enter__(self) -> "EventSink":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        self.close()
+        return False
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} - Level={logging.getLevelName(self.level)}, Buffered={len(self._buffer)}>"
+
+# ---------------------------------------------------------------
+# EVENT SINK REGISTRATION
+# ---------------------------------------------------------------
+
+def set_event_sink(sink: Optional[EventSink]) -> Optional[EventSink]:
+    global _EVENT_SINK
+
+    with _LOCK:
+        previous, _EVENT_SINK = _EVENT_SINK, sink
+
+        # Cached thresholds depend on the sink level -> Every live ClassLogger is refreshed once, here.
+        for logger in _LOGGERS.values():
+            logger._refresh()
+
+    if previous is not None and previous is not sink:
+        previous.flush()
+
+    return previous
+
+def get_event_sink() -> Optional[EventSink]:
+    return _EVENT_SINK
+
+@atexit.register
+def _flush_event_sink() -> None:
+    if _EVENT_SINK is not None:
+        _EVENT_SINK.flush()
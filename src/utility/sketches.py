@@ -0,0 +1,94 @@
+# ---------------------------------------------------------------
+# IMPORTS
+# ---------------------------------------------------------------
+
+import numpy as np
+
+from math import ceil, log
+from struct import Struct
+
+# ---------------------------------------------------------------
+# DISTINCTFILTER CLASS -> BOUNDED DISTINCT COUNTS ACROSS BATCHES
+# ---------------------------------------------------------------
+
+class DistinctFilter():
+
+    __slots__ = ("capacity", "error_rate", "size", "hashes", "count", "_bits")
+
+    MIXER = np.uint64(0x9E3779B97F4A7C15)     # Derives the second hash for double hashing -> k probes from one key.
+    HEADER = Struct("<QdQ")                     # Capacity, error rate and count -> Precede the packed bits.
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        if capacity < 1:
+            raise ValueError(f"Capacity must be a positive integer - Recieved {capacity}")
+
+        if not 0.0 < error_rate < 1.0:
+            raise ValueError(f"Error rate must be a fraction within (0, 1) - Recieved {error_rate}")
+
+        size = ceil(-capacity * log(error_rate) / log(2) ** 2 / 8) * 8     # Optimal Bloom filter bits, whole bytes.
+
+        self.capacity: int          = capacity
+        self.error_rate: float      = error_rate
+        self.size: int              = size
+        self.hashes: int            = max(1, round(size / capacity * log(2)))
+        self.count: int             = 0
+        self._bits: np.ndarray      = np.zeros(size // 8, dtype=np.uint8)     # Fixed footprint -> Never grows with the keys.
+
+    @property
+    def nbytes(self) -> int:
+        return self._bits.nbytes
+
+    @property
+    def saturated(self) -> bool:
+        # Beyond capacity the false-positive rate exceeds 'error_rate' -> New keys are increasingly missed.
+        return self.count > self.capacity
+
+    def add(self, keys: np.ndarray) -> int:
+        # 64-bit key hashes in, number of keys never seen before out -> Repeats within 'keys' are counted once.
+        keys = np.unique(np.asarray(keys, dtype=np.uint64))
+
+        if keys.size == 0:
+            return 0
+
+        positions = self._positions(keys)
+        present = ((self._bits[positions >> 3] >> (positions & 7).astype(np.uint8)) & 1).all(axis=0)
+
+        np.bitwise_or.at(self._bits, (positions >> 3).ravel(), (1 << (positions & 7)).astype(np.uint8).ravel())
+
+        added = int(keys.size - np.count_nonzero(present))
+        self.count += added
+
+        return added
+
+    def clear(self) -> None:
+        self._bits[:] = 0
+        self.count = 0
+
+    def to_bytes(self) -> bytes:
+        return self.HEADER.pack(self.capacity, self.error_rate, self.count) + self._bits.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "DistinctFilter":
+        capacity, error_rate, count = cls.HEADER.unpack_from(data)
+        distinct = cls(capacity=capacity, error_rate=error_rate)
+        bits = np.frombuffer(data, dtype=np.uint8, offset=cls.HEADER.size)
+
+        if bits.size != distinct._bits.size:
+            raise ValueError(f"Serialized filter holds {bits.size} bytes - Expected {distinct._bits.size}")
+
+        distinct._bits[:] = bits
+        distinct.count = count
+
+        return distinct
+
+    def _positions(self, keys: np.ndarray) -> np.ndarray:
+        second = (keys ^ (keys >> np.uint64(31))) * self.MIXER | np.uint64(1)
+        probes = np.arange(self.hashes, dtype=np.uint64)[:, None]
+
+        return (keys[None, :] + probes * second[None, :]) % np.uint64(self.size)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} - Count={self.count}, Capacity={self.capacity}, Bytes={self.nbytes}>"
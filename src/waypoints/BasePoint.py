@@ -4,14 +4,16 @@
 
 import polars as pl
 
-from src.utility import get_class_logger
+from src.utility import (get_class_logger, ClassLogger, retrieve_aggregate_merge, aggregate_merge_list,
+    retrieve_aggregate_partition, retrieve_aggregate_sketch, DistinctFilter
+)
+from src.typings import AggregateRequest
 from src.errors import WaypointBuildError
 
 from polars.dataframe import DataFrame
 from typing import List, Union, Optional, Tuple, Any, Dict
 from datetime import datetime, timezone
 from abc import abstractmethod
-from logging import Logger
 
 # ---------------------------------------------------------------
 # BASEPOINT CLASS -> ABSTRACTION
@@ -24,38 +26,164 @@ class BasePoint():
         "_logger"
     )
 
+    COST: str = "scan"          # Estimated cost of '_to_plan' -> "metadata" or "scan" (See 'waypoint_cost_list').
+    STREAMABLE: bool = True     # '_to_plan' runs in bounded memory on the streaming engine (No global sorts/windows).
+    ROW_INDEX: str = "__windjam_row"    # Row-index column attached to frames handed to '_violations'.
+
     def __init__(
         self,
         verbosity: int = 0, 
     ):
-        self._logger: Logger    = get_class_logger(self.__class__, verbosity)
+        self._built: bool           = False
+        self._logger: ClassLogger   = get_class_logger(self.__class__, verbosity)
 
     @property
     def is_built(self) -> bool:
         return self._built
 
+    @property
+    def is_mergeable(self) -> bool:
+        # Waypoints opt into partial-result merging by overriding '_merge' (Or by only requesting mergeable aggregates).
+        if type(self)._merge is not BasePoint._merge:
+            return True
+
+        requests = self._requests()
+        return bool(requests) and all(
+            request.kind in aggregate_merge_list or retrieve_aggregate_partition(request) is not None
+            for request in requests
+        )
+
     def build(self) -> None:
         
         if self._built:
-            self._logger.info(f"Waypoint: {self.__class__.__name__} is already constructed!")
+            self._logger.info("Waypoint: %s is already constructed!", self.__class__.__name__)
             return
         
         self._built = True
 
         self._logger.info(
-            f"Waypoint: {self.__class__.__name__} built successfully!"
+            "Waypoint: %s built successfully!", self.__class__.__name__
         )
     
     def validate(self, data: DataFrame) -> Dict[str, Any]:
         pass
 
+    # Evaluate a sampled frame -> Waypoints override to report estimates with confidence bounds.
+    def validate_sample(self, data: DataFrame, rows: int, population: int) -> Dict[str, Any]:
+        report = self.validate(data) or {}
+        report["estimated"] = True
+
+        return report
+
+    # Declare the aggregates this Waypoint needs -> The Conduit fuses (and dedupes) them across all Waypoints.
+    def _requests(self) -> Tuple[AggregateRequest, ...]:
+        return ()
+
+    # Derive the (lazy) query whose collected DataFrame is handed to 'validate' -> Defaults to the full frame.
+    # Only consulted for Waypoints without aggregate requests.
+    def _to_plan(self, lf: pl.LazyFrame) -> pl.LazyFrame:
+        return lf
+
+    # Combine partial plan-results (One per input or shard) into the frame 'validate' expects.
+    def _merge(self, frames: List[DataFrame]) -> DataFrame:
+        if not self.is_mergeable:
+            raise NotImplementedError(f"Waypoint: {self.__class__.__name__} does not support merging partial results.")
+
+        combined = pl.concat(frames, how="diagonal_relaxed")
+        merged = []
+
+        for request in self._requests():
+            if retrieve_aggregate_partition(request) is None:
+                merged.append(retrieve_aggregate_merge(request))
+                continue
+
+            # Distinct counts -> Re-counted from the folded sketch, which is carried along for later merges.
+            distinct = self._merge_distinct(combined, request)
+            merged.append(pl.lit(distinct.count, dtype=pl.get_index_type()).alias(request.alias))
+            merged.append(pl.lit(distinct.to_bytes(), dtype=pl.Binary).alias(f"sketch:{request.alias}"))
+
+        return combined.select(merged)
+
+    # Merged states hold at most one serialized sketch, partials the unique key hashes of their input.
+    # Hashes are added one partial at a time -> Counts stay exact up to the filter's false-positive rate.
+    def _merge_distinct(self, frame: DataFrame, request: AggregateRequest) -> DistinctFilter:
+        sketch, hashes = f"sketch:{request.alias}", retrieve_aggregate_sketch(request).alias
+        states = frame[sketch].drop_nulls() if sketch in frame.columns else pl.Series(dtype=pl.Binary)
+        partials = frame[hashes].drop_nulls() if hashes in frame.columns else pl.Series(dtype=pl.List(pl.UInt64))
+
+        if len(states) > 1:
+            raise ValueError(f"Aggregate: {request.alias} holds {len(states)} sketches - Only one merged state can be extended!")
+
+        if not len(states) and not len(partials):
+            raise ValueError(f"Aggregate: {request.alias} cannot be merged without key hashes (See 'retrieve_aggregate_sketch')!")
+
+        distinct = DistinctFilter.from_bytes(states[0]) if len(states) else DistinctFilter()
+
+        for keys in partials:
+            distinct.add(keys.to_numpy())
+
+        return distinct
+
+    # Row-level predicates (Column, predicate, value) flagging violating rows -> Empty if not row-addressable.
+    # 'data' is the frame that was handed to 'validate' (e.g. for thresholds derived from fused aggregates).
+    # 'data' is None for single-pass splits -> Predicates must then be self-contained expressions.
+    def _predicates(self, data: DataFrame) -> List[Tuple[str, pl.Expr, Optional[pl.Expr]]]:
+        return []
+
+    # Violation records (Row index, column, value) -> 'lf' carries the 'ROW_INDEX' column.
+    def _violations(self, lf: pl.LazyFrame, data: DataFrame) -> Optional[pl.LazyFrame]:
+        predicates = self._predicates(data)
+
+        if not predicates:
+            return None
+
+        return pl.concat([
+            self._violation_rows(lf, column, predicate, value)
+            for column, predicate, value in predicates
+        ])
+
+    # A single boolean expression per Waypoint -> True for every row violating any of its predicates.
+    def _violation_mask(self, data: DataFrame) -> Optional[pl.Expr]:
+        predicates = self._predicates(data)
+
+        if not predicates:
+            return None
+
+        return pl.any_horizontal([predicate for _, predicate, _ in predicates]).fill_null(False)
+
+    # Shared builder for '_violations' -> One record per row matching 'predicate' in 'column'.
+    def _violation_rows(
+        self,
+        lf: pl.LazyFrame,
+        column: str,
+        predicate: pl.Expr,
+        value: Optional[pl.Expr] = None,
+    ) -> pl.LazyFrame:
+        return lf.filter(predicate).select(
+            pl.col(self.ROW_INDEX).cast(pl.UInt64).alias("row_index"),
+            pl.lit(column, dtype=pl.String).alias("column"),
+            (pl.col(column) if value is None else value).cast(pl.String).alias("value"),
+        )
+
+    # A violation found on a sample (head rows) must also hold for the full input -> Enables fail-fast pre-checks.
+    def _confirms_on_sample(self) -> bool:
+        return False
+
+    # Rows matching '_predicates' may still pass 'validate' (A non-zero tolerance) -> Splits need the verdict first.
+    def _tolerates_violations(self) -> bool:
+        return False
+
+    # Retrieve a single fused aggregate from the (one-row) frame handed to 'validate'.
+    def _value(self, data: DataFrame, kind: str, column: str, parameter: Any = None) -> Any:
+        return data[AggregateRequest(kind, column, parameter).alias].item()
+
     def _assert_built(self) -> bool:
         if not self._built:
             error_str = f"Waypoint-instance is currently not constructed." \
                         "Please call the 'build' method before using it."
             
             self._logger.error(error_str)
-            raise WaypointBuildError(error_str)
+            raise WaypointBuildError(self, error_str)
         
         return True
     
@@ -65,12 +193,13 @@ class BasePoint():
                         "Please create a new instance to modify its configuration."
             
             self._logger.error(error_str)
-            raise WaypointBuildError(error_str)
+            raise WaypointBuildError(self, error_str)
         
         return True
 
     def _key(self) -> Tuple:
-        pass
+        # DEFAULT -> Instance identity; Waypoints override with their configuration to enable deduplication.
+        return (self.__class__.__name__, id(self))
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}>"
@@ -79,7 +208,10 @@ class BasePoint():
         return f"{self.__class__.__name__} instance"
     
     def __eq__(self, other: Any) -> bool:
-        pass
+        if not isinstance(other, BasePoint):
+            return False
+
+        return type(self) is type(other) and self._key() == other._key()
 
     def __hash__(self):
         return hash(self._key())
@@ -2,9 +2,49 @@
 # IMPORTS
 # ---------------------------------------------------------------
 
-from typing import List, Union, Optional, Tuple, Any
-from datetime import datetime, timezone
+from src.waypoints.BasePoint import BasePoint
+from src.typings import AggregateRequest
+
+from polars.dataframe import DataFrame
+from typing import Optional, Tuple, Any, Dict
 
 # ---------------------------------------------------------------
 # CARDINALPOINT CLASS -> EXTENSION OF BASEPOINT
-# ---------------------------------------------------------------
\ No newline at end of file
+# ---------------------------------------------------------------
+
+class CardinalPoint(BasePoint):
+
+    __slots__ = (
+        "bounds",
+    )
+
+    def __init__(
+        self,
+        bounds: Dict[str, Tuple[Optional[int], Optional[int]]],
+        verbosity: int = 0,
+    ):
+        super().__init__(verbosity=verbosity)
+
+        self.bounds = tuple((column, tuple(bound)) for column, bound in bounds.items())
+
+    def validate(self, data: DataFrame) -> Dict[str, Any]:
+        cardinality = {column: self._value(data, "n_unique", column) for column, _ in self.bounds}
+
+        violations = {
+            column: cardinality[column]
+            for column, (lower, upper) in self.bounds
+            if (lower is not None and cardinality[column] < lower)
+            or (upper is not None and cardinality[column] > upper)
+        }
+
+        return {
+            "cardinality": cardinality,
+            "violations": violations,
+            "passed": not violations,
+        }
+
+    def _requests(self) -> Tuple[AggregateRequest, ...]:
+        return tuple(AggregateRequest("n_unique", column) for column, _ in self.bounds)
+
+    def _key(self) -> Tuple:
+        return (self.__class__.__name__, self.bounds)
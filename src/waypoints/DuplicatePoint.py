@@ -2,9 +2,87 @@
 # IMPORTS
 # ---------------------------------------------------------------
 
-from typing import List, Union, Optional, Tuple, Any
-from datetime import datetime, timezone
+import polars as pl
+
+from src.waypoints.BasePoint import BasePoint
+from src.typings import AggregateRequest
+from src.utility import wilson_interval
+
+from polars.dataframe import DataFrame
+from typing import List, Optional, Tuple, Any, Dict
 
 # ---------------------------------------------------------------
 # DUPLICATEPOINT CLASS -> EXTENSION OF BASEPOINT
-# ---------------------------------------------------------------
\ No newline at end of file
+# ---------------------------------------------------------------
+
+class DuplicatePoint(BasePoint):
+
+    __slots__ = (
+        "columns",
+        "max_duplicates",
+    )
+
+    def __init__(
+        self,
+        columns: List[str],
+        max_duplicates: int = 0,
+        verbosity: int = 0,
+    ):
+        super().__init__(verbosity=verbosity)
+
+        if not columns:
+            raise ValueError("DuplicatePoint requires at least one (key) column!")
+
+        self.columns = tuple(columns)
+        self.max_duplicates = max_duplicates
+
+    def validate(self, data: DataFrame) -> Dict[str, Any]:
+        request = self._unique_request()
+        duplicates = self._value(data, "len", "*") - data[request.alias].item()
+
+        return {
+            "duplicates": duplicates,
+            "passed": duplicates <= self.max_duplicates,
+        }
+
+    # A duplicate pair only survives sampling if both rows are drawn -> Scale the observed rate by the fraction.
+    # Observed duplicates are still a lower bound on the input's duplicates.
+    def validate_sample(self, data: DataFrame, rows: int, population: int) -> Dict[str, Any]:
+        sampled = self._value(data, "len", "*")
+        duplicates = sampled - data[self._unique_request().alias].item()
+        fraction = sampled / population if population else 1.0
+        _, upper = wilson_interval(duplicates, sampled, population)
+
+        return {
+            "duplicates": duplicates,
+            "duplicate_rate": min(1.0, duplicates / sampled / fraction) if sampled else 0.0,
+            "duplicate_rate_upper_bound": min(1.0, upper / fraction) if fraction else 1.0,
+            "estimated": True,
+            "passed": duplicates <= self.max_duplicates,
+        }
+
+    def _requests(self) -> Tuple[AggregateRequest, ...]:
+        return (AggregateRequest("len", "*"), self._unique_request())
+
+    # Single-column keys share 'n_unique' with CardinalPoint -> Composite keys count unique row structs.
+    def _unique_request(self) -> AggregateRequest:
+        if len(self.columns) == 1:
+            return AggregateRequest("n_unique", self.columns[0])
+
+        return AggregateRequest("n_unique_rows", "*", self.columns)
+
+    # Every occurrence after the first is a duplicate -> Matches the 'len - n_unique' count reported by 'validate'.
+    def _predicates(self, data: DataFrame) -> List[Tuple[str, pl.Expr, Optional[pl.Expr]]]:
+        key = pl.struct(list(self.columns))
+        value = pl.concat_str([pl.col(column).cast(pl.String) for column in self.columns], separator="|")
+
+        return [(",".join(self.columns), ~key.is_first_distinct(), value)]
+
+    def _confirms_on_sample(self) -> bool:
+        return True     # Duplicates within a subset are duplicates within the input.
+
+    def _tolerates_violations(self) -> bool:
+        return self.max_duplicates > 0
+
+    def _key(self) -> Tuple:
+        return (self.__class__.__name__, self.columns, self.max_duplicates)
@@ -2,9 +2,75 @@
 # IMPORTS
 # ---------------------------------------------------------------
 
-from typing import List, Union, Optional, Tuple, Any
-from datetime import datetime, timezone
+import polars as pl
+
+from src.waypoints.BasePoint import BasePoint
+from src.typings import AggregateRequest
+
+from polars.dataframe import DataFrame
+from typing import List, Optional, Tuple, Any, Dict
 
 # ---------------------------------------------------------------
 # INTERVALPOINT CLASS -> EXTENSION OF BASEPOINT
-# ---------------------------------------------------------------
\ No newline at end of file
+# ---------------------------------------------------------------
+
+class IntervalPoint(BasePoint):
+
+    __slots__ = (
+        "bounds",
+    )
+
+    def __init__(
+        self,
+        bounds: Dict[str, Tuple[Optional[Any], Optional[Any]]],
+        verbosity: int = 0,
+    ):
+        super().__init__(verbosity=verbosity)
+
+        self.bounds = tuple((column, tuple(bound)) for column, bound in bounds.items())
+
+    def validate(self, data: DataFrame) -> Dict[str, Any]:
+        violations = {}
+
+        for column, (lower, upper) in self.bounds:
+            minimum = self._value(data, "min", column)
+            maximum = self._value(data, "max", column)
+
+            if minimum is None:
+                continue    # All-null (Or empty) columns hold no out-of-bounds values.
+
+            if (lower is not None and minimum < lower) or (upper is not None and maximum > upper):
+                violations[column] = {"min": minimum, "max": maximum, "bounds": (lower, upper)}
+
+        return {
+            "violations": violations,
+            "passed": not violations,
+        }
+
+    def _requests(self) -> Tuple[AggregateRequest, ...]:
+        return tuple(
+            AggregateRequest(kind, column)
+            for column, _ in self.bounds
+            for kind in ("min", "max")
+        )
+
+    def _predicates(self, data: DataFrame) -> List[Tuple[str, pl.Expr, Optional[pl.Expr]]]:
+        predicates = []
+
+        for column, (lower, upper) in self.bounds:
+            predicate = pl.lit(False)
+
+            if lower is not None:
+                predicate = predicate | (pl.col(column) < lower)
+            if upper is not None:
+                predicate = predicate | (pl.col(column) > upper)
+
+            predicates.append((column, predicate, None))
+
+        return predicates
+
+    def _confirms_on_sample(self) -> bool:
+        return True     # Sample extremes never exceed the input's extremes.
+
+    def _key(self) -> Tuple:
+        return (self.__class__.__name__, self.bounds)
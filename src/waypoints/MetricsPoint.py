@@ -2,9 +2,53 @@
 # IMPORTS
 # ---------------------------------------------------------------
 
-from typing import List, Union, Optional, Tuple, Any
-from datetime import datetime, timezone
+from src.waypoints.BasePoint import BasePoint
+from src.typings import AggregateRequest
 
+from polars.dataframe import DataFrame
+from typing import List, Tuple, Any, Dict
+
+# ---------------------------------------------------------------
+# METRICSPOINT CLASS -> EXTENSION OF BASEPOINT
 # ---------------------------------------------------------------
-# METRICSPPOINT CLASS -> EXTENSION OF BASEPOINT
-# ---------------------------------------------------------------
\ No newline at end of file
+
+class MetricsPoint(BasePoint):
+
+    __slots__ = (
+        "columns",
+    )
+
+    METRICS = ("null_count", "min", "max")
+
+    def __init__(
+        self,
+        columns: List[str],
+        verbosity: int = 0,
+    ):
+        super().__init__(verbosity=verbosity)
+
+        self.columns = tuple(columns)
+
+    # Profiling-only Waypoint -> Reports metrics but never fails a run.
+    def validate(self, data: DataFrame) -> Dict[str, Any]:
+        return {
+            "rows": self._value(data, "len", "*"),
+            "metrics": {
+                column: {metric: self._value(data, metric, column) for metric in self.METRICS}
+                for column in self.columns
+            },
+            "passed": True,
+        }
+
+    def _requests(self) -> Tuple[AggregateRequest, ...]:
+        return (
+            AggregateRequest("len", "*"),
+            *(
+                AggregateRequest(metric, column)
+                for column in self.columns
+                for metric in self.METRICS
+            ),
+        )
+
+    def _key(self) -> Tuple:
+        return (self.__class__.__name__, self.columns)
@@ -2,9 +2,86 @@
 # IMPORTS
 # ---------------------------------------------------------------
 
-from typing import List, Union, Optional, Tuple, Any
-from datetime import datetime, timezone
+import polars as pl
+
+from src.waypoints.BasePoint import BasePoint
+from src.typings import AggregateRequest
+from src.utility import wilson_interval
+
+from polars.dataframe import DataFrame
+from typing import List, Optional, Tuple, Any, Dict
 
 # ---------------------------------------------------------------
 # NULLPOINT CLASS -> EXTENSION OF BASEPOINT
-# ---------------------------------------------------------------
\ No newline at end of file
+# ---------------------------------------------------------------
+
+class NullPoint(BasePoint):
+
+    __slots__ = (
+        "columns",
+        "max_ratio",
+    )
+
+    def __init__(
+        self,
+        columns: List[str],
+        max_ratio: float = 0.0,
+        verbosity: int = 0,
+    ):
+        super().__init__(verbosity=verbosity)
+
+        if not 0.0 <= max_ratio <= 1.0:
+            raise ValueError(f"Null ratio must be within [0, 1] - Recieved {max_ratio}")
+
+        self.columns = tuple(columns)
+        self.max_ratio = max_ratio
+
+    def validate(self, data: DataFrame) -> Dict[str, Any]:
+        rows = self._value(data, "len", "*")
+        ratios = {
+            column: (self._value(data, "null_count", column) / rows if rows else 0.0)
+            for column in self.columns
+        }
+
+        return {
+            "rows": rows,
+            "null_ratios": ratios,
+            "passed": all(ratio <= self.max_ratio for ratio in ratios.values()),
+        }
+
+    # A column only fails once its whole confidence interval lies above the tolerated ratio.
+    def validate_sample(self, data: DataFrame, rows: int, population: int) -> Dict[str, Any]:
+        sampled = self._value(data, "len", "*")
+        intervals = {
+            column: wilson_interval(self._value(data, "null_count", column), sampled, population)
+            for column in self.columns
+        }
+
+        return {
+            "rows": sampled,
+            "null_ratios": {
+                column: (self._value(data, "null_count", column) / sampled if sampled else 0.0)
+                for column in self.columns
+            },
+            "confidence_intervals": intervals,
+            "estimated": True,
+            "passed": all(lower <= self.max_ratio for lower, _ in intervals.values()),
+        }
+
+    def _requests(self) -> Tuple[AggregateRequest, ...]:
+        return (
+            AggregateRequest("len", "*"),
+            *(AggregateRequest("null_count", column) for column in self.columns),
+        )
+
+    def _predicates(self, data: DataFrame) -> List[Tuple[str, pl.Expr, Optional[pl.Expr]]]:
+        return [(column, pl.col(column).is_null(), None) for column in self.columns]
+
+    def _confirms_on_sample(self) -> bool:
+        return self.max_ratio == 0.0   # Ratios drift with sampling -> Only a zero-tolerance null confirms.
+
+    def _tolerates_violations(self) -> bool:
+        return self.max_ratio > 0.0
+
+    def _key(self) -> Tuple:
+        return (self.__class__.__name__, self.columns, self.max_ratio)
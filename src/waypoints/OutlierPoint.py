@@ -2,9 +2,84 @@
 # IMPORTS
 # ---------------------------------------------------------------
 
-from typing import List, Union, Optional, Tuple, Any
-from datetime import datetime, timezone
+import polars as pl
+
+from src.waypoints.BasePoint import BasePoint
+from src.typings import AggregateRequest
+
+from polars.dataframe import DataFrame
+from typing import List, Optional, Tuple, Any, Dict
 
 # ---------------------------------------------------------------
 # OUTLIERPOINT CLASS -> EXTENSION OF BASEPOINT
-# ---------------------------------------------------------------
\ No newline at end of file
+# ---------------------------------------------------------------
+
+class OutlierPoint(BasePoint):
+
+    __slots__ = (
+        "columns",
+        "threshold",
+    )
+
+    def __init__(
+        self,
+        columns: List[str],
+        threshold: float = 3.0,
+        verbosity: int = 0,
+    ):
+        super().__init__(verbosity=verbosity)
+
+        if threshold <= 0:
+            raise ValueError(f"Z-score threshold must be positive - Recieved {threshold}")
+
+        self.columns = tuple(columns)
+        self.threshold = threshold
+
+    # Extreme values are scored against mean/std -> A column fails if its min or max exceeds the z-score threshold.
+    def validate(self, data: DataFrame) -> Dict[str, Any]:
+        scores = {}
+
+        for column in self.columns:
+            mean = self._value(data, "mean", column)
+            std = self._value(data, "std", column)
+
+            if mean is None or not std:
+                scores[column] = 0.0
+                continue
+
+            extremes = (self._value(data, "min", column), self._value(data, "max", column))
+            scores[column] = max(abs(value - mean) / std for value in extremes)
+
+        return {
+            "max_z_scores": scores,
+            "passed": all(score <= self.threshold for score in scores.values()),
+        }
+
+    def _requests(self) -> Tuple[AggregateRequest, ...]:
+        return tuple(
+            AggregateRequest(kind, column)
+            for column in self.columns
+            for kind in ("min", "max", "mean", "std")
+        )
+
+    # Scores reuse the fused mean/std -> Rows are flagged without recomputing any aggregate.
+    def _predicates(self, data: DataFrame) -> List[Tuple[str, pl.Expr, Optional[pl.Expr]]]:
+        predicates = []
+
+        for column in self.columns:
+            if data is None:
+                # Single pass -> Mean/std are evaluated inside the same query as the row scores.
+                score = (pl.col(column) - pl.col(column).mean()) / pl.col(column).std()
+                predicates.append((column, score.abs() > self.threshold, None))
+                continue
+
+            mean = self._value(data, "mean", column)
+            std = self._value(data, "std", column)
+
+            if mean is not None and std:
+                predicates.append((column, ((pl.col(column) - mean) / std).abs() > self.threshold, None))
+
+        return predicates
+
+    def _key(self) -> Tuple:
+        return (self.__class__.__name__, self.columns, self.threshold)
@@ -2,9 +2,58 @@
 # IMPORTS
 # ---------------------------------------------------------------
 
-from typing import List, Union, Optional, Tuple, Any
-from datetime import datetime, timezone
+import polars as pl
+
+from src.waypoints.BasePoint import BasePoint
+
+from polars.dataframe import DataFrame
+from typing import Tuple, Any, Dict
 
 # ---------------------------------------------------------------
 # SCHEMAPOINT CLASS -> EXTENSION OF BASEPOINT
-# ---------------------------------------------------------------
\ No newline at end of file
+# ---------------------------------------------------------------
+
+class SchemaPoint(BasePoint):
+
+    __slots__ = (
+        "expected",
+        "strict",
+    )
+
+    COST = "metadata"
+
+    def __init__(
+        self,
+        expected: Dict[str, pl.DataType] | pl.Schema,
+        strict: bool = False,
+        verbosity: int = 0,
+    ):
+        super().__init__(verbosity=verbosity)
+
+        self.expected = tuple(pl.Schema(expected).items())
+        self.strict = strict
+
+    def validate(self, data: DataFrame) -> Dict[str, Any]:
+        actual = data.schema
+
+        missing = [column for column, _ in self.expected if column not in actual]
+        mismatched = {
+            column: f"{actual[column]} != {dtype}"
+            for column, dtype in self.expected
+            if column in actual and actual[column] != dtype
+        }
+        unexpected = [column for column in actual if column not in dict(self.expected)] if self.strict else []
+
+        return {
+            "missing": missing,
+            "mismatched": mismatched,
+            "unexpected": unexpected,
+            "passed": not (missing or mismatched or unexpected),
+        }
+
+    # Only the resolved Schema is needed -> An empty frame avoids reading a single row.
+    def _to_plan(self, lf: pl.LazyFrame) -> pl.LazyFrame:
+        return pl.LazyFrame(schema=lf.collect_schema())
+
+    def _key(self) -> Tuple:
+        return (self.__class__.__name__, self.expected, self.strict)
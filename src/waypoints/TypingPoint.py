@@ -2,9 +2,63 @@
 # IMPORTS
 # ---------------------------------------------------------------
 
-from typing import List, Union, Optional, Tuple, Any
-from datetime import datetime, timezone
+import polars as pl
+
+from src.waypoints.BasePoint import BasePoint
+from src.typings import AggregateRequest
+
+from polars.dataframe import DataFrame
+from typing import List, Optional, Tuple, Any, Dict
 
 # ---------------------------------------------------------------
 # TYPINGPOINT CLASS -> EXTENSION OF BASEPOINT
-# ---------------------------------------------------------------
\ No newline at end of file
+# ---------------------------------------------------------------
+
+class TypingPoint(BasePoint):
+
+    __slots__ = (
+        "dtypes",
+    )
+
+    def __init__(
+        self,
+        dtypes: Dict[str, pl.DataType],
+        verbosity: int = 0,
+    ):
+        super().__init__(verbosity=verbosity)
+
+        self.dtypes = tuple(dtypes.items())
+
+    # Values failing a (non-strict) cast turn into nulls -> Any nulls beyond the original ones are invalid.
+    def validate(self, data: DataFrame) -> Dict[str, Any]:
+        invalid = {
+            column: self._value(data, "cast_null_count", column, dtype) - self._value(data, "null_count", column)
+            for column, dtype in self.dtypes
+        }
+
+        return {
+            "invalid_values": invalid,
+            "passed": not any(invalid.values()),
+        }
+
+    def _requests(self) -> Tuple[AggregateRequest, ...]:
+        return tuple(
+            request
+            for column, dtype in self.dtypes
+            for request in (
+                AggregateRequest("null_count", column),
+                AggregateRequest("cast_null_count", column, dtype),
+            )
+        )
+
+    def _predicates(self, data: DataFrame) -> List[Tuple[str, pl.Expr, Optional[pl.Expr]]]:
+        return [
+            (column, pl.col(column).is_not_null() & pl.col(column).cast(dtype, strict=False).is_null(), None)
+            for column, dtype in self.dtypes
+        ]
+
+    def _confirms_on_sample(self) -> bool:
+        return True     # An uncastable value in the sample is an uncastable value in the input.
+
+    def _key(self) -> Tuple:
+        return (self.__class__.__name__, self.dtypes)
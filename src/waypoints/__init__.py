@@ -2,12 +2,48 @@
 # IMPORTS
 # ---------------------------------------------------------------
 
+from src.utility.lazy_loader import lazy_package
+
+from typing import TYPE_CHECKING
+
+# Type checkers see the eager imports -> At runtime each export is imported on first access.
+if TYPE_CHECKING:
+    from src.waypoints.BasePoint import BasePoint
+    from src.waypoints.NullPoint import NullPoint
+    from src.waypoints.MetricsPoint import MetricsPoint
+    from src.waypoints.TypingPoint import TypingPoint
+    from src.waypoints.IntervalPoint import IntervalPoint
+    from src.waypoints.OutlierPoint import OutlierPoint
+    from src.waypoints.CardinalPoint import CardinalPoint
+    from src.waypoints.DuplicatePoint import DuplicatePoint
+    from src.waypoints.SchemaPoint import SchemaPoint
+
 # ---------------------------------------------------------------
 # PACKAGE MANAGEMENT
 # ---------------------------------------------------------------
 
 __all__ = [
-
+    "BasePoint",
+    "NullPoint",
+    "MetricsPoint",
+    "TypingPoint",
+    "IntervalPoint",
+    "OutlierPoint",
+    "CardinalPoint",
+    "DuplicatePoint",
+    "SchemaPoint",
 ]
+
+lazy_package(__name__, {
+    "BasePoint": "src.waypoints.BasePoint",
+    "NullPoint": "src.waypoints.NullPoint",
+    "MetricsPoint": "src.waypoints.MetricsPoint",
+    "TypingPoint": "src.waypoints.TypingPoint",
+    "IntervalPoint": "src.waypoints.IntervalPoint",
+    "OutlierPoint": "src.waypoints.OutlierPoint",
+    "CardinalPoint": "src.waypoints.CardinalPoint",
+    "DuplicatePoint": "src.waypoints.DuplicatePoint",
+    "SchemaPoint": "src.waypoints.SchemaPoint",
+})
 __version__ = "0.0.1"
-__author__ = "HysingerDev"
\ No newline at end of file
+__author__ = "HysingerDev"
@@ -0,0 +1,54 @@
+import asyncio
+import threading
+import time
+
+import polars as pl
+import pytest
+
+from src.pipeline import AsyncConduit
+from src.reader import ParquetReader
+from src.waypoints import NullPoint
+from src.errors import ConduitTimeoutError
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    paths = []
+
+    for index in range(3):
+        path = tmp_path / f"part-{index}.parquet"
+        pl.DataFrame({"a": [index, None]}).write_parquet(path)
+        paths.append(str(path))
+
+    return paths
+
+
+def test_timed_out_queries_hold_their_slot_until_the_thread_finishes(inputs, monkeypatch):
+    lock = threading.Lock()
+    running, peak = [0], [0]
+    collect = AsyncConduit._collect
+
+    def slow(self, input, *args):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        try:
+            time.sleep(0.2 if input == inputs[0] else 0.0)
+            return collect(self, input, *args)
+        finally:
+            with lock:
+                running[0] -= 1
+
+    monkeypatch.setattr(AsyncConduit, "_collect", slow)
+
+    conduit = AsyncConduit(
+        reader=ParquetReader(infer_schema=True), waypoints=[NullPoint(columns=["a"], max_ratio=0.5)],
+        verbosity=0, concurrency=1, timeout=0.05,
+    )
+    conduit.build(input=inputs[0])
+
+    results = asyncio.run(conduit.execute_many(inputs, return_exceptions=True))
+
+    assert isinstance(results[0], ConduitTimeoutError)
+    assert all(result.passed for result in results[1:])
+    assert peak[0] == 1
@@ -0,0 +1,124 @@
+import polars as pl
+import pytest
+
+from concurrent.futures import ThreadPoolExecutor
+
+from src.pipeline import Conduit
+from src.reader import ParquetReader
+from src.storage import ConduitStore
+from src.waypoints import NullPoint, DuplicatePoint
+from src.errors import ConduitExecutionError
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    paths = []
+
+    for index, frame in enumerate([
+        pl.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]}),
+        pl.DataFrame({"a": [1, 1, 2], "b": ["x", None, "z"]}),
+    ]):
+        path = tmp_path / f"part-{index}.parquet"
+        frame.write_parquet(path)
+        paths.append(str(path))
+
+    return paths
+
+
+def definition(waypoints, **options):
+    return lambda: Conduit(reader=ParquetReader(infer_schema=True), waypoints=waypoints, verbosity=0, **options)
+
+
+def test_execute_batch_builds_inferred_schemas_from_the_first_input(inputs):
+    store = ConduitStore({
+        "nulls": definition([NullPoint(columns=["b"])], severity="error"),
+        "keys": definition([DuplicatePoint(columns=["a"])], severity="error"),
+    })
+
+    results = store.execute_batch(["nulls", "keys"], inputs)
+
+    assert [result.passed for result in results["nulls"]] == [True, False]
+    assert [result.passed for result in results["keys"]] == [True, False]
+
+
+def test_execute_batch_wraps_unreadable_inputs(inputs, tmp_path):
+    store = ConduitStore({"nulls": definition([NullPoint(columns=["b"])])})
+    missing = str(tmp_path / "missing.parquet")
+
+    with pytest.raises(ConduitExecutionError):
+        store.execute_batch(["nulls"], [missing, *inputs])
+
+    results = store.execute_batch(["nulls"], [missing, *inputs], return_exceptions=True)
+
+    assert all(isinstance(result, ConduitExecutionError) for result in results["nulls"])
+
+
+def test_execute_batch_rejects_unknown_conduits(inputs):
+    with pytest.raises(KeyError):
+        ConduitStore().execute_batch(["unknown"], inputs)
+
+
+def test_snapshot_restore_skips_schema_resolution(inputs, tmp_path, monkeypatch):
+    store = ConduitStore({"nulls": definition([NullPoint(columns=["b"])])})
+    store.retrieve("nulls", inputs[0])
+    assert store.save_snapshot(tmp_path / "snapshot") == 1
+
+    resolved = []
+    original = ParquetReader._resolve_schema
+    monkeypatch.setattr(ParquetReader, "_resolve_schema", lambda self, input: resolved.append(input) or original(self, input))
+
+    warm = ConduitStore({"nulls": definition([NullPoint(columns=["b"])])})
+
+    assert warm.load_snapshot(tmp_path / "snapshot") == 1
+    assert resolved == []
+    assert warm.retrieve("nulls").execute(inputs[0]).passed
+
+
+@pytest.mark.parametrize("changed", [
+    {"engine": "streaming", "memory_budget": 1_000},
+    {"severity": "error"},
+    {"sampling": 0.5},
+])
+def test_snapshot_is_ignored_when_the_definition_changes(inputs, tmp_path, changed):
+    store = ConduitStore({"nulls": definition([NullPoint(columns=["b"])])})
+    store.retrieve("nulls", inputs[0])
+    store.save_snapshot(tmp_path / "snapshot")
+
+    assert ConduitStore({"nulls": definition([NullPoint(columns=["b"])], **changed)}).load_snapshot(tmp_path / "snapshot") == 0
+
+
+def test_snapshot_is_ignored_when_the_build_input_changes(inputs, tmp_path):
+    store = ConduitStore({"nulls": definition([NullPoint(columns=["b"])])})
+    store.retrieve("nulls", inputs[0])
+    store.save_snapshot(tmp_path / "snapshot")
+
+    pl.DataFrame({"a": [1], "b": [1.5], "c": [True]}).write_parquet(inputs[0])
+
+    assert ConduitStore({"nulls": definition([NullPoint(columns=["b"])])}).load_snapshot(tmp_path / "snapshot") == 0
+
+
+def test_clear_forgets_build_inputs(inputs, tmp_path):
+    store = ConduitStore({"nulls": definition([NullPoint(columns=["b"])])})
+    store.retrieve("nulls", inputs[0])
+    store.clear()
+
+    assert store.conduits == []
+    assert store.save_snapshot(tmp_path / "snapshot") == 0
+
+    store.retrieve("nulls", inputs[1])
+    store.save_snapshot(tmp_path / "snapshot")
+
+    # Recorded against the input of the latest build -> Rewriting the first input no longer matters.
+    pl.DataFrame({"z": [0]}).write_parquet(inputs[0])
+    assert ConduitStore({"nulls": definition([NullPoint(columns=["b"])])}).load_snapshot(tmp_path / "snapshot") == 1
+
+
+def test_concurrent_retrievals_share_one_build(inputs):
+    built = []
+    store = ConduitStore({"nulls": lambda: built.append(1) or definition([NullPoint(columns=["b"])])()})
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        conduits = list(executor.map(lambda _: store.retrieve("nulls", inputs[0]), range(16)))
+
+    assert len(built) == 1
+    assert all(conduit is conduits[0] for conduit in conduits)
@@ -0,0 +1,23 @@
+import polars as pl
+import pytest
+
+from importlib import import_module
+
+from src.factory import SyntheticFactory
+from src.errors import FactoryConfigError
+
+
+def test_excel_output_without_xlsxwriter_raises_a_clear_error(tmp_path, monkeypatch):
+    monkeypatch.setattr(import_module("src.factory.BaseFactory"), "find_spec", lambda name: None)
+    factory = SyntheticFactory(schema={"a": pl.Int64}, rows=10)
+
+    with pytest.raises(FactoryConfigError, match="xlsxwriter"):
+        factory.write(tmp_path / "synthetic.xlsx")
+
+    assert not (tmp_path / "synthetic.xlsx").exists()
+
+
+def test_columnar_output_needs_no_excel_writer(tmp_path):
+    path = SyntheticFactory(schema={"a": pl.Int64}, rows=10).write(tmp_path / "synthetic.parquet")
+
+    assert pl.read_parquet(path).height == 10
@@ -0,0 +1,48 @@
+import polars as pl
+import pytest
+
+from src.pipeline import Conduit
+from src.reader import ParquetReader
+from src.waypoints import NullPoint, SchemaPoint
+
+
+@pytest.fixture
+def late_nulls(tmp_path):
+    # Nulls in 'a' within the 10k-row head, nulls in 'b' only far beyond it.
+    path = tmp_path / "late_nulls.parquet"
+    rows = 30_000
+    pl.DataFrame({
+        "a": [None if index < 100 else index for index in range(rows)],
+        "b": [None if index >= 20_000 and index % 3 == 0 else "x" for index in range(rows)],
+    }).write_parquet(path)
+    return str(path)
+
+
+def run(path, waypoints, **options):
+    conduit = Conduit(reader=ParquetReader(infer_schema=True), waypoints=waypoints, verbosity=0, **options)
+    conduit.build(input=path)
+    return conduit.execute(path)
+
+
+def test_sample_abort_skips_waypoints_that_passed_on_the_head(late_nulls):
+    result = run(late_nulls, [NullPoint(columns=["a"]), NullPoint(columns=["b"])])
+
+    assert result.metadata["aborted"] == "sample"
+    assert result.waypoints[0]["passed"] is False
+    assert result.waypoints[1]["passed"] is None
+    assert result.waypoints[1]["skipped"] and "sample" in result.waypoints[1]["reason"]
+
+
+def test_sample_abort_keeps_full_input_stage_results(late_nulls):
+    schema = {"a": pl.Int64, "b": pl.String}
+    result = run(late_nulls, [SchemaPoint(expected=schema), NullPoint(columns=["a"])])
+
+    assert result.metadata["aborted"] == "sample"
+    assert result.waypoints[0]["passed"] is True
+
+
+def test_unstaged_run_reports_every_waypoint(late_nulls):
+    result = run(late_nulls, [NullPoint(columns=["a"]), NullPoint(columns=["b"])], severity="error")
+
+    assert result.metadata["aborted"] is None
+    assert [report["passed"] for report in result.waypoints] == [False, False]
@@ -0,0 +1,95 @@
+import polars as pl
+import pytest
+
+from src.pipeline import IncrementalConduit
+from src.reader import CSVReader
+from src.waypoints import CardinalPoint, DuplicatePoint
+from src.utility import frame_from_ipc
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "events.csv"
+    path.write_text("a,b\n1,x\n2,y\n3,z\n")
+
+    return path
+
+
+def incremental(tmp_path):
+    conduit = IncrementalConduit(
+        reader=CSVReader(schema={"a": pl.Int64, "b": pl.String}),
+        waypoints=[DuplicatePoint(columns=["a"]), DuplicatePoint(columns=["a", "b"]), CardinalPoint(bounds={"b": (None, 4)})],
+        severity="error",
+        verbosity=0,
+        state_dir=tmp_path / "state",
+    )
+    conduit.build()
+
+    return conduit
+
+
+def test_appended_duplicates_are_detected_against_the_stored_sketch(source, tmp_path):
+    assert incremental(tmp_path).execute(source).passed
+
+    with open(source, "a") as file:
+        file.write("4,w\n2,q\n")
+
+    # A fresh instance -> Only the stored states describe the first three rows.
+    result = incremental(tmp_path).execute(source)
+
+    assert result.metadata["incremental"]["delta_bytes"] == len("4,w\n2,q\n")
+    assert [report["duplicates"] for report in result.waypoints[:2]] == [1, 0]
+    assert result.waypoints[2]["cardinality"] == {"b": 5}
+    assert not result.passed
+
+
+def test_states_hold_serialized_sketches(source, tmp_path):
+    conduit = incremental(tmp_path)
+    conduit.execute(source)
+
+    state = frame_from_ipc(conduit.store.retrieve(str(source)).states[0])
+
+    assert state["n_unique:a"].item() == 3
+    assert state["sketch:n_unique:a"].dtype == pl.Binary
+    assert not any(column.startswith("key_hashes") for column in state.columns)
+
+
+def test_first_run_scans_the_file_and_later_runs_buffer_the_delta(source, tmp_path, monkeypatch):
+    sources = []
+    collect = IncrementalConduit._collect
+
+    def recording(self, input, *args):
+        sources.append(input)
+        return collect(self, input, *args)
+
+    monkeypatch.setattr(IncrementalConduit, "_collect", recording)
+    conduit = incremental(tmp_path)
+
+    first = conduit.execute(source)
+
+    with open(source, "a") as file:
+        file.write("4,w\n")
+
+    second = conduit.execute(source)
+
+    assert sources[0] == str(source) and sources[1].getvalue() == b"a,b\n4,w\n"
+    assert first.metadata["incremental"]["delta_bytes"] == len("1,x\n2,y\n3,z\n")
+    assert second.metadata["incremental"]["delta_bytes"] == len("4,w\n")
+
+
+def test_partial_trailing_record_waits_for_the_next_run(source, tmp_path):
+    with open(source, "a") as file:
+        file.write("4,")
+
+    conduit = incremental(tmp_path)
+    first = conduit.execute(source)
+
+    with open(source, "a") as file:
+        file.write("w\n1,v\n")
+
+    second = conduit.execute(source)
+
+    assert first.metadata["incremental"]["offset"] == len("a,b\n1,x\n2,y\n3,z\n")
+    assert first.waypoints[2]["cardinality"] == {"b": 3}
+    assert second.waypoints[0]["duplicates"] == 1
+    assert second.waypoints[2]["cardinality"] == {"b": 5}
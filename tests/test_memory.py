@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from importlib import import_module
+
+from src.telemetry import MemoryLedger
+from src.utility import reset_peak_rss
+
+
+def test_stage_peaks_are_reset_between_stages():
+    if not reset_peak_rss():
+        pytest.skip("The high-water mark cannot be reset on this platform.")
+
+    ledger = MemoryLedger()
+
+    ledger.begin()
+    allocation = np.ones(64 * 1024 * 1024, dtype=np.uint8)
+    del allocation
+    ledger.end("scan", {})
+
+    ledger.begin()
+    ledger.end("full", {})
+
+    scan, full = ledger.stages
+
+    assert scan["peak_growth"] >= 60 * 1024 * 1024
+    assert full["peak_growth"] < 16 * 1024 * 1024
+    assert full["peak_rss"] < scan["peak_rss"] == ledger.to_dict()["peak_rss"]
+
+
+def test_peaks_are_unknown_without_a_reset(monkeypatch):
+    monkeypatch.setattr(import_module("src.telemetry.MemoryLedger"), "reset_peak_rss", lambda: False)
+
+    ledger = MemoryLedger()
+    ledger.begin()
+    ledger.end("scan", {})
+
+    assert ledger.stages[0]["peak_rss"] is None and ledger.stages[0]["peak_growth"] is None
+    assert ledger.to_dict()["peak_rss"] is None
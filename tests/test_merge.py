@@ -0,0 +1,85 @@
+import polars as pl
+import pytest
+
+from src.pipeline import Conduit, ProcessConduit
+from src.reader import ParquetReader
+from src.waypoints import CardinalPoint, DuplicatePoint, NullPoint
+from src.utility import DistinctFilter, retrieve_aggregate_sketch
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    paths = []
+
+    # Keys repeat across files only -> Every file is duplicate-free on its own.
+    for index, frame in enumerate([
+        pl.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]}),
+        pl.DataFrame({"a": [3, 4, 5], "b": ["z", "y", None]}),
+        pl.DataFrame({"a": [6, 7, 1], "b": ["w", "v", "x"]}),
+    ]):
+        path = tmp_path / f"part-{index}.parquet"
+        frame.write_parquet(path)
+        paths.append(str(path))
+
+    return paths
+
+
+def waypoints():
+    return [
+        DuplicatePoint(columns=["a"]),
+        DuplicatePoint(columns=["a", "b"], max_duplicates=1),
+        CardinalPoint(bounds={"a": (None, 6), "b": (5, None)}),
+        NullPoint(columns=["b"]),
+    ]
+
+
+def test_merged_distinct_counts_match_a_single_pass(inputs, tmp_path):
+    combined = tmp_path / "combined.parquet"
+    pl.concat([pl.read_parquet(path) for path in inputs]).write_parquet(combined)
+
+    conduit = Conduit(reader=ParquetReader(infer_schema=True), waypoints=waypoints(), severity="error", verbosity=0)
+    conduit.build(input=str(combined))
+    expected = conduit.execute(str(combined))
+
+    with ProcessConduit(
+        reader=ParquetReader(infer_schema=True), waypoints=waypoints(), severity="error", verbosity=0,
+        max_workers=2, chunksize=1,
+    ) as merging:
+        merging.build(input=inputs[0])
+        merged = merging.execute_merged(inputs)
+
+    assert [report["passed"] for report in merged.waypoints] == [report["passed"] for report in expected.waypoints]
+    assert merged.waypoints[0]["duplicates"] == expected.waypoints[0]["duplicates"] == 2
+    assert merged.waypoints[1]["duplicates"] == expected.waypoints[1]["duplicates"] == 2
+    assert merged.waypoints[2]["cardinality"] == expected.waypoints[2]["cardinality"] == {"a": 7, "b": 6}
+
+
+def test_merge_extends_a_stored_sketch():
+    waypoint = DuplicatePoint(columns=["a"])
+    unique = waypoint._requests()[1]
+
+    def partial(keys):
+        return pl.DataFrame({"a": keys}).select(
+            pl.len().alias("len:*"),
+            pl.struct(["a"]).hash(seed=0).unique().implode().alias(retrieve_aggregate_sketch(unique).alias),
+        )
+
+    state = waypoint._merge([partial([1, 2]), partial([2, 3])])
+    extended = waypoint._merge([state, partial([3, 4])])
+
+    assert state[unique.alias].item() == 3 and state[f"sketch:{unique.alias}"].dtype == pl.Binary
+    assert extended["len:*"].item() == 6 and extended[unique.alias].item() == 4
+    assert waypoint.validate(extended)["duplicates"] == 2
+
+    with pytest.raises(ValueError):
+        waypoint._merge([state, state])
+
+
+def test_distinct_filter_round_trips_through_bytes():
+    distinct = DistinctFilter(capacity=1_000)
+    distinct.add(pl.Series(range(100), dtype=pl.UInt64).to_numpy())
+
+    restored = DistinctFilter.from_bytes(distinct.to_bytes())
+
+    assert restored.count == 100 and restored.capacity == 1_000
+    assert restored.add(pl.Series(range(50, 150), dtype=pl.UInt64).to_numpy()) == 50
@@ -0,0 +1,62 @@
+import polars as pl
+import pytest
+
+from src.pipeline import Conduit
+from src.reader import ParquetReader
+from src.waypoints import NullPoint
+from src.utility.sampling import wilson_interval, block_sample
+
+
+@pytest.fixture
+def null_free(tmp_path):
+    path = tmp_path / "null_free.parquet"
+    pl.DataFrame({"a": range(5_000), "b": ["x"] * 5_000}).write_parquet(path)
+    return str(path)
+
+
+def test_wilson_interval_is_exact_at_the_edges():
+    assert wilson_interval(0, 500)[0] == 0.0
+    assert wilson_interval(500, 500)[1] == 1.0
+    assert wilson_interval(0, 500, population=5_000)[0] == 0.0
+    assert wilson_interval(500, 500, population=5_000)[1] == 1.0
+
+
+def test_wilson_interval_correction_keeps_the_observed_ratio_inside():
+    lower, upper = wilson_interval(50, 500, population=5_000)
+    wide_lower, wide_upper = wilson_interval(50, 500)
+
+    assert lower <= 0.1 <= upper
+    assert wide_lower <= lower and upper <= wide_upper
+    assert wilson_interval(50, 500, population=500) == pytest.approx((0.1, 0.1))
+
+
+@pytest.mark.parametrize("options", [
+    {"sampling": 0.1},
+    {"sampling": 0.5},
+    {"sampling": 500},
+    {"memory_budget": 1_000, "memory_policy": "sample"},
+])
+def test_null_free_sample_passes_at_zero_tolerance(null_free, options):
+    conduit = Conduit(reader=ParquetReader(infer_schema=True), waypoints=[NullPoint(columns=["b"])], verbosity=0, **options)
+    conduit.build(input=null_free)
+
+    result = conduit.execute(null_free)
+
+    assert result.passed
+    assert result.waypoints[0]["confidence_intervals"]["b"][0] == 0.0
+
+
+@pytest.mark.parametrize("rows", [1, 100, 65_536, 70_000])
+def test_block_sample_reads_no_more_than_the_requested_rows(rows):
+    lf = pl.LazyFrame({"a": range(200_000)})
+
+    sample = block_sample(lf, rows, 200_000, seed=7).collect()
+
+    assert sample.height == rows
+    assert sample["a"].n_unique() == rows
+
+
+def test_block_sample_is_reproducible():
+    lf = pl.LazyFrame({"a": range(200_000)})
+
+    assert block_sample(lf, 1_000, 200_000, seed=3).collect().equals(block_sample(lf, 1_000, 200_000, seed=3).collect())
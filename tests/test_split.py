@@ -0,0 +1,72 @@
+import polars as pl
+import pytest
+
+from polars.io.plugins import register_io_source
+
+from src.pipeline import Conduit
+from src.reader import ParquetReader
+from src.sink import MemorySink
+from src.waypoints import NullPoint, DuplicatePoint, IntervalPoint
+
+
+class CountingReader(ParquetReader):
+    # Every scan of the input passes through the IO source -> Counts how often split reads it.
+
+    __slots__ = ()
+
+    scans = []
+
+    def _to_lazyframe(self, input):
+        def source(with_columns, predicate, n_rows, batch_size):
+            CountingReader.scans.append(input)
+            yield pl.read_parquet(input)
+
+        return register_io_source(source, schema=pl.read_parquet_schema(input))
+
+
+@pytest.fixture
+def frame(tmp_path):
+    path = tmp_path / "rows.parquet"
+    pl.DataFrame({
+        "a": [1, 2, 2, 4, 50, 6, 7, 8, 9, 10],
+        "b": ["x", None, "y", "z", "x", "y", "z", "x", "y", "z"],
+    }).write_parquet(path)
+    CountingReader.scans.clear()
+    return str(path)
+
+
+def split(path, waypoints):
+    conduit = Conduit(reader=CountingReader(infer_schema=True), waypoints=waypoints, verbosity=0)
+    conduit.build(input=path)
+    valid, quarantine = MemorySink(), MemorySink()
+    CountingReader.scans.clear()
+
+    result = conduit.split(path, valid, quarantine)
+
+    return result, valid.frame, quarantine.frame
+
+
+def test_zero_tolerance_split_scans_once(frame):
+    result, valid, quarantine = split(frame, [NullPoint(columns=["b"]), IntervalPoint({"a": (0, 10)})])
+
+    assert len(CountingReader.scans) == 1
+    assert not result.passed
+    assert result.metadata["split"]["quarantined"] == 2
+    assert valid.height + quarantine.height == 10
+    assert set(quarantine["a"]) == {2, 50}
+
+
+def test_passing_tolerant_waypoints_never_quarantine(frame):
+    result, valid, quarantine = split(frame, [NullPoint(columns=["b"], max_ratio=0.2), DuplicatePoint(columns=["a"], max_duplicates=1)])
+
+    assert result.passed
+    assert quarantine.height == 0
+    assert valid.height == 10
+
+
+def test_failing_tolerant_waypoints_still_quarantine(frame):
+    result, _, quarantine = split(frame, [NullPoint(columns=["b"], max_ratio=0.05), IntervalPoint({"a": (0, 10)})])
+
+    assert not result.passed
+    assert len(CountingReader.scans) == 2
+    assert sorted(quarantine["a"]) == [2, 50]
@@ -0,0 +1,60 @@
+import polars as pl
+import pytest
+
+from src.pipeline import Conduit
+from src.reader import ParquetReader
+from src.product import ViolationWriter
+from src.waypoints import DuplicatePoint, NullPoint
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "input.parquet"
+    pl.DataFrame({"a": [1, 2, 2, 4], "b": ["x", None, "y", None]}).write_parquet(path)
+
+    return str(path)
+
+
+def run(source, tmp_path, monkeypatch, waypoints):
+    scans = []
+    execute = ParquetReader.execute
+
+    def counting(self, input):
+        scans.append(input)
+        return execute(self, input)
+
+    conduit = Conduit(
+        reader=ParquetReader(infer_schema=True), waypoints=waypoints, severity="error", verbosity=0,
+        violations=ViolationWriter(tmp_path / "violations"),
+    )
+    conduit.build(input=source)
+
+    monkeypatch.setattr(ParquetReader, "execute", counting)
+    result = conduit.execute(source)
+
+    return result, len(scans)
+
+
+def test_violations_stream_out_with_the_validation_scan(source, tmp_path, monkeypatch):
+    result, scans = run(source, tmp_path, monkeypatch, [NullPoint(columns=["b"]), DuplicatePoint(columns=["a"])])
+    records = pl.read_parquet(result.metadata["violations"]["path"]).sort("waypoint", "row_index")
+
+    assert scans == 1 and not result.passed
+    assert records.select("waypoint", "row_index").rows() == [("DuplicatePoint", 2), ("NullPoint", 1), ("NullPoint", 3)]
+
+
+def test_passing_runs_leave_no_staged_records(source, tmp_path, monkeypatch):
+    result, scans = run(source, tmp_path, monkeypatch, [NullPoint(columns=["a"]), DuplicatePoint(columns=["b"], max_duplicates=2)])
+
+    assert scans == 1 and result.passed
+    assert "violations" not in result.metadata
+    assert not list((tmp_path / "violations").iterdir())
+
+
+def test_failing_tolerant_waypoints_are_written_after_the_verdict(source, tmp_path, monkeypatch):
+    result, scans = run(source, tmp_path, monkeypatch, [NullPoint(columns=["b"], max_ratio=0.25), NullPoint(columns=["a"])])
+    records = pl.read_parquet(result.metadata["violations"]["path"])
+
+    assert scans == 2 and not result.passed
+    assert sorted(records["row_index"].to_list()) == [1, 3]
+    assert len(list((tmp_path / "violations").iterdir())) == 1